@@ -1,15 +1,51 @@
 import aiohttp
 import logging
 import asyncio
-from datetime import datetime, timezone
-from typing import List, Dict, Optional
-from .sports_mappings import is_womens_league, get_team_abbreviation, format_clean_date, format_clean_date_time
+import sys
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+from .sports_mappings import (
+    SPORT_EMOJIS, is_womens_league, get_team_abbreviation, format_clean_date, format_clean_date_time,
+    parse_utc_timestamp, ParsedGame, SORT_HALFTIME, SORT_LIVE, SORT_DATED, SORT_OTHER, SORT_FINAL, SORT_TBD
+)
+
+# ESPN status names grouped by how they are displayed
+LIVE_STATUSES = frozenset({'STATUS_IN_PROGRESS', 'STATUS_FIRST_HALF', 'STATUS_SECOND_HALF', 'STATUS_END_PERIOD'})
+FINAL_STATUSES = frozenset({'STATUS_FINAL', 'STATUS_FULL_TIME', 'STATUS_FINAL_PEN', 'STATUS_POSTPONED'})
+
+# Shared read-only default for missing nested objects (avoids a fresh {} per lookup)
+_EMPTY: Dict = {}
+
+
+@lru_cache(maxsize=8)
+def _local_day_bounds(day: date) -> Tuple[float, float]:
+    """Epoch seconds [start, end) of a calendar day in the system's local timezone"""
+    start = datetime.combine(day, time.min).timestamp()
+    end = datetime.combine(day + timedelta(days=1), time.min).timestamp()
+    return start, end
+
 
 class ESPNClient:
     """Client for ESPN API using aiohttp for asynchronous requests"""
     
     BASE_URL = "http://site.api.espn.com/apis/site/v2/sports"
     
+    # Sort keys for games without a usable start time: in-progress games sort
+    # first, finished/other/TBD games sort last
+    _HALFTIME_TIMESTAMP = -2
+    _LIVE_TIMESTAMP = -1
+    _OTHER_TIMESTAMP = 9999999997
+    _FINAL_TIMESTAMP = 9999999998
+    _TBD_TIMESTAMP = 9999999999
+    _SORT_PRIORITIES = {
+        _HALFTIME_TIMESTAMP: SORT_HALFTIME,
+        _LIVE_TIMESTAMP: SORT_LIVE,
+        _OTHER_TIMESTAMP: SORT_OTHER,
+        _FINAL_TIMESTAMP: SORT_FINAL,
+        _TBD_TIMESTAMP: SORT_TBD,
+    }
+
     def __init__(self, logger: Optional[logging.Logger] = None, timeout: int = 10, session: Optional[aiohttp.ClientSession] = None):
         """Initialize the ESPN API client.
 
@@ -21,6 +57,8 @@ class ESPNClient:
         self.logger = logger or logging.getLogger(__name__)
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.session = session
+        # Per-sport status dispatch tables, see _status_handlers_for()
+        self._sport_status_handlers: Dict[str, Dict] = {}
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create an aiohttp session"""
@@ -28,7 +66,7 @@ class ESPNClient:
             self.session = aiohttp.ClientSession(timeout=self.timeout)
         return self.session
 
-    async def fetch_scoreboard(self, sport: str, league: str) -> List[Dict]:
+    async def fetch_scoreboard(self, sport: str, league: str) -> List[ParsedGame]:
         """Fetch and parse scoreboard data for a league"""
         url = f"{self.BASE_URL}/{sport}/{league}/scoreboard"
         try:
@@ -39,8 +77,9 @@ class ESPNClient:
                 events = data.get('events', [])
                 
                 parsed_events = []
+                today = datetime.now().date()
                 for event in events:
-                    parsed = self.parse_league_game_event(event, sport, league)
+                    parsed = self.parse_league_game_event(event, sport, league, today=today)
                     if parsed:
                         parsed_events.append(parsed)
                 return parsed_events
@@ -48,7 +87,7 @@ class ESPNClient:
             self.logger.error(f"ESPN fetch_scoreboard error for {sport}/{league}: {e}")
             return []
 
-    async def fetch_team_schedule(self, sport: str, league: str, team_id: str) -> List[Dict]:
+    async def fetch_team_schedule(self, sport: str, league: str, team_id: str) -> List[ParsedGame]:
         """Fetch and parse schedule data for a team
 
         For soccer teams, if the team schedule has no upcoming games, we fall back
@@ -63,17 +102,17 @@ class ESPNClient:
                 events = data.get('events', [])
 
                 parsed_events = []
+                today = datetime.now().date()
                 for event in events:
-                    parsed = self.parse_game_event_with_timestamp(event, team_id, sport, league)
+                    parsed = self.parse_game_event_with_timestamp(event, team_id, sport, league, today=today)
                     if parsed:
                         parsed_events.append(parsed)
 
                 # For soccer, if no upcoming games found, check league scoreboard
                 if sport == 'soccer':
-                    from datetime import datetime, timezone
                     now = datetime.now(timezone.utc).timestamp()
                     has_upcoming = any(
-                        g.get('event_timestamp', 0) > now for g in parsed_events
+                        g.event_timestamp is not None and g.event_timestamp > now for g in parsed_events
                     )
 
                     if not has_upcoming:
@@ -87,7 +126,7 @@ class ESPNClient:
             self.logger.error(f"ESPN fetch_team_schedule error for {team_id}: {e}")
             return []
 
-    async def _find_team_in_scoreboard(self, sport: str, league: str, team_id: str) -> List[Dict]:
+    async def _find_team_in_scoreboard(self, sport: str, league: str, team_id: str) -> List[ParsedGame]:
         """Find games for a specific team in the league scoreboard"""
         url = f"{self.BASE_URL}/{sport}/{league}/scoreboard"
         try:
@@ -98,6 +137,8 @@ class ESPNClient:
                 events = data.get('events', [])
 
                 team_games = []
+                today = datetime.now().date()
+                team_id_str = str(team_id)
                 for event in events:
                     # Check if this team is in this event
                     competitions = event.get('competitions', [])
@@ -108,14 +149,9 @@ class ESPNClient:
                     competitors = competition.get('competitors', [])
 
                     # Check if our team is in this game
-                    team_in_game = False
-                    for competitor in competitors:
-                        if str(competitor.get('team', {}).get('id', '')) == str(team_id):
-                            team_in_game = True
-                            break
-
-                    if team_in_game:
-                        parsed = self.parse_game_event_with_timestamp(event, team_id, sport, league)
+                    if any(str((competitor.get('team') or _EMPTY).get('id', '')) == team_id_str
+                           for competitor in competitors):
+                        parsed = self.parse_game_event_with_timestamp(event, team_id, sport, league, today=today)
                         if parsed:
                             team_games.append(parsed)
 
@@ -155,6 +191,9 @@ class ESPNClient:
     def extract_score(self, competitor: Dict) -> str:
         """Extract score value from competitor data"""
         score = competitor.get('score', '0')
+        # Scoreboard events carry plain strings; check that case first
+        if isinstance(score, str):
+            return score
         if isinstance(score, dict):
             if 'displayValue' in score:
                 return str(score['displayValue'])
@@ -164,8 +203,6 @@ class ESPNClient:
                     return str(int(value))
                 return str(value)
             return '0'
-        if isinstance(score, str):
-            return score
         if isinstance(score, (int, float)):
             if isinstance(score, float) and score.is_integer():
                 return str(int(score))
@@ -181,8 +218,13 @@ class ESPNClient:
                 return int(shootout)
         return None
 
-    def parse_game_event_with_timestamp(self, event: Dict, team_id: str, sport: str, league: str) -> Optional[Dict]:
-        """Parse a game event and return structured data with timestamp for sorting"""
+    def parse_game_event_with_timestamp(self, event: Dict, team_id: str, sport: str, league: str,
+                                        today: Optional[date] = None) -> Optional[ParsedGame]:
+        """Parse a game event and return structured data with timestamp for sorting
+
+        Callers parsing many events can pass ``today`` (local date) so it is
+        computed once per request rather than once per event.
+        """
         try:
             competitions = event.get('competitions', [])
             if not competitions:
@@ -194,18 +236,31 @@ class ESPNClient:
             if len(competitors) != 2:
                 return None
             
+            # Get game status; an event with a blank status can't be displayed
+            status_obj = competition.get('status') or event.get('status') or _EMPTY
+            status_type = status_obj.get('type') or _EMPTY
+            status_name = status_type.get('name', 'UNKNOWN')
+            if not status_name:
+                return None
+            status_name = sys.intern(status_name)
+            
             # Extract team info
             team1 = competitors[0]
             team2 = competitors[1]
             
-            # Determine home/away
-            home_team = team1 if team1.get('homeAway') == 'home' else team2
-            away_team = team2 if team1.get('homeAway') == 'home' else team1
+            # Determine home/away, pulling each nested team dict only once
+            # Interned so equality against the (interned) literals is a pointer compare
+            if sys.intern(team1.get('homeAway') or '') == 'home':
+                home_team, away_team = team1, team2
+            else:
+                home_team, away_team = team2, team1
+            home_team_info = home_team.get('team') or _EMPTY
+            away_team_info = away_team.get('team') or _EMPTY
             
-            home_id = home_team.get('team', {}).get('id', '')
-            away_id = away_team.get('team', {}).get('id', '')
-            home_abbr = home_team.get('team', {}).get('abbreviation', 'UNK')
-            away_abbr = away_team.get('team', {}).get('abbreviation', 'UNK')
+            home_id = home_team_info.get('id', '')
+            away_id = away_team_info.get('id', '')
+            home_abbr = home_team_info.get('abbreviation', 'UNK')
+            away_abbr = away_team_info.get('abbreviation', 'UNK')
             
             home_name = get_team_abbreviation(home_id, home_abbr, sport, league)
             away_name = get_team_abbreviation(away_id, away_abbr, sport, league)
@@ -213,115 +268,177 @@ class ESPNClient:
             home_score = self.extract_score(home_team)
             away_score = self.extract_score(away_team)
             
-            # Get game status
-            status_obj = competition.get('status', event.get('status', {}))
-            status_type = status_obj.get('type', {})
-            status_name = status_type.get('name', 'UNKNOWN')
-            
             # Get timestamp for sorting
             date_str = event.get('date', '')
             timestamp = 0
             event_timestamp = None
-            if date_str:
+            dt = None
+            # Anything shorter than YYYY-MM-DD can't be a usable date; skip the parse attempt
+            if date_str and len(date_str) >= 10:
                 try:
-                    dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=timezone.utc)
-                    event_timestamp = dt.timestamp()
+                    dt, event_timestamp = parse_utc_timestamp(date_str)
                     timestamp = event_timestamp
-                except:
+                except (ValueError, TypeError, OverflowError, OSError):
                     pass
             
-            # Format based on game status
-            formatted = ""
-            if status_name in ['STATUS_IN_PROGRESS', 'STATUS_FIRST_HALF', 'STATUS_SECOND_HALF', 'STATUS_END_PERIOD']:
-                # Game is live
-                clock = status_obj.get('displayClock', '')
-                period = status_obj.get('period', 0)
-                is_end_period = (status_name == 'STATUS_END_PERIOD')
-                
-                if sport == 'soccer':
-                    # Soccer: @Home Score-Score Away (Clock)
-                    period_str = clock if (clock and clock != '0:00' and clock != "0'") else f"{period}H"
-                    formatted = f"@{home_name} {home_score}-{away_score} {away_name} ({period_str})"
-                elif sport == 'baseball':
-                    short_detail = status_type.get('shortDetail', '')
-                    period_str = short_detail if ('Top' in short_detail or 'Bottom' in short_detail) else f"{period}I"
-                    if is_end_period: period_str = f"End {period_str}"
-                    formatted = f"{away_name} {away_score}-{home_score} @{home_name} ({period_str})"
-                elif sport == 'football':
-                    period_str = f"Q{period}"
-                    if is_end_period: period_str = f"End {period_str}"
-                    formatted = f"{away_name} {away_score}-{home_score} @{home_name} ({clock} {period_str})"
-                else:
-                    period_str = f"P{period}"
-                    if is_end_period: period_str = f"End {period_str}"
-                    formatted = f"{away_name} {away_score}-{home_score} @{home_name} ({clock} {period_str})"
-                
-                timestamp = -1 # Live games first
-                
-            elif status_name == 'STATUS_SCHEDULED':
-                # Scheduled
-                if event_timestamp:
-                    dt = datetime.fromtimestamp(event_timestamp, tz=timezone.utc).astimezone()
-                    time_str = format_clean_date_time(dt)
-                    if sport == 'soccer':
-                        formatted = f"@{home_name} vs. {away_name} ({time_str})"
-                    else:
-                        formatted = f"{away_abbr} @ {home_abbr} ({time_str})"
-                else:
-                    formatted = f"{away_abbr} @ {home_abbr} (TBD)" if sport != 'soccer' else f"@{home_name} vs. {away_name} (TBD)"
-                    timestamp = 9999999999
-                    
-            elif status_name == 'STATUS_HALFTIME':
-                if sport == 'soccer':
-                    formatted = f"@{home_name} {home_score}-{away_score} {away_name} (HT)"
-                else:
-                    formatted = f"{away_abbr} {away_score}-{home_score} @{home_abbr} (HT)"
-                timestamp = -2
-                
-            elif status_name in ['STATUS_FINAL', 'STATUS_FULL_TIME', 'STATUS_FINAL_PEN', 'STATUS_POSTPONED']:
-                date_suffix = ""
-                if event_timestamp:
-                    dt = datetime.fromtimestamp(event_timestamp, tz=timezone.utc).astimezone()
-                    if dt.date() != datetime.now().date():
-                        date_suffix = f", {format_clean_date(dt)}"
-                
-                if status_name == 'STATUS_FINAL_PEN':
-                    home_shootout = self.extract_shootout_score(home_team)
-                    away_shootout = self.extract_shootout_score(away_team)
-                    pen_str = f"FT-PEN {home_shootout}-{away_shootout}" if home_shootout is not None else "FT-PEN"
-                    formatted = f"@{home_name} {home_score}-{away_score} {away_name} ({pen_str}{date_suffix})"
-                elif status_name == 'STATUS_FULL_TIME':
-                    formatted = f"@{home_name} {home_score}-{away_score} {away_name} (FT{date_suffix})"
-                elif status_name == 'STATUS_POSTPONED':
-                    formatted = f"{away_abbr} @ {home_abbr} (Postponed{date_suffix})"
-                else:
-                    formatted = f"{away_abbr} {away_score}-{home_score} @{home_abbr} (F{date_suffix})"
-                
-                timestamp = 9999999998
-            else:
-                prefix = "@" if sport == 'soccer' else ""
-                suffix = " vs. " if sport == 'soccer' else " @ "
-                if sport == 'soccer':
-                    formatted = f"@{home_name} {home_score}-{away_score} {away_name} ({status_name})"
-                else:
-                    formatted = f"{away_name} {away_score}-{home_score} @{home_name} ({status_name})"
-                timestamp = 9999999997
-
-            return {
-                'id': event.get('id'),
-                'timestamp': timestamp,
-                'event_timestamp': event_timestamp,
-                'formatted': formatted,
+            # Format based on game status via the status -> formatter dispatch table
+            game = {
                 'sport': sport,
-                'league': league,
-                'status': status_name
+                'status_name': status_name,
+                'status_obj': status_obj,
+                'status_type': status_type,
+                'home_team': home_team,
+                'away_team': away_team,
+                'home_name': home_name,
+                'away_name': away_name,
+                'home_abbr': home_abbr,
+                'away_abbr': away_abbr,
+                'home_score': home_score,
+                'away_score': away_score,
+                'event_timestamp': event_timestamp,
+                'dt': dt,
+                'today': today,
             }
+            handler = self._status_handlers_for(sport).get(status_name, ESPNClient._format_other)
+            formatted, status_timestamp = handler(self, game)
+            if status_timestamp is not None:
+                timestamp = status_timestamp
+                sort_key = (self._SORT_PRIORITIES[status_timestamp], 0)
+            else:
+                sort_key = (SORT_DATED, timestamp)
+
+            return ParsedGame(
+                id=event.get('id'),
+                timestamp=timestamp,
+                sort_key=sort_key,
+                event_timestamp=event_timestamp,
+                formatted=formatted,
+                formatted_with_emoji=f"{SPORT_EMOJIS.get(sport, '🏆')} {formatted}",
+                sport=sport,
+                league=league,
+                status=status_name
+            )
         except Exception as e:
             self.logger.error(f"Error parsing ESPN event {event.get('id')}: {e}")
             return None
 
-    def parse_league_game_event(self, event: Dict, sport: str, league: str) -> Optional[Dict]:
+    # Status formatters: each takes the per-event fields and returns
+    # (formatted, timestamp), where a None timestamp keeps the event start time
+
+    def _format_live_soccer(self, game: Dict) -> Tuple[str, Optional[float]]:
+        """Format an in-progress soccer game: @Home Score-Score Away (Clock)"""
+        status_obj = game['status_obj']
+        clock = status_obj.get('displayClock', '')
+        period_str = clock if (clock and clock != '0:00' and clock != "0'") else f"{status_obj.get('period', 0)}H"
+        formatted = f"@{game['home_name']} {game['home_score']}-{game['away_score']} {game['away_name']} ({period_str})"
+        return formatted, self._LIVE_TIMESTAMP
+
+    def _format_live_baseball(self, game: Dict) -> Tuple[str, Optional[float]]:
+        """Format an in-progress baseball game with its inning"""
+        short_detail = game['status_type'].get('shortDetail', '')
+        # ESPN puts the half-inning first ("Top 5th"), so a prefix check suffices
+        if short_detail.startswith(('Top', 'Bottom')):
+            period_str = short_detail
+        else:
+            period_str = f"{game['status_obj'].get('period', 0)}I"
+        if game['status_name'] == 'STATUS_END_PERIOD':
+            period_str = f"End {period_str}"
+        formatted = f"{game['away_name']} {game['away_score']}-{game['home_score']} @{game['home_name']} ({period_str})"
+        return formatted, self._LIVE_TIMESTAMP
+
+    def _format_live_clock(self, game: Dict, period_prefix: str = 'P') -> Tuple[str, Optional[float]]:
+        """Format an in-progress timed game (hockey, basketball, ...) with clock and period"""
+        status_obj = game['status_obj']
+        period_str = f"{period_prefix}{status_obj.get('period', 0)}"
+        if game['status_name'] == 'STATUS_END_PERIOD':
+            period_str = f"End {period_str}"
+        formatted = (f"{game['away_name']} {game['away_score']}-{game['home_score']} @{game['home_name']} "
+                     f"({status_obj.get('displayClock', '')} {period_str})")
+        return formatted, self._LIVE_TIMESTAMP
+
+    def _format_live_football(self, game: Dict) -> Tuple[str, Optional[float]]:
+        """Format an in-progress football game with clock and quarter"""
+        return self._format_live_clock(game, 'Q')
+
+    def _format_scheduled(self, game: Dict) -> Tuple[str, Optional[float]]:
+        """Format a scheduled game with its local start time, or TBD"""
+        if game['event_timestamp']:
+            when = format_clean_date_time(game['dt'].astimezone())
+            timestamp = None
+        else:
+            when = "TBD"
+            timestamp = self._TBD_TIMESTAMP
+
+        if game['sport'] == 'soccer':
+            return f"@{game['home_name']} vs. {game['away_name']} ({when})", timestamp
+        return f"{game['away_abbr']} @ {game['home_abbr']} ({when})", timestamp
+
+    def _format_halftime(self, game: Dict) -> Tuple[str, Optional[float]]:
+        """Format a game at halftime"""
+        if game['sport'] == 'soccer':
+            formatted = f"@{game['home_name']} {game['home_score']}-{game['away_score']} {game['away_name']} (HT)"
+        else:
+            formatted = f"{game['away_abbr']} {game['away_score']}-{game['home_score']} @{game['home_abbr']} (HT)"
+        return formatted, self._HALFTIME_TIMESTAMP
+
+    def _format_final(self, game: Dict) -> Tuple[str, Optional[float]]:
+        """Format a finished or postponed game, with its date if not today"""
+        date_suffix = ""
+        if game['event_timestamp']:
+            today = game['today'] or datetime.now().date()
+            day_start, day_end = _local_day_bounds(today)
+            # Games played today need no date, so only convert to local time otherwise
+            if not day_start <= game['event_timestamp'] < day_end:
+                local_dt = game['dt'].astimezone()
+                if local_dt.date() != today:
+                    date_suffix = f", {format_clean_date(local_dt)}"
+
+        status_name = game['status_name']
+        if status_name == 'STATUS_POSTPONED':
+            formatted = f"{game['away_abbr']} @ {game['home_abbr']} (Postponed{date_suffix})"
+        elif status_name == 'STATUS_FINAL':
+            formatted = f"{game['away_abbr']} {game['away_score']}-{game['home_score']} @{game['home_abbr']} (F{date_suffix})"
+        else:
+            # Soccer full time, with the shootout score for games decided on penalties
+            tag = "FT"
+            if status_name == 'STATUS_FINAL_PEN':
+                home_shootout = self.extract_shootout_score(game['home_team'])
+                away_shootout = self.extract_shootout_score(game['away_team'])
+                tag = f"FT-PEN {home_shootout}-{away_shootout}" if home_shootout is not None else "FT-PEN"
+            formatted = f"@{game['home_name']} {game['home_score']}-{game['away_score']} {game['away_name']} ({tag}{date_suffix})"
+        return formatted, self._FINAL_TIMESTAMP
+
+    def _format_other(self, game: Dict) -> Tuple[str, Optional[float]]:
+        """Format a game in any other status, showing the raw status name"""
+        if game['sport'] == 'soccer':
+            formatted = f"@{game['home_name']} {game['home_score']}-{game['away_score']} {game['away_name']} ({game['status_name']})"
+        else:
+            formatted = f"{game['away_name']} {game['away_score']}-{game['home_score']} @{game['home_name']} ({game['status_name']})"
+        return formatted, self._OTHER_TIMESTAMP
+
+    # Sport-independent handlers; live statuses are added per sport by _status_handlers_for()
+    _STATUS_HANDLERS = {
+        'STATUS_SCHEDULED': _format_scheduled,
+        'STATUS_HALFTIME': _format_halftime,
+        **dict.fromkeys(FINAL_STATUSES, _format_final),
+    }
+
+    _LIVE_FORMATTERS = {
+        'soccer': _format_live_soccer,
+        'baseball': _format_live_baseball,
+        'football': _format_live_football,
+    }
+
+    def _status_handlers_for(self, sport: str) -> Dict:
+        """Get the status -> formatter table specialised for a sport (built once per sport)"""
+        handlers = self._sport_status_handlers.get(sport)
+        if handlers is None:
+            live_formatter = self._LIVE_FORMATTERS.get(sport, ESPNClient._format_live_clock)
+            handlers = {**self._STATUS_HANDLERS, **dict.fromkeys(LIVE_STATUSES, live_formatter)}
+            self._sport_status_handlers[sport] = handlers
+        return handlers
+
+    def parse_league_game_event(self, event: Dict, sport: str, league: str,
+                                today: Optional[date] = None) -> Optional[ParsedGame]:
         """Parse a league game event (scoreboard)"""
-        return self.parse_game_event_with_timestamp(event, "", sport, league)
+        return self.parse_game_event_with_timestamp(event, "", sport, league, today=today)
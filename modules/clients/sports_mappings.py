@@ -4,6 +4,11 @@ Sports Team and League Mappings
 Contains team IDs and custom abbreviations for various sports APIs
 """
 
+from dataclasses import dataclass
+from datetime import datetime, time, timezone
+from functools import lru_cache
+from typing import Optional, Tuple
+
 # Sport emojis for easy identification
 SPORT_EMOJIS = {
     'football': '🏈',
@@ -51,29 +56,17 @@ WOMENS_TEAM_ABBREVIATIONS = {
 TEAM_MAPPINGS = {
     # NFL Teams
     'seahawks': {'sport': 'football', 'league': 'nfl', 'team_id': '26'},
-    'hawks': {'sport': 'football', 'league': 'nfl', 'team_id': '26'},
     '49ers': {'sport': 'football', 'league': 'nfl', 'team_id': '25'},
     'niners': {'sport': 'football', 'league': 'nfl', 'team_id': '25'},
-    'sf': {'sport': 'football', 'league': 'nfl', 'team_id': '25'},
     'bears': {'sport': 'football', 'league': 'nfl', 'team_id': '3'},
-    'chicago': {'sport': 'football', 'league': 'nfl', 'team_id': '3'},
-    'chi': {'sport': 'football', 'league': 'nfl', 'team_id': '3'},
     'bengals': {'sport': 'football', 'league': 'nfl', 'team_id': '4'},
-    'cincinnati': {'sport': 'football', 'league': 'nfl', 'team_id': '4'},
-    'cin': {'sport': 'football', 'league': 'nfl', 'team_id': '4'},
     'bills': {'sport': 'football', 'league': 'nfl', 'team_id': '2'},
-    'buffalo': {'sport': 'football', 'league': 'nfl', 'team_id': '2'},
-    'buf': {'sport': 'football', 'league': 'nfl', 'team_id': '2'},
     'broncos': {'sport': 'football', 'league': 'nfl', 'team_id': '7'},
     'denver': {'sport': 'football', 'league': 'nfl', 'team_id': '7'},
     'den': {'sport': 'football', 'league': 'nfl', 'team_id': '7'},
     'browns': {'sport': 'football', 'league': 'nfl', 'team_id': '5'},
-    'cleveland': {'sport': 'football', 'league': 'nfl', 'team_id': '5'},
-    'cle': {'sport': 'football', 'league': 'nfl', 'team_id': '5'},
     'buccaneers': {'sport': 'football', 'league': 'nfl', 'team_id': '27'},
     'bucs': {'sport': 'football', 'league': 'nfl', 'team_id': '27'},
-    'tampa bay': {'sport': 'football', 'league': 'nfl', 'team_id': '27'},
-    'tb': {'sport': 'football', 'league': 'nfl', 'team_id': '27'},
     'arizona cardinals': {'sport': 'football', 'league': 'nfl', 'team_id': '22'},
     'az cardinals': {'sport': 'football', 'league': 'nfl', 'team_id': '22'},
     'chargers': {'sport': 'football', 'league': 'nfl', 'team_id': '24'},
@@ -81,43 +74,25 @@ TEAM_MAPPINGS = {
     'la chargers': {'sport': 'football', 'league': 'nfl', 'team_id': '24'},
     'los angeles chargers': {'sport': 'football', 'league': 'nfl', 'team_id': '24'},
     'chiefs': {'sport': 'football', 'league': 'nfl', 'team_id': '12'},
-    'kansas city': {'sport': 'football', 'league': 'nfl', 'team_id': '12'},
-    'kc': {'sport': 'football', 'league': 'nfl', 'team_id': '12'},
     'colts': {'sport': 'football', 'league': 'nfl', 'team_id': '11'},
     'indianapolis': {'sport': 'football', 'league': 'nfl', 'team_id': '11'},
     'ind': {'sport': 'football', 'league': 'nfl', 'team_id': '11'},
     'commanders': {'sport': 'football', 'league': 'nfl', 'team_id': '28'},
-    'washington': {'sport': 'football', 'league': 'nfl', 'team_id': '28'},
-    'wsh': {'sport': 'football', 'league': 'nfl', 'team_id': '28'},
     'cowboys': {'sport': 'football', 'league': 'nfl', 'team_id': '6'},
-    'dallas': {'sport': 'football', 'league': 'nfl', 'team_id': '6'},
-    'dal': {'sport': 'football', 'league': 'nfl', 'team_id': '6'},
     'dolphins': {'sport': 'football', 'league': 'nfl', 'team_id': '15'},
-    'miami': {'sport': 'football', 'league': 'nfl', 'team_id': '15'},
-    'mia': {'sport': 'football', 'league': 'nfl', 'team_id': '15'},
     'eagles': {'sport': 'football', 'league': 'nfl', 'team_id': '21'},
-    'philadelphia': {'sport': 'football', 'league': 'nfl', 'team_id': '21'},
-    'phi': {'sport': 'football', 'league': 'nfl', 'team_id': '21'},
     'falcons': {'sport': 'football', 'league': 'nfl', 'team_id': '1'},
-    'atlanta': {'sport': 'football', 'league': 'nfl', 'team_id': '1'},
-    'atl': {'sport': 'football', 'league': 'nfl', 'team_id': '1'},
-    'giants': {'sport': 'football', 'league': 'nfl', 'team_id': '19'},
     'nyg': {'sport': 'football', 'league': 'nfl', 'team_id': '19'},
     'jaguars': {'sport': 'football', 'league': 'nfl', 'team_id': '30'},
     'jax': {'sport': 'football', 'league': 'nfl', 'team_id': '30'},
     'jacksonville': {'sport': 'football', 'league': 'nfl', 'team_id': '30'},
-    'jets': {'sport': 'football', 'league': 'nfl', 'team_id': '20'},
     'nyj': {'sport': 'football', 'league': 'nfl', 'team_id': '20'},
     'lions': {'sport': 'football', 'league': 'nfl', 'team_id': '8'},
-    'detroit': {'sport': 'football', 'league': 'nfl', 'team_id': '8'},
-    'det': {'sport': 'football', 'league': 'nfl', 'team_id': '8'},
     'packers': {'sport': 'football', 'league': 'nfl', 'team_id': '9'},
     'green bay': {'sport': 'football', 'league': 'nfl', 'team_id': '9'},
     'gb': {'sport': 'football', 'league': 'nfl', 'team_id': '9'},
     'carolina panthers': {'sport': 'football', 'league': 'nfl', 'team_id': '29'},
     'patriots': {'sport': 'football', 'league': 'nfl', 'team_id': '17'},
-    'new england': {'sport': 'football', 'league': 'nfl', 'team_id': '17'},
-    'ne': {'sport': 'football', 'league': 'nfl', 'team_id': '17'},
     'raiders': {'sport': 'football', 'league': 'nfl', 'team_id': '13'},
     'las vegas': {'sport': 'football', 'league': 'nfl', 'team_id': '13'},
     'lv': {'sport': 'football', 'league': 'nfl', 'team_id': '13'},
@@ -126,23 +101,15 @@ TEAM_MAPPINGS = {
     'la rams': {'sport': 'football', 'league': 'nfl', 'team_id': '14'},
     'los angeles rams': {'sport': 'football', 'league': 'nfl', 'team_id': '14'},
     'ravens': {'sport': 'football', 'league': 'nfl', 'team_id': '33'},
-    'baltimore': {'sport': 'football', 'league': 'nfl', 'team_id': '33'},
-    'bal': {'sport': 'football', 'league': 'nfl', 'team_id': '33'},
     'saints': {'sport': 'football', 'league': 'nfl', 'team_id': '18'},
     'new orleans': {'sport': 'football', 'league': 'nfl', 'team_id': '18'},
     'no': {'sport': 'football', 'league': 'nfl', 'team_id': '18'},
     'steelers': {'sport': 'football', 'league': 'nfl', 'team_id': '23'},
-    'pittsburgh': {'sport': 'football', 'league': 'nfl', 'team_id': '23'},
-    'pit': {'sport': 'football', 'league': 'nfl', 'team_id': '23'},
     'texans': {'sport': 'football', 'league': 'nfl', 'team_id': '34'},
-    'houston': {'sport': 'football', 'league': 'nfl', 'team_id': '34'},
-    'hou': {'sport': 'football', 'league': 'nfl', 'team_id': '34'},
     'titans': {'sport': 'football', 'league': 'nfl', 'team_id': '10'},
     'tennessee': {'sport': 'football', 'league': 'nfl', 'team_id': '10'},
     'ten': {'sport': 'football', 'league': 'nfl', 'team_id': '10'},
     'vikings': {'sport': 'football', 'league': 'nfl', 'team_id': '16'},
-    'minnesota': {'sport': 'football', 'league': 'nfl', 'team_id': '16'},
-    'min': {'sport': 'football', 'league': 'nfl', 'team_id': '16'},
     
     # CFL Teams (Canadian Football League)
     'bc lions': {'sport': 'football', 'league': 'cfl', 'team_id': '79'},
@@ -179,29 +146,21 @@ TEAM_MAPPINGS = {
     
     # MLB Teams
     'mariners': {'sport': 'baseball', 'league': 'mlb', 'team_id': '12'},
-    'seattle': {'sport': 'baseball', 'league': 'mlb', 'team_id': '12'},
     'sea': {'sport': 'baseball', 'league': 'mlb', 'team_id': '12'},
     'angels': {'sport': 'baseball', 'league': 'mlb', 'team_id': '3'},
     'laa': {'sport': 'baseball', 'league': 'mlb', 'team_id': '3'},
     'astros': {'sport': 'baseball', 'league': 'mlb', 'team_id': '18'},
-    'houston': {'sport': 'baseball', 'league': 'mlb', 'team_id': '18'},
-    'hou': {'sport': 'baseball', 'league': 'mlb', 'team_id': '18'},
     'athletics': {'sport': 'baseball', 'league': 'mlb', 'team_id': '11'},
     'a\'s': {'sport': 'baseball', 'league': 'mlb', 'team_id': '11'},
     'oakland': {'sport': 'baseball', 'league': 'mlb', 'team_id': '11'},
     'oak': {'sport': 'baseball', 'league': 'mlb', 'team_id': '11'},
     'blue jays': {'sport': 'baseball', 'league': 'mlb', 'team_id': '14'},
-    'toronto': {'sport': 'baseball', 'league': 'mlb', 'team_id': '14'},
-    'tor': {'sport': 'baseball', 'league': 'mlb', 'team_id': '14'},
     'braves': {'sport': 'baseball', 'league': 'mlb', 'team_id': '15'},
     'atlanta': {'sport': 'baseball', 'league': 'mlb', 'team_id': '15'},
-    'atl': {'sport': 'baseball', 'league': 'mlb', 'team_id': '15'},
     'brewers': {'sport': 'baseball', 'league': 'mlb', 'team_id': '8'},
     'milwaukee': {'sport': 'baseball', 'league': 'mlb', 'team_id': '8'},
     'mil': {'sport': 'baseball', 'league': 'mlb', 'team_id': '8'},
     'cardinals': {'sport': 'baseball', 'league': 'mlb', 'team_id': '24'},
-    'st louis': {'sport': 'baseball', 'league': 'mlb', 'team_id': '24'},
-    'stl': {'sport': 'baseball', 'league': 'mlb', 'team_id': '24'},
     'cubs': {'sport': 'baseball', 'league': 'mlb', 'team_id': '16'},
     'chicago': {'sport': 'baseball', 'league': 'mlb', 'team_id': '16'},
     'chc': {'sport': 'baseball', 'league': 'mlb', 'team_id': '16'},
@@ -217,49 +176,28 @@ TEAM_MAPPINGS = {
     'cleveland': {'sport': 'baseball', 'league': 'mlb', 'team_id': '5'},
     'cle': {'sport': 'baseball', 'league': 'mlb', 'team_id': '5'},
     'marlins': {'sport': 'baseball', 'league': 'mlb', 'team_id': '28'},
-    'miami': {'sport': 'baseball', 'league': 'mlb', 'team_id': '28'},
-    'mia': {'sport': 'baseball', 'league': 'mlb', 'team_id': '28'},
     'mets': {'sport': 'baseball', 'league': 'mlb', 'team_id': '21'},
     'nym': {'sport': 'baseball', 'league': 'mlb', 'team_id': '21'},
     'nationals': {'sport': 'baseball', 'league': 'mlb', 'team_id': '20'},
-    'washington': {'sport': 'baseball', 'league': 'mlb', 'team_id': '20'},
     'was': {'sport': 'baseball', 'league': 'mlb', 'team_id': '20'},
     'orioles': {'sport': 'baseball', 'league': 'mlb', 'team_id': '1'},
     'baltimore': {'sport': 'baseball', 'league': 'mlb', 'team_id': '1'},
     'bal': {'sport': 'baseball', 'league': 'mlb', 'team_id': '1'},
     'padres': {'sport': 'baseball', 'league': 'mlb', 'team_id': '25'},
-    'san diego': {'sport': 'baseball', 'league': 'mlb', 'team_id': '25'},
-    'sd': {'sport': 'baseball', 'league': 'mlb', 'team_id': '25'},
     'phillies': {'sport': 'baseball', 'league': 'mlb', 'team_id': '22'},
-    'philadelphia': {'sport': 'baseball', 'league': 'mlb', 'team_id': '22'},
-    'phi': {'sport': 'baseball', 'league': 'mlb', 'team_id': '22'},
     'pirates': {'sport': 'baseball', 'league': 'mlb', 'team_id': '23'},
-    'pittsburgh': {'sport': 'baseball', 'league': 'mlb', 'team_id': '23'},
-    'pit': {'sport': 'baseball', 'league': 'mlb', 'team_id': '23'},
-    'rangers': {'sport': 'baseball', 'league': 'mlb', 'team_id': '13'},
     'texas': {'sport': 'baseball', 'league': 'mlb', 'team_id': '13'},
     'tex': {'sport': 'baseball', 'league': 'mlb', 'team_id': '13'},
     'rays': {'sport': 'baseball', 'league': 'mlb', 'team_id': '30'},
-    'tampa bay': {'sport': 'baseball', 'league': 'mlb', 'team_id': '30'},
-    'tb': {'sport': 'baseball', 'league': 'mlb', 'team_id': '30'},
     'red sox': {'sport': 'baseball', 'league': 'mlb', 'team_id': '2'},
     'boston': {'sport': 'baseball', 'league': 'mlb', 'team_id': '2'},
-    'bos': {'sport': 'baseball', 'league': 'mlb', 'team_id': '2'},
     'reds': {'sport': 'baseball', 'league': 'mlb', 'team_id': '17'},
-    'cincinnati': {'sport': 'baseball', 'league': 'mlb', 'team_id': '17'},
-    'cin': {'sport': 'baseball', 'league': 'mlb', 'team_id': '17'},
     'rockies': {'sport': 'baseball', 'league': 'mlb', 'team_id': '27'},
-    'colorado': {'sport': 'baseball', 'league': 'mlb', 'team_id': '27'},
-    'col': {'sport': 'baseball', 'league': 'mlb', 'team_id': '27'},
     'royals': {'sport': 'baseball', 'league': 'mlb', 'team_id': '7'},
     'kansas city': {'sport': 'baseball', 'league': 'mlb', 'team_id': '7'},
     'kc': {'sport': 'baseball', 'league': 'mlb', 'team_id': '7'},
     'tigers': {'sport': 'baseball', 'league': 'mlb', 'team_id': '6'},
-    'detroit': {'sport': 'baseball', 'league': 'mlb', 'team_id': '6'},
-    'det': {'sport': 'baseball', 'league': 'mlb', 'team_id': '6'},
     'twins': {'sport': 'baseball', 'league': 'mlb', 'team_id': '9'},
-    'minnesota': {'sport': 'baseball', 'league': 'mlb', 'team_id': '9'},
-    'min': {'sport': 'baseball', 'league': 'mlb', 'team_id': '9'},
     'white sox': {'sport': 'baseball', 'league': 'mlb', 'team_id': '4'},
     'chw': {'sport': 'baseball', 'league': 'mlb', 'team_id': '4'},
     'yankees': {'sport': 'baseball', 'league': 'mlb', 'team_id': '10'},
@@ -289,7 +227,6 @@ TEAM_MAPPINGS = {
     'detroit pistons': {'sport': 'basketball', 'league': 'nba', 'team_id': '8'},
     'warriors': {'sport': 'basketball', 'league': 'nba', 'team_id': '9'},
     'golden state warriors': {'sport': 'basketball', 'league': 'nba', 'team_id': '9'},
-    'rockets': {'sport': 'basketball', 'league': 'nba', 'team_id': '10'},
     'houston rockets': {'sport': 'basketball', 'league': 'nba', 'team_id': '10'},
     'pacers': {'sport': 'basketball', 'league': 'nba', 'team_id': '11'},
     'indiana pacers': {'sport': 'basketball', 'league': 'nba', 'team_id': '11'},
@@ -317,9 +254,7 @@ TEAM_MAPPINGS = {
     'phoenix suns': {'sport': 'basketball', 'league': 'nba', 'team_id': '21'},
     'trail blazers': {'sport': 'basketball', 'league': 'nba', 'team_id': '22'},
     'trailblazers': {'sport': 'basketball', 'league': 'nba', 'team_id': '22'},
-    'blazers': {'sport': 'basketball', 'league': 'nba', 'team_id': '22'},
     'portland trail blazers': {'sport': 'basketball', 'league': 'nba', 'team_id': '22'},
-    'kings': {'sport': 'basketball', 'league': 'nba', 'team_id': '23'},
     'sacramento kings': {'sport': 'basketball', 'league': 'nba', 'team_id': '23'},
     'spurs': {'sport': 'basketball', 'league': 'nba', 'team_id': '24'},
     'san antonio spurs': {'sport': 'basketball', 'league': 'nba', 'team_id': '24'},
@@ -381,16 +316,10 @@ TEAM_MAPPINGS = {
     'car': {'sport': 'hockey', 'league': 'nhl', 'team_id': '7'},
     'blackhawks': {'sport': 'hockey', 'league': 'nhl', 'team_id': '4'},
     'chicago blackhawks': {'sport': 'hockey', 'league': 'nhl', 'team_id': '4'},
-    'chi': {'sport': 'hockey', 'league': 'nhl', 'team_id': '4'},
     'avalanche': {'sport': 'hockey', 'league': 'nhl', 'team_id': '17'},
-    'colorado': {'sport': 'hockey', 'league': 'nhl', 'team_id': '17'},
-    'col': {'sport': 'hockey', 'league': 'nhl', 'team_id': '17'},
     'blue jackets': {'sport': 'hockey', 'league': 'nhl', 'team_id': '29'},
-    'columbus': {'sport': 'hockey', 'league': 'nhl', 'team_id': '29'},
     'cbj': {'sport': 'hockey', 'league': 'nhl', 'team_id': '29'},
     'stars': {'sport': 'hockey', 'league': 'nhl', 'team_id': '9'},
-    'dallas': {'sport': 'hockey', 'league': 'nhl', 'team_id': '9'},
-    'dal': {'sport': 'hockey', 'league': 'nhl', 'team_id': '9'},
     'red wings': {'sport': 'hockey', 'league': 'nhl', 'team_id': '5'},
     'detroit': {'sport': 'hockey', 'league': 'nhl', 'team_id': '5'},
     'det': {'sport': 'hockey', 'league': 'nhl', 'team_id': '5'},
@@ -402,16 +331,9 @@ TEAM_MAPPINGS = {
     'fla': {'sport': 'hockey', 'league': 'nhl', 'team_id': '26'},
     'kings': {'sport': 'hockey', 'league': 'nhl', 'team_id': '8'},
     'los angeles': {'sport': 'hockey', 'league': 'nhl', 'team_id': '8'},
-    'la': {'sport': 'hockey', 'league': 'nhl', 'team_id': '8'},
     'wild': {'sport': 'hockey', 'league': 'nhl', 'team_id': '30'},
-    'minnesota': {'sport': 'hockey', 'league': 'nhl', 'team_id': '30'},
-    'min': {'sport': 'hockey', 'league': 'nhl', 'team_id': '30'},
     'canadiens': {'sport': 'hockey', 'league': 'nhl', 'team_id': '10'},
-    'montreal': {'sport': 'hockey', 'league': 'nhl', 'team_id': '10'},
-    'mtl': {'sport': 'hockey', 'league': 'nhl', 'team_id': '10'},
     'predators': {'sport': 'hockey', 'league': 'nhl', 'team_id': '27'},
-    'nashville': {'sport': 'hockey', 'league': 'nhl', 'team_id': '27'},
-    'nsh': {'sport': 'hockey', 'league': 'nhl', 'team_id': '27'},
     'devils': {'sport': 'hockey', 'league': 'nhl', 'team_id': '11'},
     'new jersey': {'sport': 'hockey', 'league': 'nhl', 'team_id': '11'},
     'nj': {'sport': 'hockey', 'league': 'nhl', 'team_id': '11'},
@@ -425,32 +347,22 @@ TEAM_MAPPINGS = {
     'ottawa': {'sport': 'hockey', 'league': 'nhl', 'team_id': '14'},
     'ott': {'sport': 'hockey', 'league': 'nhl', 'team_id': '14'},
     'flyers': {'sport': 'hockey', 'league': 'nhl', 'team_id': '15'},
-    'philadelphia': {'sport': 'hockey', 'league': 'nhl', 'team_id': '15'},
-    'phi': {'sport': 'hockey', 'league': 'nhl', 'team_id': '15'},
     'penguins': {'sport': 'hockey', 'league': 'nhl', 'team_id': '16'},
     'pittsburgh': {'sport': 'hockey', 'league': 'nhl', 'team_id': '16'},
     'pit': {'sport': 'hockey', 'league': 'nhl', 'team_id': '16'},
     'sharks': {'sport': 'hockey', 'league': 'nhl', 'team_id': '18'},
-    'san jose': {'sport': 'hockey', 'league': 'nhl', 'team_id': '18'},
-    'sj': {'sport': 'hockey', 'league': 'nhl', 'team_id': '18'},
     'kraken': {'sport': 'hockey', 'league': 'nhl', 'team_id': '124292'},
     'seattle kraken': {'sport': 'hockey', 'league': 'nhl', 'team_id': '124292'},
     'seattle': {'sport': 'hockey', 'league': 'nhl', 'team_id': '124292'},
     'blues': {'sport': 'hockey', 'league': 'nhl', 'team_id': '19'},
-    'st louis': {'sport': 'hockey', 'league': 'nhl', 'team_id': '19'},
-    'stl': {'sport': 'hockey', 'league': 'nhl', 'team_id': '19'},
     'lightning': {'sport': 'hockey', 'league': 'nhl', 'team_id': '20'},
     'tampa bay': {'sport': 'hockey', 'league': 'nhl', 'team_id': '20'},
     'tb': {'sport': 'hockey', 'league': 'nhl', 'team_id': '20'},
     'maple leafs': {'sport': 'hockey', 'league': 'nhl', 'team_id': '21'},
-    'toronto': {'sport': 'hockey', 'league': 'nhl', 'team_id': '21'},
-    'tor': {'sport': 'hockey', 'league': 'nhl', 'team_id': '21'},
     'mammoth': {'sport': 'hockey', 'league': 'nhl', 'team_id': '129764'},
     'utah': {'sport': 'hockey', 'league': 'nhl', 'team_id': '129764'},
     'utah mammoth': {'sport': 'hockey', 'league': 'nhl', 'team_id': '129764'},
     'canucks': {'sport': 'hockey', 'league': 'nhl', 'team_id': '22'},
-    'vancouver': {'sport': 'hockey', 'league': 'nhl', 'team_id': '22'},
-    'van': {'sport': 'hockey', 'league': 'nhl', 'team_id': '22'},
     'golden knights': {'sport': 'hockey', 'league': 'nhl', 'team_id': '37'},
     'vegas': {'sport': 'hockey', 'league': 'nhl', 'team_id': '37'},
     'vgk': {'sport': 'hockey', 'league': 'nhl', 'team_id': '37'},
@@ -667,15 +579,66 @@ LEAGUE_MAPPINGS = {
     'premier league': {'sport': 'soccer', 'league': 'eng.1'}
 }
 
+@lru_cache(maxsize=1024)
+def parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC
+    
+    Python 3.11+ parses 'Z' natively, so the string is only rewritten as a
+    fallback on older interpreters. Results are memoized: many events in a
+    scoreboard share the same kickoff string, and datetimes are immutable.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+@lru_cache(maxsize=1024)
+def parse_utc_timestamp(value: str) -> Tuple[datetime, float]:
+    """Parse an ISO 8601 timestamp into an aware datetime and its epoch seconds
+    
+    Naive timestamps are taken to be UTC. Memoized like parse_iso_datetime so
+    events sharing a start time skip the tz normalisation and epoch math too.
+    """
+    dt = parse_iso_datetime(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt, dt.timestamp()
+
+# Sort priorities for parsed games. Games carry a 'sort_key' of (priority, start
+# timestamp): halftime and live games first, then games with a known start time
+# in chronological order, then other statuses, finished games and TBD games.
+SORT_HALFTIME, SORT_LIVE, SORT_DATED, SORT_OTHER, SORT_FINAL, SORT_TBD = range(6)
+
+@dataclass
+class ParsedGame:
+    """A game parsed by one of the sports API clients, ready to sort and display"""
+    # Declared by hand rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('id', 'timestamp', 'sort_key', 'event_timestamp', 'formatted',
+                 'formatted_with_emoji', 'sport', 'league', 'status')
+    id: Optional[str]
+    timestamp: float
+    sort_key: Tuple[int, float]
+    event_timestamp: Optional[float]
+    formatted: str
+    formatted_with_emoji: str
+    sport: str
+    league: str
+    status: str
+
 def format_clean_date_time(dt) -> str:
     """Format date and time without leading zeros"""
-    month = dt.month
-    day = dt.day
-    minute = dt.minute
-    ampm = dt.strftime("%p")
+    # Scoreboards share a handful of kickoff times, so memoize on the displayed
+    # wall-clock fields (not dt itself: aware datetimes in different zones
+    # compare equal for the same instant)
+    return _format_clean_date_time(dt.month, dt.day, dt.hour, dt.minute)
+
+@lru_cache(maxsize=512)
+def _format_clean_date_time(month: int, day: int, hour: int, minute: int) -> str:
+    """Cached worker for format_clean_date_time"""
+    ampm = time(hour).strftime("%p")
     
     # Convert to 12-hour format
-    hour_12 = dt.hour
+    hour_12 = hour
     if hour_12 == 0:
         hour_12 = 12
     elif hour_12 > 12:
@@ -787,6 +750,7 @@ def is_soccer(sport: str) -> bool:
     """Check if the sport is soccer"""
     return sport.lower() == 'soccer'
 
+@lru_cache(maxsize=1024)
 def get_team_abbreviation(team_id: str, team_abbreviation: str, sport: str, league: str) -> str:
     """Get team abbreviation, using -W suffix only for women's leagues"""
     if is_womens_league(sport, league):
@@ -798,5 +762,6 @@ __all__ = [
     'SPORT_EMOJIS', 'WOMENS_TEAM_ABBREVIATIONS', 'TEAM_MAPPINGS',
     'WOMENS_LEAGUES', 'LEAGUE_MAPPINGS', 'is_womens_league', 'is_soccer',
     'get_team_abbreviation', 'get_team_abbreviation_from_name',
-    'format_clean_date_time', 'format_clean_date'
+    'format_clean_date_time', 'format_clean_date', 'parse_iso_datetime', 'parse_utc_timestamp', 'ParsedGame',
+    'SORT_HALFTIME', 'SORT_LIVE', 'SORT_DATED', 'SORT_OTHER', 'SORT_FINAL', 'SORT_TBD'
 ]
@@ -1,12 +1,13 @@
 import aiohttp
 import asyncio
+import sys
 import time
 import logging
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import List, Dict, Optional
 from .sports_mappings import (
-    get_team_abbreviation_from_name, format_clean_date, 
-    format_clean_date_time, is_soccer
+    SPORT_EMOJIS, get_team_abbreviation_from_name, format_clean_date, 
+    format_clean_date_time, is_soccer, parse_utc_timestamp, ParsedGame, SORT_DATED, SORT_FINAL, SORT_TBD
 )
 
 class TheSportsDBClient:
@@ -92,7 +93,7 @@ class TheSportsDBClient:
             self.logger.error(f"TheSportsDB get_team_events_next error: {e}")
             return []
 
-    async def fetch_team_games(self, sport: str, league: str, team_id: str) -> List[Dict]:
+    async def fetch_team_games(self, sport: str, league: str, team_id: str) -> List[ParsedGame]:
         """Fetch and parse team games (last and next)"""
         last_events_task = self.get_team_events_last(team_id, limit=5)
         next_events_task = self.get_team_events_next(team_id, limit=5)
@@ -100,41 +101,49 @@ class TheSportsDBClient:
         last_events, next_events = await asyncio.gather(last_events_task, next_events_task)
         
         all_games = []
+        today = datetime.now().date()
         # Parse last events (completed games)
         for event in last_events:
-            game_data = self.parse_event(event, team_id, sport, league)
+            game_data = self.parse_event(event, team_id, sport, league, today=today)
             if game_data:
                 all_games.append(game_data)
         
         # Parse next events (upcoming games)
         for event in next_events:
-            game_data = self.parse_event(event, team_id, sport, league)
+            game_data = self.parse_event(event, team_id, sport, league, today=today)
             if game_data:
                 all_games.append(game_data)
         
         return all_games
 
-    async def fetch_team_schedule(self, sport: str, league: str, team_id: str) -> List[Dict]:
+    async def fetch_team_schedule(self, sport: str, league: str, team_id: str) -> List[ParsedGame]:
         """Fetch upcoming scheduled games for a team"""
         next_events = await self.get_team_events_next(team_id, limit=10)
         
         upcoming_games = []
+        today = datetime.now().date()
         for event in next_events:
-            game_data = self.parse_event(event, team_id, sport, league)
+            game_data = self.parse_event(event, team_id, sport, league, today=today)
             if game_data:
                 upcoming_games.append(game_data)
         
         return upcoming_games
 
-    def parse_event(self, event: Dict, team_id: str, sport: str, league: str) -> Optional[Dict]:
-        """Parse a TheSportsDB event and return structured data with timestamp for sorting"""
+    def parse_event(self, event: Dict, team_id: str, sport: str, league: str,
+                    today: Optional[date] = None) -> Optional[ParsedGame]:
+        """Parse a TheSportsDB event and return structured data with timestamp for sorting
+
+        Callers parsing many events can pass ``today`` (local date) so it is
+        computed once per request rather than once per event.
+        """
         try:
             # Extract team info
             home_team = event.get('strHomeTeam', '')
             away_team = event.get('strAwayTeam', '')
             home_score = event.get('intHomeScore', '')
             away_score = event.get('intAwayScore', '')
-            status = event.get('strStatus', 'UNKNOWN')
+            # Interned: a handful of distinct values repeated across every event
+            status = sys.intern(event.get('strStatus') or 'UNKNOWN')
             timestamp_str = event.get('strTimestamp', '')
             date_str = event.get('dateEvent', '')
             time_str = event.get('strTime', '')
@@ -153,13 +162,10 @@ class TheSportsDBClient:
             event_timestamp = None
             if timestamp_str:
                 try:
-                    # fromisoformat handles 'Z' in Python 3.11+, but we force UTC if naive
-                    dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=timezone.utc)
-                    event_timestamp = dt.timestamp()
+                    # Naive timestamps are treated as UTC
+                    dt, event_timestamp = parse_utc_timestamp(timestamp_str)
                     timestamp = event_timestamp
-                except:
+                except (ValueError, TypeError, OverflowError, OSError):
                     if date_str and time_str:
                         try:
                             dt_str = f"{date_str} {time_str}"
@@ -167,15 +173,20 @@ class TheSportsDBClient:
                             dt = dt.replace(tzinfo=timezone.utc)
                             event_timestamp = dt.timestamp()
                             timestamp = event_timestamp
-                        except: pass
+                        except (ValueError, TypeError, OverflowError, OSError):
+                            pass
+            
+            # Convert to local time once; both status branches reuse it
+            local_dt = dt.astimezone() if event_timestamp else None
             
             formatted = ""
             if status == 'Match Finished':
                 date_suffix = ""
                 if event_timestamp:
-                    dt = datetime.fromtimestamp(event_timestamp, tz=timezone.utc).astimezone()
-                    if dt.date() != datetime.now().date():
-                        date_suffix = f", {format_clean_date(dt)}"
+                    if today is None:
+                        today = datetime.now().date()
+                    if local_dt.date() != today:
+                        date_suffix = f", {format_clean_date(local_dt)}"
                 
                 if home_score and away_score:
                     if is_soccer(sport):
@@ -190,11 +201,12 @@ class TheSportsDBClient:
                     else:
                         formatted = f"{away_abbr} vs. {home_abbr} (Final{date_suffix})"
                 timestamp = 9999999998
+                sort_key = (SORT_FINAL, 0)
             else:
                 # Scheduled or TBD
                 if event_timestamp:
-                    dt = datetime.fromtimestamp(event_timestamp, tz=timezone.utc).astimezone()
-                    time_str_formatted = format_clean_date_time(dt)
+                    time_str_formatted = format_clean_date_time(local_dt)
+                    sort_key = (SORT_DATED, timestamp)
                     if is_soccer(sport):
                         formatted = f"@{home_abbr} vs. {away_abbr} ({time_str_formatted})"
                     else:
@@ -205,16 +217,19 @@ class TheSportsDBClient:
                     else:
                         formatted = f"{away_abbr} @ {home_abbr} (TBD)"
                     timestamp = 9999999999
+                    sort_key = (SORT_TBD, 0)
             
-            return {
-                'id': event.get('idEvent'),
-                'timestamp': timestamp,
-                'event_timestamp': event_timestamp,
-                'formatted': formatted,
-                'sport': sport,
-                'league': league,
-                'status': status
-            }
+            return ParsedGame(
+                id=event.get('idEvent'),
+                timestamp=timestamp,
+                sort_key=sort_key,
+                event_timestamp=event_timestamp,
+                formatted=formatted,
+                formatted_with_emoji=f"{SPORT_EMOJIS.get(sport, '🏆')} {formatted}",
+                sport=sport,
+                league=league,
+                status=status
+            )
         except Exception as e:
             self.logger.error(f"Error parsing TheSportsDB event {event.get('idEvent')}: {e}")
             return None
@@ -285,7 +300,7 @@ class TheSportsDBClient:
             self.logger.error(f"TheSportsDB get_events_by_day error: {e}")
             return []
 
-    async def fetch_league_scores(self, sport: str, league_name: str, league_id: str) -> List[Dict]:
+    async def fetch_league_scores(self, sport: str, league_name: str, league_id: str) -> List[ParsedGame]:
         """Fetch and parse league scores from multiple sources"""
         from datetime import timedelta
         
@@ -315,7 +330,7 @@ class TheSportsDBClient:
             for event in events:
                 event_id = event.get('idEvent')
                 if event_id and event_id not in seen_event_ids:
-                    parsed = self.parse_event(event, "", sport, league_name)
+                    parsed = self.parse_event(event, "", sport, league_name, today=today)
                     if parsed:
                         all_event_data.append(parsed)
                         seen_event_ids.add(event_id)
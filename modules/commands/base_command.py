@@ -5,10 +5,12 @@ Provides common functionality and interface for command implementations
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 import pytz
 import re
+import time
 from ..models import MeshMessage
 from ..security_utils import validate_pubkey_format
 
@@ -33,10 +35,10 @@ class BaseCommand(ABC):
     def __init__(self, bot):
         self.bot = bot
         self.logger = bot.logger
-        self._last_execution_time = 0
+        self._last_execution_time = float('-inf')
         
         # Per-user cooldown tracking (for commands that need per-user rate limiting)
-        self._user_cooldowns: Dict[str, float] = {}
+        self._user_cooldowns: OrderedDict[str, float] = OrderedDict()
         
         # Load allowed channels from config (standardized channel override)
         self.allowed_channels = self._load_allowed_channels()
@@ -375,12 +377,10 @@ class BaseCommand(ABC):
         if self.cooldown_seconds <= 0:
             return True, 0.0
         
-        import time
-        
         if user_id:
             # Per-user cooldown
-            last_exec = self._user_cooldowns.get(user_id, 0)
-            elapsed = time.time() - last_exec
+            last_exec = self._user_cooldowns.get(user_id, float('-inf'))
+            elapsed = time.monotonic() - last_exec
             remaining = self.cooldown_seconds - elapsed
             
             if remaining > 0:
@@ -388,7 +388,7 @@ class BaseCommand(ABC):
             return True, 0.0
         else:
             # Global cooldown (backward compatibility)
-            elapsed = time.time() - self._last_execution_time
+            elapsed = time.monotonic() - self._last_execution_time
             remaining = self.cooldown_seconds - elapsed
             
             if remaining > 0:
@@ -401,20 +401,22 @@ class BaseCommand(ABC):
         Args:
             user_id: User ID to record execution for. If None, records global execution.
         """
-        import time
-        current_time = time.time()
+        # Monotonic clock so wall-clock adjustments (NTP, DST) can't skew cooldowns
+        current_time = time.monotonic()
         
         if user_id:
-            # Per-user cooldown
-            self._user_cooldowns[user_id] = current_time
+            # Per-user cooldown; moving the user to the end keeps entries ordered
+            # by last execution time, oldest first
+            cooldowns = self._user_cooldowns
+            cooldowns[user_id] = current_time
+            cooldowns.move_to_end(user_id)
             
-            # Clean up old entries periodically to prevent memory growth
-            if len(self._user_cooldowns) > 1000:
-                cutoff = current_time - (self.cooldown_seconds * 2)
-                self._user_cooldowns = {
-                    k: v for k, v in self._user_cooldowns.items() 
-                    if v > cutoff
-                }
+            # Evict expired entries from the oldest end, so the dict only holds users
+            # still in cooldown. Active entries are never dropped, which would let a
+            # user bypass their cooldown.
+            cutoff = current_time - self.cooldown_seconds
+            while cooldowns and next(iter(cooldowns.values())) <= cutoff:
+                cooldowns.popitem(last=False)
         else:
             # Global cooldown (backward compatibility)
             self._last_execution_time = current_time
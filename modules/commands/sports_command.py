@@ -19,19 +19,25 @@ Team IDs should be periodically verified, especially after:
 - When users report "no games found" for known active teams
 """
 
+import asyncio
 from datetime import datetime, timezone
+from operator import attrgetter
 from typing import List, Dict, Optional, TYPE_CHECKING
 from .base_command import BaseCommand
 from ..models import MeshMessage
 from ..clients.espn_client import ESPNClient
 from ..clients.thesportsdb_client import TheSportsDBClient
 from ..clients.sports_mappings import (
-    SPORT_EMOJIS, TEAM_MAPPINGS, LEAGUE_MAPPINGS
+    TEAM_MAPPINGS, LEAGUE_MAPPINGS, ParsedGame
 )
 
 if TYPE_CHECKING:
     from ..core import MeshCoreBot
 
+# C-level sort key for parsed games (avoids a Python lambda call per comparison).
+# 'sort_key' is a (priority, start time) tuple set by the API clients.
+_SORT_KEY = attrgetter('sort_key')
+
 
 class SportsCommand(BaseCommand):
     """Handles sports commands with ESPN API integration"""
@@ -70,11 +76,13 @@ class SportsCommand(BaseCommand):
         # Keep sports_channels for backward compatibility (used in execute() for channel-specific team defaults)
         self.sports_channels = self.load_sports_channels()
         self.channel_overrides = self.load_channel_overrides()
+        # Cached once; plugin reload re-instantiates the command and picks up changes
+        self._sports_enabled = self.get_config_value('Sports_Command', 'sports_enabled', fallback=True, value_type='bool')
         
     def load_default_teams(self) -> List[str]:
         """Load default teams from config"""
         teams_str = self.get_config_value('Sports_Command', 'teams', fallback='seahawks,mariners,sounders,kraken', value_type='str')
-        return [team.strip().lower() for team in teams_str.split(',') if team.strip()]
+        return [team.strip().casefold() for team in teams_str.split(',') if team.strip()]
     
     def load_sports_channels(self) -> List[str]:
         """Load sports channels from config"""
@@ -89,7 +97,7 @@ class SportsCommand(BaseCommand):
             for override in overrides_str.split(','):
                 if '=' in override:
                     channel, team = override.strip().split('=', 1)
-                    overrides[channel.strip()] = team.strip().lower()
+                    overrides[channel.strip()] = team.strip().casefold()
         return overrides
     
     
@@ -109,10 +117,10 @@ class SportsCommand(BaseCommand):
         if not words:
             return False
         
-        first_word = words[0].lower()
+        first_word = words[0].casefold()
         
         for keyword in self.keywords:
-            if first_word == keyword.lower():
+            if first_word == keyword.casefold():
                 return True
         
         return False
@@ -120,8 +128,7 @@ class SportsCommand(BaseCommand):
     def can_execute(self, message: MeshMessage) -> bool:
         """Check if this command can execute with the given message"""
         # Check if sports command is enabled
-        sports_enabled = self.get_config_value('Sports_Command', 'sports_enabled', fallback=True, value_type='bool')
-        if not sports_enabled:
+        if not self._sports_enabled:
             return False
         
         # Channel access and cooldown are now handled by BaseCommand.can_execute()
@@ -131,6 +138,25 @@ class SportsCommand(BaseCommand):
     def get_help_text(self) -> str:
         return self.translate('commands.sports.help')
     
+    def _build_bounded(self, responses: List[str], limit: int = 130) -> str:
+        """Join responses with newlines, keeping as many leading entries as fit in limit.
+        
+        If even the first entry is too long, it is truncated with an ellipsis.
+        """
+        kept = []
+        total_len = 0
+        for response in responses:
+            # Account for the newline separator after the first entry
+            new_len = total_len + len(response) + (1 if kept else 0)
+            if new_len > limit:
+                break
+            kept.append(response)
+            total_len = new_len
+        
+        if not kept and responses:
+            return responses[0][:limit - 3] + "..."
+        
+        return "\n".join(kept)
     
     async def get_default_teams_scores(self) -> str:
         """Get scores for default teams, sorted by game time"""
@@ -153,40 +179,25 @@ class SportsCommand(BaseCommand):
             return self.translate('commands.sports.no_games_default')
         
         # Sort by game time (earliest first)
-        game_data.sort(key=lambda x: x['timestamp'])
-        
-        # Format responses with sport emojis
-        responses = []
-        for game in game_data:
-            sport_emoji = SPORT_EMOJIS.get(game['sport'], '🏆')
-            responses.append(f"{sport_emoji} {game['formatted']}")
-        
-        # Join responses with newlines and ensure under 130 characters
-        result = "\n".join(responses)
-        if len(result) > 130:
-            # If still too long, truncate the last response
-            while len(result) > 130 and len(responses) > 1:
-                responses.pop()
-                result = "\n".join(responses)
-            if len(result) > 130:
-                result = result[:127] + "..."
-        
-        return result
+        game_data.sort(key=_SORT_KEY)
+        
+        # Emoji-prefixed strings are precomputed by the API clients at parse time
+        responses = [game.formatted_with_emoji for game in game_data]
+        
+        return self._build_bounded(responses)
     
     def get_league_info(self, league_name: str) -> Optional[Dict[str, str]]:
-        """Get league information for league queries"""
-        return LEAGUE_MAPPINGS.get(league_name.lower())
+        """Get league information for league queries (league_name must already be casefolded)"""
+        return LEAGUE_MAPPINGS.get(league_name)
     
     def get_city_teams(self, city_name: str) -> List[Dict[str, str]]:
-        """Get all teams for a given city"""
-        city_name_lower = city_name.lower()
-        
+        """Get all teams for a given city (city_name must already be casefolded)"""
         # Define city mappings to team names
         city_mappings = {
             'seattle': ['seahawks', 'mariners', 'sounders', 'kraken', 'reign', 'storm', 'torrent'],
             'chicago': ['bears', 'cubs', 'white sox', 'fire', 'sky', 'blackhawks'],
-            'new york': ['giants', 'jets', 'yankees', 'mets', 'knicks', 'nyc fc', 'red bulls', 'liberty', 'rangers', 'islanders'],  # Add PWHL New York when team_id verified
-            'ny': ['giants', 'jets', 'yankees', 'mets', 'knicks', 'nyc fc', 'red bulls', 'liberty', 'rangers', 'islanders'],  # Add PWHL New York when team_id verified
+            'new york': ['nyg', 'nyj', 'yankees', 'mets', 'knicks', 'nyc fc', 'red bulls', 'liberty', 'rangers', 'islanders'],  # Add PWHL New York when team_id verified
+            'ny': ['nyg', 'nyj', 'yankees', 'mets', 'knicks', 'nyc fc', 'red bulls', 'liberty', 'rangers', 'islanders'],  # Add PWHL New York when team_id verified
             'los angeles': ['rams', 'dodgers', 'lakers', 'la galaxy', 'lafc', 'sparks'],
             'la': ['rams', 'dodgers', 'lakers', 'la galaxy', 'lafc', 'sparks'],
             'miami': ['dolphins', 'marlins', 'heat', 'inter miami'],
@@ -194,7 +205,7 @@ class SportsCommand(BaseCommand):
             'philadelphia': ['eagles', 'phillies', '76ers', 'union'],
             'atlanta': ['falcons', 'braves', 'hawks', 'atlanta united', 'dream'],
             'houston': ['texans', 'astros', 'dynamo'],
-            'dallas': ['cowboys', 'rangers', 'stars', 'fc dallas', 'wings'],
+            'dallas': ['cowboys', 'texas', 'stars', 'fc dallas', 'wings'],
             'denver': ['broncos', 'rockies', 'rapids'],
             'detroit': ['lions', 'tigers', 'pistons'],
             'minnesota': ['vikings', 'twins', 'timberwolves', 'minnesota united', 'lynx', 'wild'],  # Add PWHL Minnesota when team_id verified
@@ -267,7 +278,7 @@ class SportsCommand(BaseCommand):
         }
         
         # Get team names for this city
-        team_names = city_mappings.get(city_name_lower, [])
+        team_names = city_mappings.get(city_name, [])
         if not team_names:
             return []
         
@@ -299,25 +310,12 @@ class SportsCommand(BaseCommand):
             return self.translate('commands.sports.no_games_city', city=city_name)
         
         # Sort by game time (earliest first)
-        game_data.sort(key=lambda x: x['timestamp'])
-        
-        # Format responses with sport emojis
-        responses = []
-        for game in game_data:
-            sport_emoji = SPORT_EMOJIS.get(game['sport'], '🏆')
-            responses.append(f"{sport_emoji} {game['formatted']}")
-        
-        # Join responses with newlines and ensure under 130 characters
-        result = "\n".join(responses)
-        if len(result) > 130:
-            # If still too long, truncate the last response
-            while len(result) > 130 and len(responses) > 1:
-                responses.pop()
-                result = "\n".join(responses)
-            if len(result) > 130:
-                result = result[:127] + "..."
-        
-        return result
+        game_data.sort(key=_SORT_KEY)
+        
+        # Emoji-prefixed strings are precomputed by the API clients at parse time
+        responses = [game.formatted_with_emoji for game in game_data]
+        
+        return self._build_bounded(responses)
     
     async def get_league_scores(self, league_info: Dict[str, str]) -> str:
         """Get upcoming games for a league"""
@@ -336,25 +334,13 @@ class SportsCommand(BaseCommand):
                 return self.translate('commands.sports.no_games_league', sport=league_info['sport'])
             
             # Sort by game time (earliest first)
-            game_data.sort(key=lambda x: x['timestamp'])
-            
-            # Format responses with sport emojis
-            responses = []
-            for game in game_data[:5]:  # Limit to 5 games to keep under 130 chars
-                sport_emoji = SPORT_EMOJIS.get(game['sport'], '🏆')
-                responses.append(f"{sport_emoji} {game['formatted']}")
-            
-            # Join responses with newlines and ensure under 130 characters
-            result = "\n".join(responses)
-            if len(result) > 130:
-                # If still too long, truncate the last response
-                while len(result) > 130 and len(responses) > 1:
-                    responses.pop()
-                    result = "\n".join(responses)
-                if len(result) > 130:
-                    result = result[:127] + "..."
+            game_data.sort(key=_SORT_KEY)
             
-            return result
+            # Emoji-prefixed strings are precomputed by the API clients at parse time
+            # Limit to 5 games to keep under 130 chars
+            responses = [game.formatted_with_emoji for game in game_data[:5]]
+            
+            return self._build_bounded(responses)
             
         except Exception as e:
             self.logger.error(f"Error fetching league scores: {e}")
@@ -381,28 +367,9 @@ class SportsCommand(BaseCommand):
                 return self.translate('commands.sports.no_recent_scores', sport=league_info['sport'])
             
             # Sort by timestamp
-            all_event_data.sort(key=lambda x: x['timestamp'])
-            
-            # Format responses with sport emojis
-            sport_emoji = SPORT_EMOJIS.get(league_info['sport'], '🏆')
-            responses = []
-            current_length = 0
-            max_length = 130
-            
-            for game in all_event_data:
-                game_str = f"{sport_emoji} {game['formatted']}"
-                if responses:
-                    test_length = current_length + len("\n") + len(game_str)
-                else:
-                    test_length = len(game_str)
-                
-                if test_length <= max_length:
-                    responses.append(game_str)
-                    current_length = test_length
-                else:
-                    break
+            all_event_data.sort(key=_SORT_KEY)
             
-            return "\n".join(responses)
+            return self._build_bounded([game.formatted_with_emoji for game in all_event_data])
             
         except Exception as e:
             self.logger.error(f"Error getting league scores from TheSportsDB: {e}")
@@ -412,7 +379,7 @@ class SportsCommand(BaseCommand):
     
     
     async def get_team_scores(self, team_name: str) -> str:
-        """Get scores for a specific team or league"""
+        """Get scores for a specific team or league (team_name must already be casefolded)"""
         # Check if this is a schedule query (team_name ends with " schedule")
         is_schedule_query = team_name.endswith(' schedule')
         if is_schedule_query:
@@ -474,43 +441,9 @@ class SportsCommand(BaseCommand):
         
         # Format games to fit within message limit (130 characters)
         # Use 125 as a buffer to avoid cutting off mid-game
-        sport_emoji = SPORT_EMOJIS.get(team_info['sport'], '🏆')
-        formatted_games = []
-        current_length = 0
-        max_length = 125  # Leave buffer to avoid cutoff
-        
-        for game in games:
-            # Ensure game['formatted'] doesn't already have an emoji
-            game_formatted = game['formatted'].strip()
-            # Remove emoji if it's at the start (some games might have it)
-            if game_formatted and game_formatted[0] in SPORT_EMOJIS.values():
-                game_formatted = game_formatted[1:].strip()
-            
-            game_str = f"{sport_emoji} {game_formatted}"
-            # Check if adding this game would exceed limit
-            if formatted_games:
-                # Account for newline separator
-                test_length = current_length + len("\n") + len(game_str)
-            else:
-                test_length = len(game_str)
-            
-            if test_length <= max_length:
-                formatted_games.append(game_str)
-                current_length = test_length
-            else:
-                # Can't fit more games - stop before exceeding limit
-                break
-        
-        if not formatted_games:
-            # If even the first game doesn't fit, return it anyway (truncated)
-            game_formatted = games[0]['formatted'].strip()
-            if game_formatted and game_formatted[0] in SPORT_EMOJIS.values():
-                game_formatted = game_formatted[1:].strip()
-            return f"{sport_emoji} {game_formatted[:120]}"
-        
-        return "\n".join(formatted_games)
+        return self._build_bounded([game.formatted_with_emoji for game in games], limit=125)
     
-    async def fetch_team_games(self, team_info: Dict[str, str]) -> List[Dict]:
+    async def fetch_team_games(self, team_info: Dict[str, str]) -> List[ParsedGame]:
         """Fetch multiple games for a team: current/next game plus past results
         
         Uses the team schedule endpoint which returns both past and upcoming games
@@ -539,17 +472,21 @@ class SportsCommand(BaseCommand):
             # Track event IDs for live games to fetch real-time scores
             live_event_ids = []
             for i, game_data in enumerate(all_games):
-                if game_data['timestamp'] < 0:  # Negative timestamp indicates live game
-                    event_id = game_data.get('id')
+                if game_data.timestamp < 0:  # Negative timestamp indicates live game
+                    event_id = game_data.id
                     if event_id:
                         live_event_ids.append((event_id, i))
             
-            # Fetch live event data for live games to get real-time scores
-            for event_id, game_index in live_event_ids:
+            # Fetch live event data for all live games concurrently to get real-time scores
+            live_results = await asyncio.gather(
+                *(self.espn_client.fetch_live_event_data(event_id, team_info['sport'], team_info['league'])
+                  for event_id, _ in live_event_ids),
+                return_exceptions=True
+            )
+            for (event_id, game_index), live_event_data in zip(live_event_ids, live_results):
                 try:
-                    live_event_data = await self.espn_client.fetch_live_event_data(
-                        event_id, team_info['sport'], team_info['league']
-                    )
+                    if isinstance(live_event_data, Exception):
+                        raise live_event_data
                     if live_event_data:
                         # Update the game data with live scores
                         updated_game = self.espn_client.parse_game_event_with_timestamp(
@@ -562,7 +499,7 @@ class SportsCommand(BaseCommand):
             
             # Sort by timestamp (negative for live games, then by actual timestamp)
             # This prioritizes: live games > upcoming games > recent past games
-            all_games.sort(key=lambda x: x['timestamp'])
+            all_games.sort(key=_SORT_KEY)
             
             # Get current time for comparison
             now = datetime.now(timezone.utc).timestamp()
@@ -572,19 +509,19 @@ class SportsCommand(BaseCommand):
             six_weeks_from_now = now + (6 * 7 * 24 * 60 * 60)
             
             # Separate into categories
-            live_games = [g for g in all_games if g['timestamp'] < 0]  # Negative timestamps = live
+            live_games = [g for g in all_games if g.timestamp < 0]  # Negative timestamps = live
             upcoming_games = []
             past_games = []
             
             # Categorize games with positive timestamps
             for game in all_games:
-                if game['timestamp'] < 0:
+                if game.timestamp < 0:
                     continue  # Already in live_games
                 
-                game_event_ts = game.get('event_timestamp')
-                effective_ts = game_event_ts if game_event_ts is not None else game['timestamp']
+                game_event_ts = game.event_timestamp
+                effective_ts = game_event_ts if game_event_ts is not None else game.timestamp
                 
-                if game['timestamp'] >= 9999999990 and game_event_ts is None:
+                if game.timestamp >= 9999999990 and game_event_ts is None:
                     # No real timestamp available, treat as past
                     past_games.append((effective_ts, game))
                 elif effective_ts is None:
@@ -626,7 +563,7 @@ class SportsCommand(BaseCommand):
             self.logger.error(f"Error fetching team games: {e}")
             return []
     
-    async def fetch_team_games_thesportsdb(self, team_info: Dict[str, str]) -> List[Dict]:
+    async def fetch_team_games_thesportsdb(self, team_info: Dict[str, str]) -> List[ParsedGame]:
         """Fetch team games from TheSportsDB API via client"""
         if not self.thesportsdb_client:
             self.logger.error("TheSportsDB client not initialized")
@@ -636,7 +573,7 @@ class SportsCommand(BaseCommand):
             team_info['sport'], team_info['league'], team_info['team_id']
         )
     
-    async def fetch_team_game_data(self, team_info: Dict[str, str]) -> Optional[Dict]:
+    async def fetch_team_game_data(self, team_info: Dict[str, str]) -> Optional[ParsedGame]:
         """Fetch structured game data for a team with timestamp for sorting
         
         Uses the team schedule endpoint which returns both past and upcoming games
@@ -646,7 +583,7 @@ class SportsCommand(BaseCommand):
         games = await self.fetch_team_games(team_info)
         return games[0] if games else None
     
-    async def fetch_team_schedule(self, team_info: Dict[str, str]) -> List[Dict]:
+    async def fetch_team_schedule(self, team_info: Dict[str, str]) -> List[ParsedGame]:
         """Fetch upcoming scheduled games for a team
         
         Returns as many upcoming games as available from the schedule endpoint.
@@ -677,22 +614,22 @@ class SportsCommand(BaseCommand):
             # We already have parsed games, but we need to filter/re-format them for schedule view
             for game_data in all_games:
                 # Check if game is in the future or started very recently
-                ts = game_data.get('event_timestamp') or game_data['timestamp']
+                ts = game_data.event_timestamp or game_data.timestamp
                 
                 # If timestamp is negative (live), it's definitely something we could show
                 # Otherwise check if it's in the future or within the last hour
-                if game_data['timestamp'] < 0 or ts >= one_hour_ago:
+                if game_data.timestamp < 0 or ts >= one_hour_ago:
                     parsed_games.append(game_data)
             
             # Sort by soonest first
-            parsed_games.sort(key=lambda x: x.get('event_timestamp') or x['timestamp'])
+            parsed_games.sort(key=lambda x: x.event_timestamp or x.timestamp)
             return parsed_games
             
         except Exception as e:
             self.logger.error(f"Error fetching team schedule: {e}")
             return []
     
-    async def fetch_team_schedule_thesportsdb(self, team_info: Dict[str, str]) -> List[Dict]:
+    async def fetch_team_schedule_thesportsdb(self, team_info: Dict[str, str]) -> List[ParsedGame]:
         """Fetch upcoming scheduled games for a team from TheSportsDB via client"""
         if not self.thesportsdb_client:
             return []
@@ -712,41 +649,7 @@ class SportsCommand(BaseCommand):
         
         # Format games to fit within message limit (130 characters)
         # Use 125 as a buffer to avoid cutting off mid-game
-        sport_emoji = SPORT_EMOJIS.get(team_info['sport'], '🏆')
-        formatted_games = []
-        current_length = 0
-        max_length = 125  # Leave buffer to avoid cutoff
-        
-        for game in games:
-            # Ensure game['formatted'] doesn't already have an emoji
-            game_formatted = game['formatted'].strip()
-            # Remove emoji if it's at the start (some games might have it)
-            if game_formatted and game_formatted[0] in SPORT_EMOJIS.values():
-                game_formatted = game_formatted[1:].strip()
-            
-            game_str = f"{sport_emoji} {game_formatted}"
-            # Check if adding this game would exceed limit
-            if formatted_games:
-                # Account for newline separator
-                test_length = current_length + len("\n") + len(game_str)
-            else:
-                test_length = len(game_str)
-            
-            if test_length <= max_length:
-                formatted_games.append(game_str)
-                current_length = test_length
-            else:
-                # Can't fit more games - stop before exceeding limit
-                break
-        
-        if not formatted_games:
-            # If even the first game doesn't fit, return it anyway (truncated)
-            game_formatted = games[0]['formatted'].strip()
-            if game_formatted and game_formatted[0] in SPORT_EMOJIS.values():
-                game_formatted = game_formatted[1:].strip()
-            return f"{sport_emoji} {game_formatted[:120]}"
-        
-        return "\n".join(formatted_games)
+        return self._build_bounded([game.formatted_with_emoji for game in games], limit=125)
 
     async def execute(self, message: MeshMessage) -> bool:
         """Main entry point for command execution"""
@@ -758,9 +661,9 @@ class SportsCommand(BaseCommand):
             if content.startswith('!'):
                 content = content[1:].strip()
             
-            # Parse command: !sports [query]
-            parts = content.split(' ', 1)
-            if len(parts) < 2:
+            # Parse command: !sports [query] - partition slices the query straight off the content
+            _, _, query = content.partition(' ')
+            if not query:
                 # Check if this channel has an override team
                 if not message.is_dm and message.channel in self.channel_overrides:
                     override_team = self.channel_overrides[message.channel]
@@ -769,7 +672,8 @@ class SportsCommand(BaseCommand):
                     response = await self.get_default_teams_scores()
                 return await self.send_response(message, response)
             
-            query = parts[1].strip()
+            # Casefold once here; the lookup helpers expect normalized input
+            query = query.strip().casefold()
             
             # Check if it's a league query (e.g., "nfl", "mlb", etc.)
             league_info = self.get_league_info(query)
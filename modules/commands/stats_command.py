@@ -4,13 +4,29 @@ Stats command for the MeshCore Bot
 Provides comprehensive statistics about bot usage, messages, and activity
 """
 
+import re
 import time
+import asyncio
 import sqlite3
+import hashlib
+import threading
+from functools import lru_cache
+from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 from .base_command import BaseCommand
 from ..models import MeshMessage
 
+# Node IDs in a message path: bare hex, or hex with comma separators
+_HEX_RE = re.compile(r'[0-9a-fA-F]+')
+_HEX_PATH_RE = re.compile(r'[0-9a-fA-F,]+')
+
+
+@lru_cache(maxsize=4096)
+def _anonymize_sender(sender_id: str) -> str:
+    """Map a sender ID to a stable pseudonym (memoized; senders repeat constantly)."""
+    return f"user_{hashlib.md5(sender_id.encode()).hexdigest()[:8]}"
+
 
 class StatsCommand(BaseCommand):
     """Handles the stats command with comprehensive data collection.
@@ -25,6 +41,47 @@ class StatsCommand(BaseCommand):
     description = "Show statistics for past 24 hours. Use 'stats messages', 'stats channels', or 'stats paths' for specific stats."
     category = "analytics"
     
+    # Buffered rows are written once this many are pending; the scheduler
+    # also flushes every couple of seconds
+    FLUSH_THRESHOLD = 100
+    # If the database stays locked, retry with backoff up to this many seconds,
+    # holding at most this many rows in memory meanwhile
+    MAX_FLUSH_BACKOFF = 60.0
+    MAX_PENDING_ROWS = 10000
+    # Seconds a formatted stats response is reused before being re-queried
+    RESPONSE_CACHE_TTL = 30
+    # Minimum seconds between automatic cleanups, and rows deleted per transaction
+    CLEANUP_INTERVAL = 3600
+    CLEANUP_BATCH_SIZE = 5000
+    
+    # Subcommand name -> leaderboard method
+    _SUBCOMMANDS = {
+        'messages': '_get_bot_user_leaderboard',
+        'message': '_get_bot_user_leaderboard',
+        'channels': '_get_channel_leaderboard',
+        'channel': '_get_channel_leaderboard',
+        'paths': '_get_path_leaderboard',
+        'path': '_get_path_leaderboard',
+    }
+    
+    # Insert statements, kept as constants so the write connection's statement
+    # cache always sees the identical string
+    _INSERT_MESSAGE_SQL = '''
+        INSERT INTO message_stats 
+        (timestamp, sender_id, channel, content, is_dm, hops, snr, rssi, path)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    _INSERT_COMMAND_SQL = '''
+        INSERT INTO command_stats 
+        (timestamp, sender_id, command_name, channel, is_dm, response_sent)
+        VALUES (?, ?, ?, ?, ?, ?)
+    '''
+    _INSERT_PATH_SQL = '''
+        INSERT INTO path_stats 
+        (timestamp, sender_id, channel, path_length, path_string, hops)
+        VALUES (?, ?, ?, ?, ?, ?)
+    '''
+    
     def __init__(self, bot: Any):
         """Initialize the stats command.
         
@@ -32,6 +89,24 @@ class StatsCommand(BaseCommand):
             bot: The bot instance.
         """
         super().__init__(bot)
+        # One long-lived connection for inserts (record_* run on several threads)
+        # and a separate read-only one for the leaderboard queries
+        self._write_lock = threading.Lock()
+        self._write_conn: Optional[sqlite3.Connection] = None
+        self._write_cursor: Optional[sqlite3.Cursor] = None
+        self._read_conn: Optional[sqlite3.Connection] = None
+        # Rows are queued here and written in batches by flush_stats()
+        self._buffer_lock = threading.Lock()
+        self._message_buffer: List[Tuple] = []
+        self._command_buffer: List[Tuple] = []
+        self._path_buffer: List[Tuple] = []
+        self._flush_backoff = 0.0
+        self._flush_retry_at = 0.0
+        self._flush_task: Optional[asyncio.Task] = None
+        # Formatted responses by kind: (expiry monotonic time, response)
+        self._response_cache: Dict[str, Tuple[float, str]] = {}
+        self._last_cleanup_time = float('-inf')
+        self._cleanup_task: Optional[asyncio.Task] = None
         self._load_config()
         self._init_stats_tables()
     
@@ -44,6 +119,48 @@ class StatsCommand(BaseCommand):
         self.track_command_details = self.get_config_value('Stats_Command', 'track_command_details', fallback=True, value_type='bool')
         self.anonymize_users = self.get_config_value('Stats_Command', 'anonymize_users', fallback=False, value_type='bool')
     
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a connection to the stats database tuned for frequent small writes.
+        
+        Args:
+            read_only: Open the database in read-only mode.
+        
+        Returns:
+            sqlite3.Connection: Connection with the per-connection PRAGMAs applied.
+        """
+        if read_only:
+            uri = Path(self.bot.db_manager.db_path).resolve().as_uri() + '?mode=ro'
+            conn = sqlite3.connect(uri, uri=True, timeout=5.0, check_same_thread=False)
+        else:
+            # IMMEDIATE takes the write lock up front, so a busy writer is waited
+            # on via the timeout instead of failing mid-batch
+            conn = sqlite3.connect(self.bot.db_manager.db_path, timeout=5.0, check_same_thread=False,
+                                   isolation_level='IMMEDIATE')
+        # NORMAL is durable under WAL except on power loss, where at most the
+        # last few stats rows can be lost
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-64000')
+        return conn
+    
+    def _get_read_connection(self) -> sqlite3.Connection:
+        """Get the cached read-only connection, opening it on first use."""
+        if self._read_conn is None:
+            self._read_conn = self._connect(read_only=True)
+        return self._read_conn
+    
+    def close(self) -> None:
+        """Flush buffered rows and close the cached database connections."""
+        # Final attempt even during a busy backoff; rows still unwritten are dropped
+        self.flush_stats(force=True)
+        with self._write_lock:
+            for conn in (self._write_conn, self._read_conn):
+                if conn is not None:
+                    conn.close()
+            self._write_conn = None
+            self._write_cursor = None
+            self._read_conn = None
+    
     def _init_stats_tables(self) -> None:
         """Initialize database tables for stats tracking.
         
@@ -51,7 +168,12 @@ class StatsCommand(BaseCommand):
         don't already exist. Also sets up necessary indexes for performance.
         """
         try:
-            with sqlite3.connect(self.bot.db_manager.db_path) as conn:
+            self._write_conn = self._connect()
+            self._write_cursor = self._write_conn.cursor()
+            with self._write_lock, self._write_conn as conn:
+                # WAL lets the leaderboard reads run alongside inserts and drops
+                # an fsync per commit; the journal mode persists in the file
+                conn.execute('PRAGMA journal_mode=WAL')
                 cursor = conn.cursor()
                 
                 # Create message_stats table for tracking all messages
@@ -62,7 +184,7 @@ class StatsCommand(BaseCommand):
                         sender_id TEXT NOT NULL,
                         channel TEXT,
                         content TEXT NOT NULL,
-                        is_dm BOOLEAN NOT NULL,
+                        is_dm INTEGER NOT NULL,
                         hops INTEGER,
                         snr REAL,
                         rssi INTEGER,
@@ -79,8 +201,8 @@ class StatsCommand(BaseCommand):
                         sender_id TEXT NOT NULL,
                         command_name TEXT NOT NULL,
                         channel TEXT,
-                        is_dm BOOLEAN NOT NULL,
-                        response_sent BOOLEAN NOT NULL,
+                        is_dm INTEGER NOT NULL,
+                        response_sent INTEGER NOT NULL,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     )
                 ''')
@@ -99,16 +221,20 @@ class StatsCommand(BaseCommand):
                     )
                 ''')
                 
-                # Create indexes for better performance
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_message_timestamp ON message_stats(timestamp)')
+                # Create indexes for better performance. The 24h leaderboards filter
+                # on timestamp, so the composite indexes lead with it and carry the
+                # grouped columns to let those queries run from the index alone.
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_msg_ts_channel ON message_stats(timestamp, channel, sender_id)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_message_sender ON message_stats(sender_id)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_message_channel ON message_stats(channel)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_command_timestamp ON command_stats(timestamp)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_command_sender ON command_stats(sender_id)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_cmd_ts_sender ON command_stats(timestamp, sender_id, command_name, response_sent)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_command_name ON command_stats(command_name)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_path_timestamp ON path_stats(timestamp)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_path_ts_sender_len ON path_stats(timestamp, sender_id, path_length)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_path_length ON path_stats(path_length)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_path_sender ON path_stats(sender_id)')
+                
+                # Single-column indexes superseded by the composites above
+                for index_name in ('idx_message_timestamp', 'idx_message_channel', 'idx_command_timestamp',
+                                   'idx_command_sender', 'idx_path_timestamp', 'idx_path_sender'):
+                    cursor.execute(f'DROP INDEX IF EXISTS {index_name}')
                 
                 conn.commit()
                 self.logger.info("Stats tables initialized successfully")
@@ -117,6 +243,106 @@ class StatsCommand(BaseCommand):
             self.logger.error(f"Failed to initialize stats tables: {e}")
             raise
     
+    def _get_cached_response(self, kind: str) -> Optional[str]:
+        """Get a still-fresh cached stats response.
+        
+        Args:
+            kind: The response kind (basic, users, channels or paths).
+        
+        Returns:
+            Optional[str]: The cached response, or None if missing or expired.
+        """
+        entry = self._response_cache.get(kind)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+    
+    def _cache_response(self, kind: str, response: str) -> str:
+        """Cache a stats response for RESPONSE_CACHE_TTL seconds and return it."""
+        self._response_cache[kind] = (time.monotonic() + self.RESPONSE_CACHE_TTL, response)
+        return response
+    
+    def _stats_sender_id(self, message: MeshMessage) -> str:
+        """Get the sender ID to store for a message, anonymized if configured."""
+        sender_id = message.sender_id or 'unknown'
+        if self.anonymize_users and sender_id != 'unknown':
+            return _anonymize_sender(sender_id)
+        return sender_id
+    
+    def _buffer_row(self, buffer: List[Tuple], row: Tuple) -> None:
+        """Queue a stats row, flushing once enough rows are pending.
+        
+        On the event loop the flush is handed to a worker thread so packet
+        handling never waits on the database.
+        
+        Args:
+            buffer: The per-table buffer to append to.
+            row: The column values to insert.
+        """
+        with self._buffer_lock:
+            buffer.append(row)
+            pending = len(self._message_buffer) + len(self._command_buffer) + len(self._path_buffer)
+        if pending < self.FLUSH_THRESHOLD:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_stats()
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(asyncio.to_thread(self.flush_stats))
+    
+    def flush_stats(self, force: bool = False) -> None:
+        """Write all buffered stats rows to the database in one transaction.
+        
+        Args:
+            force: Ignore any busy backoff and don't re-queue rows on failure
+                (used for the final flush at shutdown).
+        """
+        if not force and time.monotonic() < self._flush_retry_at:
+            return
+        with self._buffer_lock:
+            messages, self._message_buffer = self._message_buffer, []
+            commands, self._command_buffer = self._command_buffer, []
+            paths, self._path_buffer = self._path_buffer, []
+        if not (messages or commands or paths):
+            return
+        
+        try:
+            # The write connection begins IMMEDIATE, so the write lock is taken
+            # (waiting up to the busy timeout) before any row is inserted
+            with self._write_lock, self._write_conn:
+                cursor = self._write_cursor
+                if messages:
+                    cursor.executemany(self._INSERT_MESSAGE_SQL, messages)
+                if commands:
+                    cursor.executemany(self._INSERT_COMMAND_SQL, commands)
+                if paths:
+                    cursor.executemany(self._INSERT_PATH_SQL, paths)
+            self._flush_backoff = 0.0
+        except sqlite3.OperationalError as e:
+            if 'locked' not in str(e) and 'busy' not in str(e):
+                self.logger.error(f"Error writing stats ({len(messages)} messages, {len(commands)} commands, {len(paths)} paths): {e}")
+                return
+            if force:
+                self.logger.error(f"Stats database busy, dropping {len(messages)} messages, {len(commands)} commands, {len(paths)} paths: {e}")
+                return
+            # Still locked after the busy timeout: keep the rows and back off
+            # before trying again, unless the backlog has grown too large
+            self._flush_backoff = min(max(self._flush_backoff * 2, 1.0), self.MAX_FLUSH_BACKOFF)
+            self._flush_retry_at = time.monotonic() + self._flush_backoff
+            with self._buffer_lock:
+                pending = len(self._message_buffer) + len(self._command_buffer) + len(self._path_buffer)
+                if pending + len(messages) + len(commands) + len(paths) <= self.MAX_PENDING_ROWS:
+                    self._message_buffer[:0] = messages
+                    self._command_buffer[:0] = commands
+                    self._path_buffer[:0] = paths
+                    self.logger.warning(f"Stats database busy, retrying in {self._flush_backoff:.0f}s: {e}")
+                    return
+            self.logger.error(f"Stats database busy, dropping {len(messages)} messages, {len(commands)} commands, {len(paths)} paths: {e}")
+        except Exception as e:
+            self.logger.error(f"Error writing stats ({len(messages)} messages, {len(commands)} commands, {len(paths)} paths): {e}")
+    
     def record_message(self, message: MeshMessage) -> None:
         """Record a message in the stats database.
         
@@ -127,31 +353,19 @@ class StatsCommand(BaseCommand):
             return
             
         try:
-            # Anonymize user if configured
-            sender_id = message.sender_id or 'unknown'
-            if self.anonymize_users and sender_id != 'unknown':
-                # Create a simple hash-based anonymization
-                import hashlib
-                sender_id = f"user_{hashlib.md5(sender_id.encode()).hexdigest()[:8]}"
+            sender_id = self._stats_sender_id(message)
             
-            with sqlite3.connect(self.bot.db_manager.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO message_stats 
-                    (timestamp, sender_id, channel, content, is_dm, hops, snr, rssi, path)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    message.timestamp or int(time.time()),
-                    sender_id,
-                    message.channel,
-                    message.content,
-                    message.is_dm,
-                    message.hops,
-                    message.snr,
-                    message.rssi,
-                    message.path
-                ))
-                conn.commit()
+            self._buffer_row(self._message_buffer, (
+                message.timestamp or int(time.time()),
+                sender_id,
+                message.channel,
+                message.content,
+                1 if message.is_dm else 0,
+                message.hops,
+                message.snr,
+                message.rssi,
+                message.path
+            ))
         except Exception as e:
             self.logger.error(f"Error recording message stats: {e}")
     
@@ -167,28 +381,16 @@ class StatsCommand(BaseCommand):
             return
             
         try:
-            # Anonymize user if configured
-            sender_id = message.sender_id or 'unknown'
-            if self.anonymize_users and sender_id != 'unknown':
-                # Create a simple hash-based anonymization
-                import hashlib
-                sender_id = f"user_{hashlib.md5(sender_id.encode()).hexdigest()[:8]}"
+            sender_id = self._stats_sender_id(message)
             
-            with sqlite3.connect(self.bot.db_manager.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO command_stats 
-                    (timestamp, sender_id, command_name, channel, is_dm, response_sent)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    message.timestamp or int(time.time()),
-                    sender_id,
-                    command_name,
-                    message.channel,
-                    message.is_dm,
-                    response_sent
-                ))
-                conn.commit()
+            self._buffer_row(self._command_buffer, (
+                message.timestamp or int(time.time()),
+                sender_id,
+                command_name,
+                message.channel,
+                1 if message.is_dm else 0,
+                1 if response_sent else 0
+            ))
         except Exception as e:
             self.logger.error(f"Error recording command stats: {e}")
     
@@ -211,30 +413,19 @@ class StatsCommand(BaseCommand):
             return
             
         try:
-            # Anonymize user if configured
-            sender_id = message.sender_id or 'unknown'
-            if self.anonymize_users and sender_id != 'unknown':
-                import hashlib
-                sender_id = f"user_{hashlib.md5(sender_id.encode()).hexdigest()[:8]}"
+            sender_id = self._stats_sender_id(message)
             
             # Format the path string properly (e.g., "75,24,1d,5f,bd")
             path_string = self._format_path_for_display(message.path)
             
-            with sqlite3.connect(self.bot.db_manager.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO path_stats 
-                    (timestamp, sender_id, channel, path_length, path_string, hops)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    message.timestamp or int(time.time()),
-                    sender_id,
-                    message.channel,
-                    message.hops,  # Use hops as path length
-                    path_string,
-                    message.hops
-                ))
-                conn.commit()
+            self._buffer_row(self._path_buffer, (
+                message.timestamp or int(time.time()),
+                sender_id,
+                message.channel,
+                message.hops,  # Use hops as path length
+                path_string,
+                message.hops
+            ))
         except Exception as e:
             self.logger.error(f"Error recording path stats: {e}")
     
@@ -247,25 +438,10 @@ class StatsCommand(BaseCommand):
         Returns:
             bool: True if the path structure appears valid, False otherwise.
         """
-        if not path:
-            return False
-        
-        # If path contains spaces and common descriptive words, it's likely descriptive text
-        descriptive_words = ['routed', 'through', 'hops', 'direct', 'unknown', 'path']
-        path_lower = path.lower()
-        
-        if any(word in path_lower for word in descriptive_words):
-            return False
-        
-        # If path contains only hex characters and commas, it's valid
-        if all(c in '0123456789abcdefABCDEF,' for c in path):
-            return True
-        
-        # If path is a single hex string without separators, it's valid
-        if all(c in '0123456789abcdefABCDEF' for c in path) and len(path) >= 2:
-            return True
-        
-        return False
+        # Only hex node IDs and commas are valid. Descriptive text such as
+        # "Routed through 3 hops" always contains non-hex letters, so this one
+        # check also rejects it.
+        return bool(path) and _HEX_PATH_RE.fullmatch(path) is not None
     
     def _format_path_for_display(self, path: str) -> str:
         """Format path string for display (e.g., '75,24,1d,5f,bd').
@@ -283,15 +459,10 @@ class StatsCommand(BaseCommand):
         if ',' in path:
             return path
         
-        # If path contains descriptive text (like "Routed through X hops"), 
-        # extract just the numeric part or return as-is
-        if ' ' in path and not all(c in '0123456789abcdefABCDEF' for c in path.replace(' ', '')):
-            # This looks like descriptive text, return as-is
-            return path
-        
         # If path is a hex string without separators, add commas every 2 characters
-        # But only if it looks like a hex string (all hex characters)
-        if len(path) > 2 and ',' not in path and all(c in '0123456789abcdefABCDEF' for c in path):
+        # But only if it looks like a hex string (all hex characters); descriptive
+        # text (like "Routed through X hops") is returned as-is
+        if len(path) > 2 and _HEX_RE.fullmatch(path):
             # Split into 2-character chunks and join with commas
             formatted = ','.join([path[i:i+2] for i in range(0, len(path), 2)])
             return formatted
@@ -324,9 +495,16 @@ class StatsCommand(BaseCommand):
             return False
             
         try:
-            # Perform automatic cleanup if enabled
-            if self.auto_cleanup:
-                self.cleanup_old_stats(self.data_retention_days)
+            # Make queued rows visible to the queries below; the flush can wait on the
+            # write lock and busy timeout, so keep it off the event loop
+            await asyncio.to_thread(self.flush_stats)
+            
+            # Perform automatic cleanup if enabled, at most hourly and off the event loop
+            if self.auto_cleanup and time.monotonic() - self._last_cleanup_time >= self.CLEANUP_INTERVAL:
+                self._last_cleanup_time = time.monotonic()
+                self._cleanup_task = asyncio.create_task(
+                    asyncio.to_thread(self.cleanup_old_stats, self.data_retention_days)
+                )
             
             # Parse command arguments
             content = message.content.strip()
@@ -336,12 +514,9 @@ class StatsCommand(BaseCommand):
             parts = content.split()
             if len(parts) > 1:
                 subcommand = parts[1].lower()
-                if subcommand in ['messages', 'message']:
-                    response = await self._get_bot_user_leaderboard()
-                elif subcommand in ['channels', 'channel']:
-                    response = await self._get_channel_leaderboard()
-                elif subcommand in ['paths', 'path']:
-                    response = await self._get_path_leaderboard()
+                handler = self._SUBCOMMANDS.get(subcommand)
+                if handler:
+                    response = await getattr(self, handler)()
                 else:
                     response = self.translate('commands.stats.unknown_subcommand', subcommand=subcommand)
             else:
@@ -363,55 +538,57 @@ class StatsCommand(BaseCommand):
         Returns:
             str: Formatted string containing basic statistics (commands, top user, etc.).
         """
+        cached = self._get_cached_response('basic')
+        if cached is not None:
+            return cached
+        
         try:
             # Get time window (24 hours ago)
             now = int(time.time())
             day_ago = now - (24 * 60 * 60)
             
-            with sqlite3.connect(self.bot.db_manager.db_path) as conn:
+            with self._get_read_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Bot commands received
+                # Commands received, replies sent, top command and top user
+                # in one statement over the 24h window
                 cursor.execute('''
-                    SELECT COUNT(*) FROM command_stats 
-                    WHERE timestamp >= ?
-                ''', (day_ago,))
-                commands_received = cursor.fetchone()[0]
-                
-                # Bot replies sent
-                cursor.execute('''
-                    SELECT COUNT(*) FROM command_stats 
-                    WHERE timestamp >= ? AND response_sent = 1
+                    WITH w AS (
+                        SELECT sender_id, command_name, response_sent
+                        FROM command_stats 
+                        WHERE timestamp >= ?
+                    ),
+                    top_command AS (
+                        SELECT command_name, COUNT(*) as count 
+                        FROM w 
+                        GROUP BY command_name 
+                        ORDER BY count DESC 
+                        LIMIT 1
+                    ),
+                    top_user AS (
+                        SELECT sender_id, COUNT(*) as count 
+                        FROM w 
+                        GROUP BY sender_id 
+                        ORDER BY count DESC 
+                        LIMIT 1
+                    )
+                    SELECT (SELECT COUNT(*) FROM w),
+                           (SELECT COUNT(*) FROM w WHERE response_sent = 1),
+                           (SELECT command_name FROM top_command),
+                           (SELECT count FROM top_command),
+                           (SELECT sender_id FROM top_user),
+                           (SELECT count FROM top_user)
                 ''', (day_ago,))
-                bot_replies = cursor.fetchone()[0]
+                (commands_received, bot_replies, top_command_name, top_command_count,
+                 top_user_id, top_user_count) = cursor.fetchone()
                 
-                # Top command
-                cursor.execute('''
-                    SELECT command_name, COUNT(*) as count 
-                    FROM command_stats 
-                    WHERE timestamp >= ?
-                    GROUP BY command_name 
-                    ORDER BY count DESC 
-                    LIMIT 1
-                ''', (day_ago,))
-                top_command_result = cursor.fetchone()
-                if top_command_result:
-                    top_command = f"{top_command_result[0]} ({top_command_result[1]})"
+                if top_command_name is not None:
+                    top_command = f"{top_command_name} ({top_command_count})"
                 else:
                     top_command = self.translate('commands.stats.basic.none')
                 
-                # Top user
-                cursor.execute('''
-                    SELECT sender_id, COUNT(*) as count 
-                    FROM command_stats 
-                    WHERE timestamp >= ?
-                    GROUP BY sender_id 
-                    ORDER BY count DESC 
-                    LIMIT 1
-                ''', (day_ago,))
-                top_user_result = cursor.fetchone()
-                if top_user_result:
-                    top_user = f"{top_user_result[0]} ({top_user_result[1]})"
+                if top_user_id is not None:
+                    top_user = f"{top_user_id} ({top_user_count})"
                 else:
                     top_user = self.translate('commands.stats.basic.none')
                 
@@ -420,7 +597,7 @@ class StatsCommand(BaseCommand):
 {self.translate('commands.stats.basic.top_command', command=top_command)}
 {self.translate('commands.stats.basic.top_user', user=top_user)}"""
                 
-                return response
+                return self._cache_response('basic', response)
                 
         except Exception as e:
             self.logger.error(f"Error getting basic stats: {e}")
@@ -432,12 +609,16 @@ class StatsCommand(BaseCommand):
         Returns:
             str: Formatted leaderboard string.
         """
+        cached = self._get_cached_response('users')
+        if cached is not None:
+            return cached
+        
         try:
             # Get time window (24 hours ago)
             now = int(time.time())
             day_ago = now - (24 * 60 * 60)
             
-            with sqlite3.connect(self.bot.db_manager.db_path) as conn:
+            with self._get_read_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Top bot users (people who triggered commands)
@@ -455,13 +636,15 @@ class StatsCommand(BaseCommand):
                 response = self.translate('commands.stats.users.header') + "\n"
                 
                 if top_users:
+                    lines = []
                     for i, (user, count) in enumerate(top_users, 1):
                         display_user = user[:12] + "..." if len(user) > 15 else user
-                        response += f"{i}. {display_user}: {count}\n"
+                        lines.append(f"{i}. {display_user}: {count}\n")
+                    response += "".join(lines)
                 else:
                     response += self.translate('commands.stats.users.none') + "\n"
                 
-                return response
+                return self._cache_response('users', response)
                 
         except Exception as e:
             self.logger.error(f"Error getting bot user leaderboard: {e}")
@@ -473,12 +656,16 @@ class StatsCommand(BaseCommand):
         Returns:
             str: Formatted leaderboard string.
         """
+        cached = self._get_cached_response('channels')
+        if cached is not None:
+            return cached
+        
         try:
             # Get time window (24 hours ago)
             now = int(time.time())
             day_ago = now - (24 * 60 * 60)
             
-            with sqlite3.connect(self.bot.db_manager.db_path) as conn:
+            with self._get_read_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Top channels by message count with unique user counts
@@ -496,18 +683,22 @@ class StatsCommand(BaseCommand):
                 response = self.translate('commands.stats.channels.header') + "\n"
                 
                 if top_channels:
+                    # Singular/plural words for messages and users, looked up once
+                    msg_singular = self.translate('commands.stats.channels.msg_singular')
+                    msg_plural = self.translate('commands.stats.channels.msg_plural')
+                    user_singular = self.translate('commands.stats.channels.user_singular')
+                    user_plural = self.translate('commands.stats.channels.user_plural')
+                    lines = []
                     for i, (channel, msg_count, unique_users) in enumerate(top_channels, 1):
                         display_channel = channel[:12] + "..." if len(channel) > 15 else channel
-                        # Handle singular/plural for messages and users
-                        msg_text = self.translate('commands.stats.channels.msg_singular') if msg_count == 1 else self.translate('commands.stats.channels.msg_plural')
-                        user_text = self.translate('commands.stats.channels.user_singular') if unique_users == 1 else self.translate('commands.stats.channels.user_plural')
-                        response += self.translate('commands.stats.channels.format', rank=i, channel=display_channel, msg_count=msg_count, msg_text=msg_text, user_count=unique_users, user_text=user_text) + "\n"
-                    # Remove trailing newline
-                    response = response.rstrip('\n')
+                        msg_text = msg_singular if msg_count == 1 else msg_plural
+                        user_text = user_singular if unique_users == 1 else user_plural
+                        lines.append(self.translate('commands.stats.channels.format', rank=i, channel=display_channel, msg_count=msg_count, msg_text=msg_text, user_count=unique_users, user_text=user_text))
+                    response += "\n".join(lines)
                 else:
                     response += self.translate('commands.stats.channels.none')
                 
-                return response
+                return self._cache_response('channels', response)
                 
         except Exception as e:
             self.logger.error(f"Error getting channel leaderboard: {e}")
@@ -519,29 +710,36 @@ class StatsCommand(BaseCommand):
         Returns:
             str: Formatted leaderboard string.
         """
+        cached = self._get_cached_response('paths')
+        if cached is not None:
+            return cached
+        
         try:
             # Get time window (24 hours ago)
             now = int(time.time())
             day_ago = now - (24 * 60 * 60)
             
-            with sqlite3.connect(self.bot.db_manager.db_path) as conn:
+            with self._get_read_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Top longest paths (one per user, more results with compact format)
+                # Top longest paths (one per user, more results with compact format).
+                # Ranking within each sender in one pass avoids a correlated MAX()
+                # subquery per row; ties go to the most recent path.
                 cursor.execute('''
                     SELECT sender_id, path_length, path_string 
-                    FROM path_stats p1
-                    WHERE timestamp >= ? 
-                    AND path_length = (
-                        SELECT MAX(path_length) 
-                        FROM path_stats p2 
-                        WHERE p2.sender_id = p1.sender_id 
-                        AND p2.timestamp >= ?
+                    FROM (
+                        SELECT sender_id, path_length, path_string,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY sender_id
+                                   ORDER BY path_length DESC, timestamp DESC
+                               ) AS rn
+                        FROM path_stats
+                        WHERE timestamp >= ?
                     )
-                    GROUP BY sender_id
+                    WHERE rn = 1
                     ORDER BY path_length DESC 
                     LIMIT 8
-                ''', (day_ago, day_ago))
+                ''', (day_ago,))
                 longest_paths = cursor.fetchall()
                 
                 # Build compact response with length checking
@@ -549,6 +747,8 @@ class StatsCommand(BaseCommand):
                 max_length = 130  # Safe length for mesh network
                 
                 if longest_paths:
+                    lines = []
+                    running_length = 0
                     for i, (sender, path_len, path_str) in enumerate(longest_paths, 1):
                         # Truncate sender name to fit more data
                         display_sender = sender[:8] + "..." if len(sender) > 11 else sender
@@ -556,19 +756,44 @@ class StatsCommand(BaseCommand):
                         new_line = self.translate('commands.stats.paths.format', rank=i, sender=display_sender, path=path_str) + "\n"
                         
                         # Check if adding this line would exceed the limit
-                        if len(response + new_line) > max_length:
+                        running_length += len(new_line)
+                        if running_length > max_length:
                             break
                         
-                        response += new_line
+                        lines.append(new_line)
+                    response = "".join(lines)
                 else:
                     response = self.translate('commands.stats.paths.none') + "\n"
                 
-                return response
+                return self._cache_response('paths', response)
                 
         except Exception as e:
             self.logger.error(f"Error getting path leaderboard: {e}")
             return self.translate('commands.stats.error_paths', error=str(e))
     
+    def _delete_older_than(self, table_name: str, cutoff_time: int) -> int:
+        """Delete rows older than a cutoff in batches, releasing the write lock between them.
+        
+        Args:
+            table_name: The stats table to prune.
+            cutoff_time: Unix timestamp; older rows are deleted.
+            
+        Returns:
+            int: Number of rows deleted.
+        """
+        total_deleted = 0
+        while True:
+            with self._write_lock, self._write_conn as conn:
+                cursor = conn.execute(
+                    f'DELETE FROM {table_name} WHERE id IN '
+                    f'(SELECT id FROM {table_name} WHERE timestamp < ? LIMIT ?)',
+                    (cutoff_time, self.CLEANUP_BATCH_SIZE)
+                )
+                deleted = cursor.rowcount
+            total_deleted += deleted
+            if deleted < self.CLEANUP_BATCH_SIZE:
+                return total_deleted
+    
     def cleanup_old_stats(self, days_to_keep: int = 7) -> None:
         """Clean up old stats data to prevent database bloat.
         
@@ -578,38 +803,38 @@ class StatsCommand(BaseCommand):
         try:
             cutoff_time = int(time.time()) - (days_to_keep * 24 * 60 * 60)
             
-            with sqlite3.connect(self.bot.db_manager.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Clean up old message stats
-                cursor.execute('DELETE FROM message_stats WHERE timestamp < ?', (cutoff_time,))
-                messages_deleted = cursor.rowcount
-                
-                # Clean up old command stats
-                cursor.execute('DELETE FROM command_stats WHERE timestamp < ?', (cutoff_time,))
-                commands_deleted = cursor.rowcount
-                
-                # Clean up old path stats
-                cursor.execute('DELETE FROM path_stats WHERE timestamp < ?', (cutoff_time,))
-                paths_deleted = cursor.rowcount
-                
-                conn.commit()
-                
-                total_deleted = messages_deleted + commands_deleted + paths_deleted
-                if total_deleted > 0:
-                    self.logger.info(f"Cleaned up {total_deleted} old stats entries ({messages_deleted} messages, {commands_deleted} commands, {paths_deleted} paths)")
+            # Clean up old message, command and path stats
+            messages_deleted = self._delete_older_than('message_stats', cutoff_time)
+            commands_deleted = self._delete_older_than('command_stats', cutoff_time)
+            paths_deleted = self._delete_older_than('path_stats', cutoff_time)
+            
+            total_deleted = messages_deleted + commands_deleted + paths_deleted
+            if total_deleted > 0:
+                # Shrink the WAL back down after a large delete
+                with self._write_lock:
+                    self._write_conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                self.logger.info(f"Cleaned up {total_deleted} old stats entries ({messages_deleted} messages, {commands_deleted} commands, {paths_deleted} paths)")
                 
         except Exception as e:
             self.logger.error(f"Error cleaning up old stats: {e}")
     
+    def optimize_database(self) -> None:
+        """Let SQLite refresh query planner statistics for the stats tables."""
+        try:
+            with self._write_lock, self._write_conn as conn:
+                conn.execute('PRAGMA optimize')
+        except Exception as e:
+            self.logger.debug(f"Error optimizing stats database: {e}")
+    
     def get_stats_summary(self) -> Dict[str, Any]:
         """Get a summary of all stats data.
         
         Returns:
             Dict[str, Any]: Dictionary containing summary statistics.
         """
+        self.flush_stats()
         try:
-            with sqlite3.connect(self.bot.db_manager.db_path) as conn:
+            with self._get_read_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Total messages
@@ -3,8 +3,11 @@
 Sun Command - Provides sunrise/sunset information
 """
 
+import time
+from typing import Optional, Tuple
+
 from .base_command import BaseCommand
-from ..solar_conditions import get_sun
+from ..solar_conditions import get_sun, ERROR_FETCHING_DATA
 from ..models import MeshMessage
 
 
@@ -21,6 +24,10 @@ class SunCommand(BaseCommand):
     description = "Get sunrise/sunset times"
     category = "solar"
     
+    # The reply includes azimuth, altitude and time remaining to the minute,
+    # so it can only be reused briefly
+    SUN_CACHE_TTL = 60
+    
     def __init__(self, bot):
         """Initialize the sun command.
         
@@ -29,6 +36,7 @@ class SunCommand(BaseCommand):
         """
         super().__init__(bot)
         self.sun_enabled = self.get_config_value('Sun_Command', 'enabled', fallback=True, value_type='bool')
+        self._sun_cache: Optional[Tuple[float, str]] = None
     
     def can_execute(self, message: MeshMessage) -> bool:
         """Check if this command can be executed with the given message.
@@ -55,8 +63,14 @@ class SunCommand(BaseCommand):
             bool: True if executed successfully, False otherwise.
         """
         try:
-            # Get sun information using default location
-            sun_info = get_sun()
+            # Get sun information using default location, reusing a recent result
+            now = time.monotonic()
+            if self._sun_cache is not None and self._sun_cache[0] > now:
+                sun_info = self._sun_cache[1]
+            else:
+                sun_info = get_sun()
+                if sun_info != ERROR_FETCHING_DATA:
+                    self._sun_cache = (now + self.SUN_CACHE_TTL, sun_info)
             
             # Send response using unified method
             response = self.translate('commands.sun.response', info=sun_info)
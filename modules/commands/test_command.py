@@ -6,12 +6,41 @@ Handles the 'test' keyword response
 
 import re
 import math
+import time
+import string
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Tuple, Dict, Any
 from .base_command import BaseCommand
 from ..models import MeshMessage
 from ..utils import calculate_distance
 
+# Control characters stripped from message content (keeps tab, newline, carriage return)
+_CTRL_RE = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+
+# Trigger words: bare in any case, or 'test'/'Test'/'t'/'T' followed by a phrase
+_TEST_KEYWORDS = frozenset(('test', 't'))
+_PHRASE_KEYWORDS = frozenset(('test', 'Test', 't', 'T'))
+
+@lru_cache(maxsize=32)
+def _format_field_names(response_format: str) -> frozenset:
+    """Top-level placeholder names used by a str.format template."""
+    return frozenset(
+        re.split(r'[.\[]', name, maxsplit=1)[0]
+        for _, name, _, _ in string.Formatter().parse(response_format)
+        if name
+    )
+
+# A single path hop: a 2-character hex node ID
+_HEX2_RE = re.compile(r'[0-9a-fA-F]{2}')
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a stored ISO timestamp; the same values recur across every lookup."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
 
 class TestCommand(BaseCommand):
     """Handles the test command.
@@ -26,8 +55,14 @@ class TestCommand(BaseCommand):
     description = "Responds to 'test' or 't' with connection info"
     category = "basic"
     
+    # Path distances are reused for the same path and sender for this long,
+    # keeping at most this many entries
+    PATH_DISTANCE_CACHE_TTL = 300
+    MAX_CACHED_PATH_DISTANCES = 512
+    
     def __init__(self, bot):
         super().__init__(bot)
+        self._path_distance_cache: OrderedDict[Tuple[str, str], Tuple[float, str, str]] = OrderedDict()
         self.test_enabled = self.get_config_value('Test_Command', 'enabled', fallback=True, value_type='bool')
         # Get bot location from config for geographic proximity calculations
         self.geographic_guessing_enabled = False
@@ -87,12 +122,13 @@ class TestCommand(BaseCommand):
         Returns:
             str: Cleaned and normalized content string.
         """
-        import re
-        # Remove control characters (except newline, tab, carriage return)
-        cleaned = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', content)
-        # Normalize whitespace
-        cleaned = ' '.join(cleaned.split())
-        return cleaned
+        # Already clean: isprintable() rejects control characters and any
+        # whitespace other than a plain space
+        if (content.isprintable() and '  ' not in content
+                and not content.startswith(' ') and not content.endswith(' ')):
+            return content
+        # Remove control characters, then normalize whitespace
+        return ' '.join(_CTRL_RE.sub('', content).split())
     
     def matches_keyword(self, message: MeshMessage) -> bool:
         """Override to implement special test keyword matching with optional phrase.
@@ -105,28 +141,35 @@ class TestCommand(BaseCommand):
         Returns:
             bool: True if the message matches the keyword patterns.
         """
+        return self._extract_phrase(message.content) is not None
+    
+    def _extract_phrase(self, raw_content: str) -> Optional[str]:
+        """Split a test trigger into its optional phrase.
+        
+        Args:
+            raw_content: The raw message content.
+            
+        Returns:
+            Optional[str]: '' for a bare 'test'/'t', the phrase for 'test <phrase>'
+            or 't <phrase>', or None if the message is not a test trigger.
+        """
         # Clean content to remove control characters and normalize whitespace
-        content = self.clean_content(message.content)
+        content = self.clean_content(raw_content)
         
         # Strip exclamation mark if present (for command-style messages)
         if content.startswith('!'):
             content = content[1:].strip()
         
-        # Handle "test" alone or "test " with phrase
-        if content.lower() == "test":
-            return True  # Just "test" by itself
-        elif (content.startswith('test ') or content.startswith('Test ')) and len(content) > 5:
-            phrase = content[5:].strip()  # Get everything after "test " and strip whitespace
-            return bool(phrase)  # Make sure there's actually a phrase
-        
-        # Handle "t" alone or "t " with phrase
-        elif content.lower() == "t":
-            return True  # Just "t" by itself
-        elif (content.startswith('t ') or content.startswith('T ')) and len(content) > 2:
-            phrase = content[2:].strip()  # Get everything after "t " and strip whitespace
-            return bool(phrase)  # Make sure there's actually a phrase
-        
-        return False
+        # Content is whitespace-normalized, so one partition splits off the keyword
+        head, sep, tail = content.partition(' ')
+        if not sep:
+            # "test" or "t" by itself, in any case
+            return "" if head.lower() in _TEST_KEYWORDS else None
+        
+        # "test <phrase>" or "t <phrase>"
+        if head in _PHRASE_KEYWORDS:
+            return tail.strip() or None
+        return None
     
     def get_response_format(self) -> Optional[str]:
         """Get the response format from config.
@@ -139,6 +182,11 @@ class TestCommand(BaseCommand):
             return self._strip_quotes_from_config(format_str) if format_str else None
         return None
     
+    @staticmethod
+    def _is_direct_path(path: Optional[str]) -> bool:
+        """Check whether a path string describes a direct (zero-hop) connection."""
+        return not path or "Direct" in path or "0 hops" in path
+    
     def _extract_path_node_ids(self, message: MeshMessage) -> List[str]:
         """Extract path node IDs from message path string.
         
@@ -148,11 +196,7 @@ class TestCommand(BaseCommand):
         Returns:
             List[str]: List of valid 2-character hex node IDs.
         """
-        if not message.path:
-            return []
-        
-        # Check if it's a direct connection
-        if "Direct" in message.path or "0 hops" in message.path:
+        if self._is_direct_path(message.path):
             return []
         
         # Extract path nodes from the path string
@@ -161,8 +205,7 @@ class TestCommand(BaseCommand):
         path_string = message.path
         
         # Remove route type suffix if present
-        if " via ROUTE_TYPE_" in path_string:
-            path_string = path_string.split(" via ROUTE_TYPE_")[0]
+        path_string = path_string.partition(" via ROUTE_TYPE_")[0]
         
         # Check if it looks like a comma-separated path
         if ',' in path_string:
@@ -177,58 +220,77 @@ class TestCommand(BaseCommand):
             for part in parts:
                 part = part.strip()
                 # Check if it's a 2-character hex value
-                if len(part) == 2 and all(c in '0123456789abcdefABCDEF' for c in part):
+                if _HEX2_RE.fullmatch(part):
                     valid_parts.append(part.upper())
             
             return valid_parts
         
         return []
     
+    def _load_repeater_candidates(self, node_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch located repeaters for every node ID in one query.
+        
+        The prefix expression matches idx_complete_key_prefix (created by the
+        repeater manager), so this is an index search rather than a table scan.
+        
+        Args:
+            node_ids: 2-character node IDs (public key prefixes).
+            
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Matching rows keyed by upper-case prefix.
+        """
+        candidates: Dict[str, List[Dict[str, Any]]] = {}
+        if not node_ids or not hasattr(self.bot, 'db_manager'):
+            return candidates
+        
+        prefixes = list(dict.fromkeys(node_id.upper() for node_id in node_ids))
+        placeholders = ','.join('?' * len(prefixes))
+        query = f'''
+            SELECT latitude, longitude, public_key, name,
+                   last_advert_timestamp, last_heard, advert_count, is_starred
+            FROM complete_contact_tracking 
+            WHERE UPPER(SUBSTR(public_key, 1, 2)) IN ({placeholders})
+            AND role IN ('repeater', 'roomserver')
+            AND latitude IS NOT NULL AND longitude IS NOT NULL
+            AND latitude != 0 AND longitude != 0
+        '''
+        
+        for row in self.bot.db_manager.execute_query(query, tuple(prefixes)):
+            candidates.setdefault(row['public_key'][:2].upper(), []).append(row)
+        return candidates
     
-    def _lookup_repeater_location(self, node_id: str, path_context: Optional[List[str]] = None) -> Optional[Tuple[float, float]]:
+    def _lookup_repeater_location(self, node_id: str, path_context: Optional[List[str]] = None,
+                                  candidates: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                                  cache: Optional[Dict[str, Optional[Tuple[float, float]]]] = None) -> Optional[Tuple[float, float]]:
         """Look up repeater location for a node ID using geographic proximity selection when path context is available.
         
         Args:
             node_id: The node ID to look up.
             path_context: Optional list of all node IDs in the path for context-aware selection.
+            candidates: Optional preloaded rows from _load_repeater_candidates.
+            cache: Optional per-message dict of locations already resolved for this path.
             
         Returns:
             Optional[Tuple[float, float]]: (latitude, longitude) or None if not found.
         """
+        if cache is None:
+            return self._resolve_repeater_location(node_id, path_context, candidates)
+        if node_id not in cache:
+            cache[node_id] = self._resolve_repeater_location(node_id, path_context, candidates)
+        return cache[node_id]
+    
+    def _resolve_repeater_location(self, node_id: str, path_context: Optional[List[str]],
+                                   candidates: Optional[Dict[str, List[Dict[str, Any]]]]) -> Optional[Tuple[float, float]]:
+        """Resolve a node ID to a location; see _lookup_repeater_location."""
         try:
-            if not hasattr(self.bot, 'db_manager'):
-                return None
+            if candidates is None:
+                candidates = self._load_repeater_candidates([node_id])
+            # Query rows are already dicts; the selectors only read them
+            repeaters = candidates.get(node_id.upper())
             
-            # Query for all repeaters with matching prefix
-            query = '''
-                SELECT latitude, longitude, public_key, name,
-                       last_advert_timestamp, last_heard, advert_count, is_starred
-                FROM complete_contact_tracking 
-                WHERE public_key LIKE ? AND role IN ('repeater', 'roomserver')
-                AND latitude IS NOT NULL AND longitude IS NOT NULL
-                AND latitude != 0 AND longitude != 0
-            '''
-            
-            prefix_pattern = f"{node_id}%"
-            results = self.bot.db_manager.execute_query(query, (prefix_pattern,))
-            
-            if not results or len(results) == 0:
+            if not repeaters:
                 return None
             
-            # Convert to list of dicts for processing
-            repeaters = []
-            for row in results:
-                repeaters.append({
-                    'latitude': row.get('latitude'),
-                    'longitude': row.get('longitude'),
-                    'public_key': row.get('public_key'),
-                    'name': row.get('name'),
-                    'last_advert_timestamp': row.get('last_advert_timestamp'),
-                    'last_heard': row.get('last_heard'),
-                    'advert_count': row.get('advert_count', 0),
-                    'is_starred': bool(row.get('is_starred', 0))
-                })
-            
             # If only one repeater, return it
             if len(repeaters) == 1:
                 r = repeaters[0]
@@ -236,16 +298,15 @@ class TestCommand(BaseCommand):
             
             # Multiple repeaters - use geographic proximity selection if path context available
             if path_context and len(path_context) > 1:
-                # Get sender location if available (for first repeater selection)
-                sender_location = self._get_sender_location()
-                selected = self._select_by_path_proximity(repeaters, node_id, path_context, sender_location)
+                # Get sender location if available (only used for the first repeater)
+                sender_location = self._get_sender_location() if path_context[0] == node_id else None
+                selected = self._select_by_path_proximity(repeaters, node_id, path_context, sender_location, candidates)
                 if selected:
                     return (float(selected['latitude']), float(selected['longitude']))
             
             # Fall back to most recent repeater
-            scored = self._calculate_recency_weighted_scores(repeaters)
-            if scored:
-                best_repeater = scored[0][0]
+            best_repeater = self._best_recent_repeater(repeaters)
+            if best_repeater:
                 return (float(best_repeater['latitude']), float(best_repeater['longitude']))
             
             return None
@@ -297,79 +358,84 @@ class TestCommand(BaseCommand):
         Returns:
             List[Tuple[Dict[str, Any], float]]: List of (repeater, score) tuples sorting by score descending.
         """
-        scored_repeaters = []
         now = datetime.now()
-        
-        for repeater in repeaters:
-            most_recent_time = None
-            
-            # Check last_heard
-            last_heard = repeater.get('last_heard')
-            if last_heard:
-                try:
-                    if isinstance(last_heard, str):
-                        dt = datetime.fromisoformat(last_heard.replace('Z', '+00:00'))
-                    else:
-                        dt = last_heard
-                    if most_recent_time is None or dt > most_recent_time:
-                        most_recent_time = dt
-                except:
-                    pass
-            
-            # Check last_advert_timestamp
-            last_advert = repeater.get('last_advert_timestamp')
-            if last_advert:
-                try:
-                    if isinstance(last_advert, str):
-                        dt = datetime.fromisoformat(last_advert.replace('Z', '+00:00'))
-                    else:
-                        dt = last_advert
-                    if most_recent_time is None or dt > most_recent_time:
-                        most_recent_time = dt
-                except:
-                    pass
-            
-            if most_recent_time is None:
-                recency_score = 0.1
-            else:
-                hours_ago = (now - most_recent_time).total_seconds() / 3600.0
-                recency_score = math.exp(-hours_ago / 12.0)
-                recency_score = max(0.0, min(1.0, recency_score))
-            
-            scored_repeaters.append((repeater, recency_score))
+        scored_repeaters = [(repeater, self._recency_score(repeater, now)) for repeater in repeaters]
         
         # Sort by recency score (highest first)
         scored_repeaters.sort(key=lambda x: x[1], reverse=True)
         return scored_repeaters
     
-    def _get_node_location_simple(self, node_id: str) -> Optional[Tuple[float, float]]:
+    def _best_recent_repeater(self, repeaters: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Return the most recently seen repeater in a single pass.
+        
+        Args:
+            repeaters: List of repeater dictionaries.
+            
+        Returns:
+            Optional[Dict[str, Any]]: The first repeater with the highest recency score, or None.
+        """
+        if not repeaters:
+            return None
+        now = datetime.now()
+        return max(repeaters, key=lambda repeater: self._recency_score(repeater, now))
+    
+    @staticmethod
+    def _recency_score(repeater: Dict[str, Any], now: datetime) -> float:
+        """Score how recently a repeater was seen (0.0 to 1.0, higher = more recent)."""
+        most_recent_time = None
+        
+        # Most recent of last_heard and last_advert_timestamp
+        for seen in (repeater.get('last_heard'), repeater.get('last_advert_timestamp')):
+            if not seen:
+                continue
+            try:
+                dt = _parse_timestamp(seen) if isinstance(seen, str) else seen
+                if most_recent_time is None or dt > most_recent_time:
+                    most_recent_time = dt
+            except (ValueError, TypeError):
+                pass
+        
+        if most_recent_time is None:
+            return 0.1
+        hours_ago = (now - most_recent_time).total_seconds() / 3600.0
+        recency_score = math.exp(-hours_ago / 12.0)
+        return max(0.0, min(1.0, recency_score))
+    
+    @staticmethod
+    def _simple_location_rank(row: Dict[str, Any]) -> Tuple:
+        """Sort key matching ORDER BY is_starred DESC, COALESCE(last_advert_timestamp, last_heard) DESC."""
+        starred = row.get('is_starred')
+        last_seen = row.get('last_advert_timestamp')
+        if last_seen is None:
+            last_seen = row.get('last_heard')
+        
+        # SQLite orders NULL < numbers < text
+        if last_seen is None:
+            seen_rank = (0, 0)
+        elif isinstance(last_seen, (int, float)):
+            seen_rank = (1, last_seen)
+        else:
+            seen_rank = (2, str(last_seen))
+        return (starred is not None, starred or 0), seen_rank
+    
+    def _get_node_location_simple(self, node_id: str,
+                                  candidates: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Optional[Tuple[float, float]]:
         """Simple lookup without proximity selection - used for reference nodes.
         
         Args:
             node_id: The node ID to look up.
+            candidates: Optional preloaded rows from _load_repeater_candidates.
             
         Returns:
             Optional[Tuple[float, float]]: (latitude, longitude) or None if not found.
         """
         try:
-            if not hasattr(self.bot, 'db_manager'):
-                return None
-            
-            query = '''
-                SELECT latitude, longitude 
-                FROM complete_contact_tracking 
-                WHERE public_key LIKE ? AND role IN ('repeater', 'roomserver')
-                AND latitude IS NOT NULL AND longitude IS NOT NULL
-                AND latitude != 0 AND longitude != 0
-                ORDER BY is_starred DESC, COALESCE(last_advert_timestamp, last_heard) DESC
-                LIMIT 1
-            '''
-            
-            prefix_pattern = f"{node_id}%"
-            results = self.bot.db_manager.execute_query(query, (prefix_pattern,))
+            if candidates is None:
+                candidates = self._load_repeater_candidates([node_id])
+            results = candidates.get(node_id.upper())
             
-            if results and len(results) > 0:
-                row = results[0]
+            if results:
+                row = max(results, key=self._simple_location_rank)
                 lat = row.get('latitude')
                 lon = row.get('longitude')
                 if lat is not None and lon is not None:
@@ -380,7 +446,8 @@ class TestCommand(BaseCommand):
             self.logger.debug(f"Error in simple location lookup for {node_id}: {e}")
             return None
     
-    def _select_by_path_proximity(self, repeaters: List[Dict[str, Any]], node_id: str, path_context: List[str], sender_location: Optional[Tuple[float, float]] = None) -> Optional[Dict[str, Any]]:
+    def _select_by_path_proximity(self, repeaters: List[Dict[str, Any]], node_id: str, path_context: List[str], sender_location: Optional[Tuple[float, float]] = None,
+                                  candidates: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Optional[Dict[str, Any]]:
         """Select repeater based on proximity to previous/next nodes in path.
         
         Args:
@@ -388,6 +455,7 @@ class TestCommand(BaseCommand):
             node_id: Current node ID being resolved.
             path_context: Full path of node IDs.
             sender_location: Optional sender location for first hop optimization.
+            candidates: Optional preloaded rows for looking up neighbouring nodes.
             
         Returns:
             Optional[Dict[str, Any]]: Selected repeater dict or None.
@@ -396,7 +464,7 @@ class TestCommand(BaseCommand):
             # Filter by recency first
             scored_repeaters = self._calculate_recency_weighted_scores(repeaters)
             min_recency_threshold = 0.01  # Approximately 55 hours ago or less
-            recent_repeaters = [r for r, score in scored_repeaters if score >= min_recency_threshold]
+            recent_repeaters = [(r, score) for r, score in scored_repeaters if score >= min_recency_threshold]
             
             if not recent_repeaters:
                 return None
@@ -412,11 +480,11 @@ class TestCommand(BaseCommand):
             
             if current_index > 0:
                 prev_node_id = path_context[current_index - 1]
-                prev_location = self._get_node_location_simple(prev_node_id)
+                prev_location = self._get_node_location_simple(prev_node_id, candidates)
             
             if current_index < len(path_context) - 1:
                 next_node_id = path_context[current_index + 1]
-                next_location = self._get_node_location_simple(next_node_id)
+                next_location = self._get_node_location_simple(next_node_id, candidates)
             
             # For the first repeater in the path, prioritize sender location as the source
             # The first repeater's primary job is to receive from the sender, so use sender location if available
@@ -451,24 +519,23 @@ class TestCommand(BaseCommand):
             self.logger.debug(f"Error in path proximity selection: {e}")
             return None
     
-    def _select_by_dual_proximity(self, repeaters: List[Dict[str, Any]], prev_location: Tuple[float, float], next_location: Tuple[float, float]) -> Optional[Dict[str, Any]]:
+    def _select_by_dual_proximity(self, scored_repeaters: List[Tuple[Dict[str, Any], float]], prev_location: Tuple[float, float], next_location: Tuple[float, float]) -> Optional[Dict[str, Any]]:
         """Select repeater based on proximity to both previous and next nodes.
         
         Args:
-            repeaters: List of candidate repeaters.
+            scored_repeaters: Recent (repeater, recency score) pairs, best score first.
             prev_location: Coordinates of previous node.
             next_location: Coordinates of next node.
             
         Returns:
             Optional[Dict[str, Any]]: Best matching repeater or None.
         """
-        scored_repeaters = self._calculate_recency_weighted_scores(repeaters)
-        min_recency_threshold = 0.01
-        scored_repeaters = [(r, score) for r, score in scored_repeaters if score >= min_recency_threshold]
-        
         if not scored_repeaters:
             return None
         
+        # Star bias multiplier (same config as path command), read once per selection
+        star_bias_multiplier = self.bot.config.getfloat('Path_Command', 'star_bias_multiplier', fallback=2.5)
+        
         best_repeater = None
         best_combined_score = 0.0
         
@@ -493,8 +560,7 @@ class TestCommand(BaseCommand):
             # Use configurable weighting (from Path_Command config)
             combined_score = (recency_score * self.recency_weight) + (proximity_score * self.proximity_weight)
             
-            # Apply star bias multiplier if repeater is starred (use same config as path command)
-            star_bias_multiplier = self.bot.config.getfloat('Path_Command', 'star_bias_multiplier', fallback=2.5)
+            # Apply star bias multiplier if repeater is starred
             if repeater.get('is_starred', False):
                 combined_score *= star_bias_multiplier
             
@@ -504,21 +570,17 @@ class TestCommand(BaseCommand):
         
         return best_repeater
     
-    def _select_by_single_proximity(self, repeaters: List[Dict[str, Any]], reference_location: Tuple[float, float], direction: str = "unknown") -> Optional[Dict[str, Any]]:
+    def _select_by_single_proximity(self, scored_repeaters: List[Tuple[Dict[str, Any], float]], reference_location: Tuple[float, float], direction: str = "unknown") -> Optional[Dict[str, Any]]:
         """Select repeater based on proximity to single reference node.
         
         Args:
-            repeaters: List of candidate repeaters.
+            scored_repeaters: Recent (repeater, recency score) pairs, best score first.
             reference_location: Coordinates of reference node (sender, bot, next, previous).
             direction: Direction indicator ('sender', 'bot', 'next', 'previous').
             
         Returns:
             Optional[Dict[str, Any]]: Best matching repeater or None.
         """
-        scored_repeaters = self._calculate_recency_weighted_scores(repeaters)
-        min_recency_threshold = 0.01
-        scored_repeaters = [(r, score) for r, score in scored_repeaters if score >= min_recency_threshold]
-        
         if not scored_repeaters:
             return None
         
@@ -533,6 +595,9 @@ class TestCommand(BaseCommand):
             proximity_weight = self.proximity_weight
             recency_weight = self.recency_weight
         
+        # Star bias multiplier (same config as path command), read once per selection
+        star_bias_multiplier = self.bot.config.getfloat('Path_Command', 'star_bias_multiplier', fallback=2.5)
+        
         best_repeater = None
         best_combined_score = 0.0
         
@@ -549,8 +614,7 @@ class TestCommand(BaseCommand):
             # Use appropriate weighting based on direction
             combined_score = (recency_score * recency_weight) + (proximity_score * proximity_weight)
             
-            # Apply star bias multiplier if repeater is starred (use same config as path command)
-            star_bias_multiplier = self.bot.config.getfloat('Path_Command', 'star_bias_multiplier', fallback=2.5)
+            # Apply star bias multiplier if repeater is starred
             if repeater.get('is_starred', False):
                 combined_score *= star_bias_multiplier
             
@@ -560,20 +624,26 @@ class TestCommand(BaseCommand):
         
         return best_repeater
     
-    def _calculate_path_distance(self, message: MeshMessage) -> str:
+    def _calculate_path_distance(self, message: MeshMessage,
+                                 candidates: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                                 cache: Optional[Dict[str, Optional[Tuple[float, float]]]] = None,
+                                 node_ids: Optional[List[str]] = None) -> str:
         """Calculate total distance along path (sum of distances between consecutive repeaters with locations).
         
         Args:
             message: The message containing the path.
+            candidates: Optional preloaded rows from _load_repeater_candidates.
+            cache: Optional per-message dict of resolved node locations.
+            node_ids: Optional node IDs already extracted from the path.
             
         Returns:
             str: Formatted distance string used in response.
         """
-        node_ids = self._extract_path_node_ids(message)
+        if self._is_direct_path(message.path):
+            return "N/A"  # Direct connection, no path to calculate
+        if node_ids is None:
+            node_ids = self._extract_path_node_ids(message)
         if len(node_ids) < 2:
-            # Check if it's a direct connection
-            if not message.path or "Direct" in message.path or "0 hops" in message.path:
-                return "N/A"  # Direct connection, no path to calculate
             return ""  # Path exists but insufficient nodes
         
         total_distance = 0.0
@@ -581,9 +651,11 @@ class TestCommand(BaseCommand):
         skipped_nodes = 0
         
         # Get locations for all nodes using path context for proximity selection
+        if candidates is None:
+            candidates = self._load_repeater_candidates(node_ids)
         locations = []
         for i, node_id in enumerate(node_ids):
-            location = self._lookup_repeater_location(node_id, path_context=node_ids)
+            location = self._lookup_repeater_location(node_id, path_context=node_ids, candidates=candidates, cache=cache)
             if location:
                 locations.append((node_id, location))
             else:
@@ -612,20 +684,26 @@ class TestCommand(BaseCommand):
         else:
             return f"{total_distance:.1f}km ({valid_segments} segs)"
     
-    def _calculate_firstlast_distance(self, message: MeshMessage) -> str:
+    def _calculate_firstlast_distance(self, message: MeshMessage,
+                                      candidates: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                                      cache: Optional[Dict[str, Optional[Tuple[float, float]]]] = None,
+                                      node_ids: Optional[List[str]] = None) -> str:
         """Calculate straight-line distance between first and last repeater in path.
         
         Args:
             message: The message containing the path.
+            candidates: Optional preloaded rows from _load_repeater_candidates.
+            cache: Optional per-message dict of resolved node locations.
+            node_ids: Optional node IDs already extracted from the path.
             
         Returns:
             str: Formatted distance string used in response.
         """
-        node_ids = self._extract_path_node_ids(message)
+        if self._is_direct_path(message.path):
+            return "N/A"  # Direct connection, no path to calculate
+        if node_ids is None:
+            node_ids = self._extract_path_node_ids(message)
         if len(node_ids) < 2:
-            # Check if it's a direct connection
-            if not message.path or "Direct" in message.path or "0 hops" in message.path:
-                return "N/A"  # Direct connection, no path to calculate
             return ""  # Path exists but insufficient nodes
         
         # Get first and last node IDs
@@ -633,8 +711,10 @@ class TestCommand(BaseCommand):
         last_node_id = node_ids[-1]
         
         # Use path context for better selection when multiple repeaters share prefix
-        first_location = self._lookup_repeater_location(first_node_id, path_context=node_ids)
-        last_location = self._lookup_repeater_location(last_node_id, path_context=node_ids)
+        if candidates is None:
+            candidates = self._load_repeater_candidates(node_ids)
+        first_location = self._lookup_repeater_location(first_node_id, path_context=node_ids, candidates=candidates, cache=cache)
+        last_location = self._lookup_repeater_location(last_node_id, path_context=node_ids, candidates=candidates, cache=cache)
         
         # Both locations must be available
         if not first_location or not last_location:
@@ -648,6 +728,43 @@ class TestCommand(BaseCommand):
         
         return f"{distance:.1f}km"
     
+    def _get_path_distances(self, message: MeshMessage) -> Tuple[str, str]:
+        """Get the path and first/last distances, reusing a recent result.
+        
+        Both depend on the sender as well as the path (the first hop is chosen
+        by proximity to the sender), so the cache is keyed on both.
+        
+        Args:
+            message: The message containing the path.
+            
+        Returns:
+            Tuple[str, str]: (path_distance, firstlast_distance) strings.
+        """
+        # Direct messages have no hops to measure
+        if self._is_direct_path(message.path):
+            return "N/A", "N/A"
+        
+        key = (message.path, message.sender_pubkey or '')
+        now = time.monotonic()
+        cache = self._path_distance_cache
+        cached = cache.get(key)
+        if cached is not None and cached[0] > now:
+            cache.move_to_end(key)
+            return cached[1], cached[2]
+        
+        # Share one candidate query and the per-node locations between both
+        node_ids = self._extract_path_node_ids(message)
+        candidates = self._load_repeater_candidates(node_ids) if len(node_ids) >= 2 else {}
+        location_cache: Dict[str, Optional[Tuple[float, float]]] = {}
+        path_distance = self._calculate_path_distance(message, candidates, location_cache, node_ids)
+        firstlast_distance = self._calculate_firstlast_distance(message, candidates, location_cache, node_ids)
+        
+        cache[key] = (now + self.PATH_DISTANCE_CACHE_TTL, path_distance, firstlast_distance)
+        cache.move_to_end(key)
+        while len(cache) > self.MAX_CACHED_PATH_DISTANCES:
+            cache.popitem(last=False)
+        return path_distance, firstlast_distance
+    
     def format_response(self, message: MeshMessage, response_format: str) -> str:
         """Override to handle phrase extraction.
         
@@ -658,33 +775,21 @@ class TestCommand(BaseCommand):
         Returns:
             str: Formatted response string.
         """
-        # Clean content to remove control characters and normalize whitespace
-        content = self.clean_content(message.content)
-        
-        # Strip exclamation mark if present (for command-style messages)
-        if content.startswith('!'):
-            content = content[1:].strip()
-        
         # Extract phrase if present, otherwise use empty string
-        if content.lower() == "test":
-            phrase = ""
-        elif content.lower() == "t":
-            phrase = ""
-        elif content.startswith('test ') or content.startswith('Test '):
-            phrase = content[5:].strip()  # Get everything after "test "
-        elif content.startswith('t ') or content.startswith('T '):
-            phrase = content[2:].strip()  # Get everything after "t "
-        else:
-            phrase = ""
+        phrase = self._extract_phrase(message.content) or ""
         
         try:
-            connection_info = self.build_enhanced_connection_info(message)
-            timestamp = self.format_timestamp(message)
-            elapsed = self.format_elapsed(message)
+            # Only compute the placeholders the configured template uses
+            fields = _format_field_names(response_format)
+            connection_info = self.build_enhanced_connection_info(message) if 'connection_info' in fields else ""
+            timestamp = self.format_timestamp(message) if 'timestamp' in fields else ""
+            elapsed = self.format_elapsed(message) if 'elapsed' in fields else ""
             
             # Calculate distance placeholders
-            path_distance = self._calculate_path_distance(message)
-            firstlast_distance = self._calculate_firstlast_distance(message)
+            if 'path_distance' in fields or 'firstlast_distance' in fields:
+                path_distance, firstlast_distance = self._get_path_distances(message)
+            else:
+                path_distance = firstlast_distance = ""
             
             # Format phrase part - add colon and space if phrase exists
             phrase_part = f": {phrase}" if phrase else ""
@@ -5,18 +5,208 @@ Provides weather information using zip codes and NOAA APIs
 """
 
 import re
-import json
+import time
+import asyncio
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-import xml.dom.minidom
+import xml.etree.ElementTree as ET
+from io import BytesIO
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from geopy.geocoders import Nominatim
+from functools import lru_cache
 from ..utils import rate_limited_nominatim_geocode_sync, rate_limited_nominatim_reverse_sync, get_nominatim_geocoder, geocode_zipcode_sync, geocode_city_sync
-import maidenhead as mh
 from .base_command import BaseCommand
 from ..models import MeshMessage
 
+# US state name -> postal abbreviation, and the reverse
+STATE_ABBREVIATIONS = {
+    'Washington': 'WA', 'California': 'CA', 'New York': 'NY', 'Texas': 'TX',
+    'Florida': 'FL', 'Illinois': 'IL', 'Pennsylvania': 'PA', 'Ohio': 'OH',
+    'Georgia': 'GA', 'North Carolina': 'NC', 'Michigan': 'MI', 'New Jersey': 'NJ',
+    'Virginia': 'VA', 'Tennessee': 'TN', 'Indiana': 'IN', 'Arizona': 'AZ',
+    'Massachusetts': 'MA', 'Missouri': 'MO', 'Maryland': 'MD', 'Wisconsin': 'WI',
+    'Colorado': 'CO', 'Minnesota': 'MN', 'South Carolina': 'SC', 'Alabama': 'AL',
+    'Louisiana': 'LA', 'Kentucky': 'KY', 'Oregon': 'OR', 'Oklahoma': 'OK',
+    'Connecticut': 'CT', 'Utah': 'UT', 'Iowa': 'IA', 'Nevada': 'NV',
+    'Arkansas': 'AR', 'Mississippi': 'MS', 'Kansas': 'KS', 'New Mexico': 'NM',
+    'Nebraska': 'NE', 'West Virginia': 'WV', 'Idaho': 'ID', 'Hawaii': 'HI',
+    'New Hampshire': 'NH', 'Maine': 'ME', 'Montana': 'MT', 'Rhode Island': 'RI',
+    'Delaware': 'DE', 'South Dakota': 'SD', 'North Dakota': 'ND', 'Alaska': 'AK',
+    'Vermont': 'VT', 'Wyoming': 'WY'
+}
+STATE_NAMES = {abbrev: name for name, abbrev in STATE_ABBREVIATIONS.items()}
+
+_DAY_NAMES = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+_NEXT_DAY_WORDS = ('tomorrow',) + _DAY_NAMES
+
+# Condition keyword -> emoji, checked in order (first match wins)
+_WEATHER_EMOJI_KEYWORDS = (
+    ('sunny', "☀️"), ('clear', "☀️"),
+    ('heavy rain', "🌧️"), ('heavy showers', "🌧️"), ('excessive rain', "🌧️"),  # Cloud with rain - more rain, less sun
+    ('cloudy', "☁️"), ('overcast', "☁️"),
+    ('partly cloudy', "⛅"), ('mostly cloudy', "⛅"),
+    ('rain', "🌦️"), ('showers', "🌦️"),
+    ('thunderstorm', "⛈️"), ('thunderstorms', "⛈️"),
+    ('snow', "❄️"), ('snow showers', "❄️"),
+    ('fog', "🌫️"), ('mist', "🌫️"), ('haze', "🌫️"),
+    ('smoke', "💨"),
+    ('windy', "💨"), ('breezy', "💨"),
+)
+
+# Wind direction words -> emoji + abbreviation, checked in order (first match wins)
+_WIND_DIRECTION_ABBREVIATIONS = (
+    ("NORTHWEST", "↖️NW"),
+    ("NORTHEAST", "↗️NE"),
+    ("SOUTHWEST", "↙️SW"),
+    ("SOUTHEAST", "↘️SE"),
+    ("NORTH", "⬆️N"),
+    ("EAST", "➡️E"),
+    ("SOUTH", "⬇️S"),
+    ("WEST", "⬅️W"),
+)
+
+_ZIPCODE_RE = re.compile(r'^\d{5}$')
+_WIND_SPEED_RE = re.compile(r'(\d+)')
+
+# Emojis typically take 2 display units in terminals/clients (basic emoji pattern)
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U00002702-\U000027B0"  # dingbats
+    "\U000024C2-\U0001F251"  # enclosed characters
+    "]+",
+    flags=re.UNICODE
+)
+
+# Look for patterns like "humidity 45%" or "45% humidity"
+_HUMIDITY_PATTERNS = (
+    re.compile(r'humidity\s+(\d+)%'),
+    re.compile(r'(\d+)%\s+humidity'),
+    re.compile(r'relative humidity\s+(\d+)%'),
+    re.compile(r'(\d+)%\s+relative humidity'),
+)
+
+# Look for patterns like "20% chance" or "chance of rain 30%"
+_PRECIP_PATTERNS = (
+    re.compile(r'(\d+)%\s+chance'),
+    re.compile(r'chance\s+of\s+\w+\s+(\d+)%'),
+    re.compile(r'(\d+)%\s+probability'),
+    re.compile(r'probability\s+of\s+\w+\s+(\d+)%'),
+)
+
+# Look for more specific patterns to avoid false matches
+_HIGH_LOW_PATTERNS = (
+    re.compile(r'high\s+near\s+(\d+).*?low\s+around\s+(\d+)'),
+    re.compile(r'high\s+(\d+).*?low\s+(\d+)'),
+    re.compile(r'(\d+)\s+to\s+(\d+)\s+degrees'),  # More specific
+    re.compile(r'temperature\s+(\d+)\s+to\s+(\d+)'),
+    re.compile(r'high\s+near\s+(\d+).*?temperatures\s+falling\s+to\s+around\s+(\d+)'),  # "High near 82, with temperatures falling to around 80"
+    re.compile(r'low\s+around\s+(\d+)'),  # Just low temp
+    re.compile(r'high\s+near\s+(\d+)'),  # Just high temp
+)
+
+# Look for UV index patterns
+_UV_PATTERNS = (
+    re.compile(r'uv\s+index\s+(\d+)'),
+    re.compile(r'uv\s+(\d+)'),
+    re.compile(r'ultraviolet\s+index\s+(\d+)'),
+)
+
+# Look for dew point patterns
+_DEW_POINT_PATTERNS = (
+    re.compile(r'dew point\s+(\d+)'),
+    re.compile(r'dewpoint\s+(\d+)'),
+    re.compile(r'dew\s+point\s+(\d+)°'),
+)
+
+# Look for visibility patterns
+_VISIBILITY_PATTERNS = (
+    re.compile(r'visibility\s+(\d+)\s+miles'),
+    re.compile(r'visibility\s+(\d+)\s+mi'),
+    re.compile(r'(\d+)\s+mile\s+visibility'),
+    re.compile(r'(\d+)\s+mi\s+visibility'),
+)
+
+# Look for precipitation probability patterns
+_PRECIP_PROB_PATTERNS = (
+    re.compile(r'(\d+)%\s+chance\s+of\s+(?:rain|precipitation|showers)'),
+    re.compile(r'chance\s+of\s+(?:rain|precipitation|showers)\s+(\d+)%'),
+    re.compile(r'(\d+)%\s+probability\s+of\s+(?:rain|precipitation|showers)'),
+    re.compile(r'probability\s+of\s+(?:rain|precipitation|showers)\s+(\d+)%'),
+    re.compile(r'(\d+)%\s+chance'),
+    re.compile(r'chance\s+(\d+)%'),
+)
+
+# Look for wind gust patterns
+_GUST_PATTERNS = (
+    re.compile(r'gusts\s+to\s+(\d+)\s+mph'),
+    re.compile(r'gusts\s+up\s+to\s+(\d+)\s+mph'),
+    re.compile(r'wind\s+gusts\s+to\s+(\d+)\s+mph'),
+    re.compile(r'wind\s+gusts\s+up\s+to\s+(\d+)\s+mph'),
+    re.compile(r'gusts\s+(\d+)\s+mph'),
+    re.compile(r'wind\s+gusts\s+(\d+)\s+mph'),
+)
+
+# Look for pressure patterns (hPa, mb, inches of mercury)
+_PRESSURE_PATTERNS = (
+    re.compile(r'pressure\s+(\d+)\s*hpa'),
+    re.compile(r'pressure\s+(\d+)\s*mb'),
+    re.compile(r'barometric\s+pressure\s+(\d+)\s*hpa'),
+    re.compile(r'barometric\s+pressure\s+(\d+)\s*mb'),
+    re.compile(r'(\d+)\s*hpa'),
+    re.compile(r'(\d+)\s*mb\s+pressure'),
+)
+
+# field -> (keywords every pattern needs, patterns, valid int range or None)
+_DETAIL_FIELDS = {
+    'humidity': (('humidity',), _HUMIDITY_PATTERNS, None),
+    'precip_chance': (('chance', 'probability'), _PRECIP_PATTERNS, None),
+    'uv_index': (('uv', 'ultraviolet'), _UV_PATTERNS, (0, 15)),
+    'dew_point': (('dew',), _DEW_POINT_PATTERNS, (-20, 80)),
+    'visibility': (('visibility',), _VISIBILITY_PATTERNS, (0, 20)),
+    'precip_probability': (('chance', 'probability'), _PRECIP_PROB_PATTERNS, (0, 100)),
+    'wind_gusts': (('gusts',), _GUST_PATTERNS, (10, 100)),
+    'pressure': (('hpa', 'mb'), _PRESSURE_PATTERNS, (600, 1100)),
+}
+
+
+@lru_cache(maxsize=64)
+def _parse_detailed(text: str) -> dict:
+    """Extract all detail fields from a detailedForecast, lowercasing it once"""
+    text = text.lower()
+    details = {}
+    for field, (keywords, patterns, valid_range) in _DETAIL_FIELDS.items():
+        details[field] = ""
+        # Skip the regex scans when none of the field's keywords appear
+        if not any(keyword in text for keyword in keywords):
+            continue
+        for pattern in patterns:
+            match = pattern.search(text)
+            if match:
+                value = match.group(1)
+                if valid_range is None or valid_range[0] <= int(value) <= valid_range[1]:
+                    details[field] = value
+                    break
+    return details
+
+
+def _xml_local_name(tag: str) -> str:
+    """Strip the '{namespace}' prefix ElementTree adds to tag names"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _xml_find(elem, local_name: str):
+    """Return the first descendant of elem with the given local tag name, or None"""
+    for node in elem.iter():
+        if node is not elem and _xml_local_name(node.tag) == local_name:
+            return node
+    return None
+
+
 # Import for delegation when using Open-Meteo provider
 try:
     from .alternatives.wx_international import GlobalWxCommand
@@ -42,9 +232,23 @@ class WxCommand(BaseCommand):
     ERROR_FETCHING_DATA = "Error fetching weather data"
     NO_ALERTS = "No weather alerts"
     
+    # NOAA /points properties kept in the cache; the point -> grid mapping rarely changes
+    NOAA_POINTS_FIELDS = ('forecast', 'forecastHourly', 'observationStations', 'relativeLocation', 'timeZone')
+    NOAA_POINTS_CACHE_HOURS = 168
+    
+    # Identical NOAA fetches share one request while in flight and reuse the result briefly
+    NOAA_RESULT_TTL = 30  # seconds
+    MAX_CACHED_NOAA_RESULTS = 64
+    
+    # Hourly periods kept from NOAA's ~156-hour feed; a 130-char reply shows about a dozen,
+    # and the extra margin covers past hours a stale feed may still lead with
+    MAX_HOURLY_PERIODS = 48
+    
     def __init__(self, bot):
         super().__init__(bot)
         self.wx_enabled = self.get_config_value('Wx_Command', 'enabled', fallback=True, value_type='bool')
+        # Built once, after translated keywords have been merged in
+        self._keyword_prefixes = tuple(keyword + ' ' for keyword in self.keywords)
         
         # Check weather provider setting - delegate to international command if using Open-Meteo
         weather_provider = bot.config.get('Weather', 'weather_provider', fallback='noaa').lower()
@@ -69,9 +273,9 @@ class WxCommand(BaseCommand):
             # Get default state from config for city disambiguation
             self.default_state = self.bot.config.get('Weather', 'default_state', fallback='WA')
             
-            # Initialize geocoder (will use rate-limited helpers for actual calls)
-            # Keep geolocator for backwards compatibility, but prefer rate-limited helpers
-            self.geolocator = get_nominatim_geocoder()
+            # Geocoder is created on first access (see geolocator); actual calls
+            # go through the rate-limited helpers
+            self._geolocator = None
             
             # Get database manager for geocoding cache
             self.db_manager = bot.db_manager
@@ -79,10 +283,23 @@ class WxCommand(BaseCommand):
             # Create a retry-enabled session for NOAA API calls
             # This makes the API more resilient to timeouts and transient errors
             self.noaa_session = self._create_retry_session()
+            
+            # Shared NOAA fetches: key -> task while in flight, key -> (expires, result) after
+            self._noaa_inflight = {}
+            self._noaa_results = OrderedDict()
+    
+    @property
+    def geolocator(self):
+        """Nominatim geocoder, kept for backwards compatibility and built on first use"""
+        if self._geolocator is None:
+            self._geolocator = get_nominatim_geocoder()
+        return self._geolocator
     
     def _create_retry_session(self) -> requests.Session:
         """Create a requests session with retry logic for NOAA API calls"""
         session = requests.Session()
+        # NOAA asks API clients to identify themselves; every request on the session sends this
+        session.headers['User-Agent'] = self.bot.config.get('Weather', 'noaa_user_agent', fallback='MeshCoreBot/1.0 Weather')
         
         # Configure retry strategy
         # Retry on: connection errors, timeout errors, and 5xx server errors
@@ -122,11 +339,7 @@ class WxCommand(BaseCommand):
         content = message.content.strip()
         if content.startswith('!'):
             content = content[1:].strip()
-        content_lower = content.lower()
-        for keyword in self.keywords:
-            if content_lower.startswith(keyword + ' '):
-                return True
-        return False
+        return content.lower().startswith(self._keyword_prefixes)
     
     def can_execute(self, message: MeshMessage) -> bool:
         """Override to delegate or use base class cooldown"""
@@ -205,7 +418,7 @@ class WxCommand(BaseCommand):
             return True
         
         # Check if it's a zipcode (5 digits) or city name
-        if re.match(r'^\d{5}$', location):
+        if _ZIPCODE_RE.match(location):
             # It's a zipcode
             location_type = "zipcode"
         else:
@@ -221,12 +434,12 @@ class WxCommand(BaseCommand):
                 # Get alerts only (no weather forecast)
                 lat, lon = None, None
                 if location_type == "zipcode":
-                    lat, lon = self.zipcode_to_lat_lon(location)
+                    lat, lon = await asyncio.to_thread(self.zipcode_to_lat_lon, location)
                     if lat is None or lon is None:
                         await self.send_response(message, self.translate('commands.wx.no_location_zipcode', location=location))
                         return True
                 else:  # city
-                    result = self.city_to_lat_lon(location)
+                    result = await asyncio.to_thread(self.city_to_lat_lon, location)
                     if len(result) == 3:
                         lat, lon, address_info = result
                     else:
@@ -248,7 +461,6 @@ class WxCommand(BaseCommand):
                 await self.send_response(message, weather_data[1])
                 
                 # Wait for bot TX rate limiter to allow next message
-                import asyncio
                 rate_limit = self.bot.config.getfloat('Bot', 'bot_tx_rate_limit_seconds', fallback=1.0)
                 # Use a conservative sleep time to avoid rate limiting
                 sleep_time = max(rate_limit + 1.0, 2.0)  # At least 2 seconds, or rate_limit + 1 second
@@ -282,14 +494,14 @@ class WxCommand(BaseCommand):
             num_days: Number of days for multiday forecast (2-7)
         """
         try:
-            # Convert location to lat/lon
+            # Convert location to lat/lon (blocking geocoder calls run off the event loop)
             if location_type == "zipcode":
-                lat, lon = self.zipcode_to_lat_lon(location)
+                lat, lon = await asyncio.to_thread(self.zipcode_to_lat_lon, location)
                 if lat is None or lon is None:
                     return self.translate('commands.wx.no_location_zipcode', location=location)
                 address_info = None
             else:  # city
-                result = self.city_to_lat_lon(location)
+                result = await asyncio.to_thread(self.city_to_lat_lon, location)
                 if len(result) == 3:
                     lat, lon, address_info = result
                 else:
@@ -313,29 +525,13 @@ class WxCommand(BaseCommand):
                     actual_state = address_info.get('state', self.default_state)
                     # Convert full state name to abbreviation if needed
                     if len(actual_state) > 2:
-                        state_abbrev_map = {
-                            'Washington': 'WA', 'California': 'CA', 'New York': 'NY', 'Texas': 'TX',
-                            'Florida': 'FL', 'Illinois': 'IL', 'Pennsylvania': 'PA', 'Ohio': 'OH',
-                            'Georgia': 'GA', 'North Carolina': 'NC', 'Michigan': 'MI', 'New Jersey': 'NJ',
-                            'Virginia': 'VA', 'Tennessee': 'TN', 'Indiana': 'IN', 'Arizona': 'AZ',
-                            'Massachusetts': 'MA', 'Missouri': 'MO', 'Maryland': 'MD', 'Wisconsin': 'WI',
-                            'Colorado': 'CO', 'Minnesota': 'MN', 'South Carolina': 'SC', 'Alabama': 'AL',
-                            'Louisiana': 'LA', 'Kentucky': 'KY', 'Oregon': 'OR', 'Oklahoma': 'OK',
-                            'Connecticut': 'CT', 'Utah': 'UT', 'Iowa': 'IA', 'Nevada': 'NV',
-                            'Arkansas': 'AR', 'Mississippi': 'MS', 'Kansas': 'KS', 'New Mexico': 'NM',
-                            'Nebraska': 'NE', 'West Virginia': 'WV', 'Idaho': 'ID', 'Hawaii': 'HI',
-                            'New Hampshire': 'NH', 'Maine': 'ME', 'Montana': 'MT', 'Rhode Island': 'RI',
-                            'Delaware': 'DE', 'South Dakota': 'SD', 'North Dakota': 'ND', 'Alaska': 'AK',
-                            'Vermont': 'VT', 'Wyoming': 'WY'
-                        }
-                        actual_state = state_abbrev_map.get(actual_state, actual_state)
+                        actual_state = STATE_ABBREVIATIONS.get(actual_state, actual_state)
                     
                     # Also check if the default state needs to be converted for comparison
                     default_state_full = self.default_state
                     if len(self.default_state) == 2:
                         # Convert abbreviation to full name for comparison
-                        abbrev_to_full_map = {v: k for k, v in state_abbrev_map.items()}
-                        default_state_full = abbrev_to_full_map.get(self.default_state, self.default_state)
+                        default_state_full = STATE_NAMES.get(self.default_state, self.default_state)
             
             # Add location info if city is in a different state than default
             location_prefix = ""
@@ -346,24 +542,29 @@ class WxCommand(BaseCommand):
                 if states_different:
                     location_prefix = f"{actual_city}, {actual_state}: "
             
-            # Get weather forecast based on type
+            # Get weather forecast based on type (NOAA requests run in worker threads
+            # and are shared between concurrent requests for the same location)
             if forecast_type == "tomorrow":
-                forecast_periods, points_data = self.get_noaa_weather(lat, lon, return_periods=True)
+                forecast_periods, points_data = await self._fetch_noaa_shared(self.get_noaa_weather, lat, lon, True)
                 if forecast_periods == self.ERROR_FETCHING_DATA:
                     return self.translate('commands.wx.error_fetching')
                 weather = self.format_tomorrow_forecast(forecast_periods)
             elif forecast_type == "multiday":
-                forecast_periods, points_data = self.get_noaa_weather(lat, lon, return_periods=True)
+                forecast_periods, points_data = await self._fetch_noaa_shared(self.get_noaa_weather, lat, lon, True)
                 if forecast_periods == self.ERROR_FETCHING_DATA:
                     return self.translate('commands.wx.error_fetching')
                 weather = self.format_multiday_forecast(forecast_periods, num_days)
             elif forecast_type == "hourly":
-                hourly_periods, points_data = self.get_noaa_hourly_weather(lat, lon)
+                hourly_periods, points_data = await self._fetch_noaa_shared(self.get_noaa_hourly_weather, lat, lon)
                 if hourly_periods == self.ERROR_FETCHING_DATA:
                     return self.translate('commands.wx.error_fetching')
                 weather = self.format_hourly_forecast(hourly_periods)
             else:  # default
-                weather, points_data = self.get_noaa_weather(lat, lon)
+                # Fetch the forecast and the alerts at the same time
+                (weather, points_data), alerts_result = await asyncio.gather(
+                    self._fetch_noaa_shared(self.get_noaa_weather, lat, lon),
+                    self._fetch_noaa_shared(self.get_weather_alerts_noaa, lat, lon, False),
+                )
                 if weather == self.ERROR_FETCHING_DATA:
                     return self.translate('commands.wx.error_fetching')
                 
@@ -372,7 +573,6 @@ class WxCommand(BaseCommand):
             
             # Get weather alerts (only for default forecast type to avoid cluttering)
             if forecast_type == "default":
-                alerts_result = self.get_weather_alerts_noaa(lat, lon, return_full_data=False)
                 if alerts_result == self.ERROR_FETCHING_DATA:
                     alerts_info = None
                 elif alerts_result == self.NO_ALERTS:
@@ -381,7 +581,7 @@ class WxCommand(BaseCommand):
                     full_alert_text, abbreviated_alert_text, alert_count = alerts_result
                     if alert_count > 0:
                         # Get full alert data for prioritized formatting
-                        alerts_full_result = self.get_weather_alerts_noaa(lat, lon, return_full_data=True)
+                        alerts_full_result = await self._fetch_noaa_shared(self.get_weather_alerts_noaa, lat, lon, True)
                         if alerts_full_result not in [self.ERROR_FETCHING_DATA, self.NO_ALERTS]:
                             alerts_list, _ = alerts_full_result
                             # Format with prioritization and summary
@@ -432,6 +632,79 @@ class WxCommand(BaseCommand):
             self.logger.error(f"Error geocoding city {city}: {e}")
             return None, None, None
     
+    async def _fetch_noaa_shared(self, fetch, lat: float, lon: float, *args):
+        """Run a blocking NOAA fetch in a worker thread, coalescing identical requests
+        
+        Concurrent callers with the same fetch and location await a single request, and
+        successful results are reused for NOAA_RESULT_TTL seconds.
+        """
+        key = (fetch.__name__, round(lat, 4), round(lon, 4)) + args
+        cached = self._noaa_results.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        task = self._noaa_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(asyncio.to_thread(fetch, lat, lon, *args))
+            self._noaa_inflight[key] = task
+            task.add_done_callback(lambda done: self._store_noaa_result(key, done))
+        # Shield so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    def _store_noaa_result(self, key: tuple, task: asyncio.Future):
+        """Drop a finished fetch from the in-flight map and cache it if it succeeded"""
+        self._noaa_inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if self.ERROR_FETCHING_DATA in (result if isinstance(result, tuple) else (result,)):
+            return
+        
+        results = self._noaa_results
+        results[key] = (time.monotonic() + self.NOAA_RESULT_TTL, result)
+        results.move_to_end(key)
+        while len(results) > self.MAX_CACHED_NOAA_RESULTS:
+            results.popitem(last=False)
+    
+    def get_noaa_points(self, lat: float, lon: float) -> dict:
+        """Get NOAA /points data for a location, cached for NOAA_POINTS_CACHE_HOURS
+        
+        Only the properties in NOAA_POINTS_FIELDS are kept, in the same
+        {'properties': {...}} shape as the API response.
+        
+        Args:
+            lat: Latitude
+            lon: Longitude
+        
+        Returns:
+            Points data dict, or None if it could not be fetched
+        """
+        # Round coordinates to 4 decimal places to avoid API redirects
+        lat_rounded = round(lat, 4)
+        lon_rounded = round(lon, 4)
+        
+        cache_key = f"noaa_points_{lat_rounded}_{lon_rounded}"
+        cached_points = self.db_manager.get_cached_json(cache_key, "noaa_points")
+        if cached_points:
+            return cached_points
+        
+        # Get weather data from NOAA
+        weather_api = f"https://api.weather.gov/points/{lat_rounded},{lon_rounded}"
+        try:
+            weather_data = self.noaa_session.get(weather_api, timeout=self.url_timeout)
+            if not weather_data.ok:
+                self.logger.warning(f"Error fetching weather data from NOAA: HTTP {weather_data.status_code}")
+                return None
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            self.logger.warning(f"Timeout/connection error fetching weather data from NOAA: {e}")
+            return None
+        
+        properties = weather_data.json()['properties']
+        points_data = {'properties': {field: properties.get(field) for field in self.NOAA_POINTS_FIELDS}}
+        if properties.get('forecast'):
+            self.db_manager.cache_json(cache_key, points_data, "noaa_points", cache_hours=self.NOAA_POINTS_CACHE_HOURS)
+        return points_data
+    
     def get_noaa_weather(self, lat: float, lon: float, return_periods: bool = False) -> tuple:
         """Get weather forecast from NOAA and return both weather string and points data
         
@@ -444,24 +717,10 @@ class WxCommand(BaseCommand):
             Tuple of (weather_string_or_periods, points_data)
         """
         try:
-            # Round coordinates to 4 decimal places to avoid API redirects
-            lat_rounded = round(lat, 4)
-            lon_rounded = round(lon, 4)
-            
-            # Get weather data from NOAA
-            weather_api = f"https://api.weather.gov/points/{lat_rounded},{lon_rounded}"
-            
-            # Get the forecast URL (with retry logic)
-            try:
-                weather_data = self.noaa_session.get(weather_api, timeout=self.url_timeout)
-                if not weather_data.ok:
-                    self.logger.warning(f"Error fetching weather data from NOAA: HTTP {weather_data.status_code}")
-                    return self.ERROR_FETCHING_DATA, None
-            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
-                self.logger.warning(f"Timeout/connection error fetching weather data from NOAA: {e}")
+            # Get the forecast URLs for this point (cached, with retry logic)
+            weather_json = self.get_noaa_points(lat, lon)
+            if weather_json is None:
                 return self.ERROR_FETCHING_DATA, None
-            
-            weather_json = weather_data.json()
             forecast_url = weather_json['properties']['forecast']
             
             # Get the forecast (with retry logic)
@@ -497,7 +756,6 @@ class WxCommand(BaseCommand):
             detailed_forecast = current.get('detailedForecast', '')
             
             # Extract additional useful info from detailed forecast
-            humidity = self.extract_humidity(detailed_forecast)
             precip_chance = self.extract_precip_chance(detailed_forecast)
             
             # Create compact but complete weather string with emoji
@@ -506,7 +764,7 @@ class WxCommand(BaseCommand):
             
             # Add wind info if available
             if wind_speed and wind_direction:
-                wind_match = re.search(r'(\d+)', wind_speed)
+                wind_match = _WIND_SPEED_RE.search(wind_speed)
                 if wind_match:
                     wind_num = wind_match.group(1)
                     wind_dir = self.abbreviate_wind_direction(wind_direction)
@@ -521,96 +779,91 @@ class WxCommand(BaseCommand):
             # Additional periods will only be added if there's remaining space
             # Pass observation_data to use real-time station data instead of parsing from text
             weather = self._add_period_details(weather, detailed_forecast, 0, max_length=120, observation_data=observation_data)
+            # Running display width; appended pieces all start with a space so widths add up
+            weather_width = self._count_display_width(weather)
             
             # Also add precipitation chance if available (not in helper function)
-            if precip_chance and self._count_display_width(weather) < 120:
-                weather += f" 🌦️{precip_chance}%"
+            if precip_chance and weather_width < 120:
+                precip_str = f" 🌦️{precip_chance}%"
+                weather += precip_str
+                weather_width += self._count_display_width(precip_str)
             
             # Also add UV index if available (not in helper function)
             uv_index = self.extract_uv_index(detailed_forecast)
-            if uv_index and self._count_display_width(weather) < 120:
-                weather += f" UV{uv_index}"
+            if uv_index and weather_width < 120:
+                uv_str = f" UV{uv_index}"
+                weather += uv_str
+                weather_width += self._count_display_width(uv_str)
             
             # Add next period (Today, Tonight) and Tomorrow if available
             # First, find Today, Tonight, and Tomorrow periods
             today_period = None
             tonight_period = None
             tomorrow_period = None
-            current_period_name = current.get('name', '').lower()
+            # Lowercase each period name once for all of the scans below
+            period_names = [period.get('name', '').lower() for period in forecast]
+            current_period_name = period_names[0]
             is_current_tonight = 'tonight' in current_period_name
             is_current_night = any(word in current_period_name for word in ['tonight', 'overnight', 'night'])
             
             # Check if current period is a night period (Overnight, Tonight, etc.)
             # If so, we should prioritize showing the upcoming daytime period (Today)
-            for i, period in enumerate(forecast):
-                period_name = period.get('name', '').lower()
+            for i, period_name in enumerate(period_names):
                 # Look for "Today" period (daytime forecast)
                 if 'today' in period_name and today_period is None and i > 0:
                     # Make sure it's not a night period
                     if 'night' not in period_name and 'tonight' not in period_name:
-                        today_period = (i, period)
+                        today_period = (i, forecast[i])
                 elif 'tonight' in period_name and tonight_period is None:
-                    tonight_period = (i, period)
+                    tonight_period = (i, forecast[i])
                 elif 'tomorrow' in period_name and tomorrow_period is None:
-                    tomorrow_period = (i, period)
+                    tomorrow_period = (i, forecast[i])
+                if today_period and tonight_period and tomorrow_period:
+                    break
             
             # If current is a night period and we haven't found Today yet, look for next daytime period
             if is_current_night and not today_period:
-                # Look for the next period that's not a night period
-                for i, period in enumerate(forecast):
-                    if i > 0:  # Skip current period
-                        period_name = period.get('name', '').lower()
-                        # Look for daytime periods (Today, or day names without "night")
-                        if 'today' in period_name and 'night' not in period_name:
-                            today_period = (i, period)
-                            break
-                        # Also check for day names that aren't night periods
-                        day_names = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-                        if any(day in period_name for day in day_names) and 'night' not in period_name:
-                            today_period = (i, period)
-                            break
+                # Look for the next period that's not a night period (skip current period)
+                for i in range(1, len(forecast)):
+                    period_name = period_names[i]
+                    # Look for daytime periods (Today, or day names without "night")
+                    if 'night' not in period_name and ('today' in period_name or any(day in period_name for day in _DAY_NAMES)):
+                        today_period = (i, forecast[i])
+                        break
             
             # If current is Tonight and we haven't found Tomorrow yet, look for next day's periods
             if is_current_tonight and not tomorrow_period:
                 # If today_period is a day name (not "Today"), look for the next period after it
                 if today_period:
-                    period_name_lower = today_period[1].get('name', '').lower()
-                    day_names = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-                    if any(day in period_name_lower for day in day_names) and 'today' not in period_name_lower:
+                    period_name_lower = period_names[today_period[0]]
+                    if any(day in period_name_lower for day in _DAY_NAMES) and 'today' not in period_name_lower:
                         # today_period is actually tomorrow's daytime period - look for the night period after it
-                        today_period_index = today_period[0]
-                        # Look for the next period after today_period (should be the night period for that day)
-                        for i, period in enumerate(forecast):
-                            if i > today_period_index:  # Look for periods after today_period
-                                period_name = period.get('name', '').lower()
-                                # Look for the night period for the same day, or the next day
-                                if any(word in period_name for word in ['night', 'tomorrow', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']):
-                                    tomorrow_period = (i, period)
-                                    break
+                        # (should be the night period for that day, or the next day)
+                        for i in range(today_period[0] + 1, len(forecast)):
+                            period_name = period_names[i]
+                            if 'night' in period_name or any(word in period_name for word in _NEXT_DAY_WORDS):
+                                tomorrow_period = (i, forecast[i])
+                                break
                         # If we didn't find a night period, use today_period as tomorrow_period
                         if not tomorrow_period:
                             tomorrow_period = today_period
                     else:
                         # Look for periods after Tonight (next day)
-                        for i, period in enumerate(forecast):
-                            if i > 0:  # Skip current period
-                                period_name = period.get('name', '').lower()
-                                # Skip if this period is already set as today_period (avoid duplicates)
-                                if today_period and today_period[0] == i:
-                                    continue
-                                # Look for tomorrow, next day, or day names
-                                if any(word in period_name for word in ['tomorrow', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']):
-                                    tomorrow_period = (i, period)
-                                    break
-                else:
-                    # Look for periods after Tonight (next day)
-                    for i, period in enumerate(forecast):
-                        if i > 0:  # Skip current period
-                            period_name = period.get('name', '').lower()
+                        for i in range(1, len(forecast)):
+                            # Skip if this period is already set as today_period (avoid duplicates)
+                            if today_period[0] == i:
+                                continue
                             # Look for tomorrow, next day, or day names
-                            if any(word in period_name for word in ['tomorrow', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']):
-                                tomorrow_period = (i, period)
+                            if any(word in period_names[i] for word in _NEXT_DAY_WORDS):
+                                tomorrow_period = (i, forecast[i])
                                 break
+                else:
+                    # Look for periods after Tonight (next day)
+                    for i in range(1, len(forecast)):
+                        # Look for tomorrow, next day, or day names
+                        if any(word in period_names[i] for word in _NEXT_DAY_WORDS):
+                            tomorrow_period = (i, forecast[i])
+                            break
             
             # If current is a night period, prioritize adding Today (the upcoming daytime)
             # When today_period is a day name (like "Tuesday"), we still add it as tomorrow's daytime period
@@ -636,20 +889,20 @@ class WxCommand(BaseCommand):
                     
                     # Add wind info if space allows (using display width)
                     if period_wind_speed and period_wind_direction:
-                        test_str = weather + period_str
-                        if self._count_display_width(test_str) < 120:
-                            wind_match = re.search(r'(\d+)', period_wind_speed)
+                        test_width = weather_width + self._count_display_width(period_str)
+                        if test_width < 120:
+                            wind_match = _WIND_SPEED_RE.search(period_wind_speed)
                             if wind_match:
                                 wind_num = wind_match.group(1)
                                 wind_dir = self.abbreviate_wind_direction(period_wind_direction)
                                 if wind_dir:
                                     wind_info = f" {wind_dir}{wind_num}"
-                                    if self._count_display_width(test_str + wind_info) <= 130:
+                                    if test_width + self._count_display_width(wind_info) <= 130:
                                         period_str += wind_info
                     
                     # Add additional details (humidity, dew point, visibility, etc.)
                     # But only if current period isn't too long - prioritize current period details
-                    current_weather_len = self._count_display_width(weather)
+                    current_weather_len = weather_width
                     # Only add details to additional periods if current period is under 110 chars
                     # This ensures we prioritize current period details first
                     if current_weather_len < 110:
@@ -657,8 +910,10 @@ class WxCommand(BaseCommand):
                     
                     # Only add if we have space (using display width)
                     # Be more conservative - only add if current period is reasonable length
-                    if current_weather_len < 110 and self._count_display_width(weather + period_str) <= 130:
+                    period_width = self._count_display_width(period_str)
+                    if current_weather_len < 110 and weather_width + period_width <= 130:
                         weather += period_str
+                        weather_width += period_width
             
             # Add Tonight if it's the immediate next period (and current is not already Tonight)
             # If we already added Today, we can still add Tonight if it's the next period after Today
@@ -694,20 +949,20 @@ class WxCommand(BaseCommand):
                         
                         # Add wind info if space allows (using display width)
                         if period_wind_speed and period_wind_direction:
-                            test_str = weather + period_str
-                            if self._count_display_width(test_str) < 120:
-                                wind_match = re.search(r'(\d+)', period_wind_speed)
+                            test_width = weather_width + self._count_display_width(period_str)
+                            if test_width < 120:
+                                wind_match = _WIND_SPEED_RE.search(period_wind_speed)
                                 if wind_match:
                                     wind_num = wind_match.group(1)
                                     wind_dir = self.abbreviate_wind_direction(period_wind_direction)
                                     if wind_dir:
                                         wind_info = f" {wind_dir}{wind_num}"
-                                        if self._count_display_width(test_str + wind_info) <= 130:
+                                        if test_width + self._count_display_width(wind_info) <= 130:
                                             period_str += wind_info
                         
                     # Add additional details (humidity, dew point, visibility, etc.)
                     # But only if current period isn't too long - prioritize current period details
-                    current_weather_len = self._count_display_width(weather)
+                    current_weather_len = weather_width
                     # Only add details to additional periods if current period is under 110 chars
                     # This ensures we prioritize current period details first
                     if current_weather_len < 110:
@@ -715,8 +970,10 @@ class WxCommand(BaseCommand):
                     
                     # Only add if we have space (using display width)
                     # Be more conservative - only add if current period is reasonable length
-                    if current_weather_len < 110 and self._count_display_width(weather + period_str) <= 130:
+                    period_width = self._count_display_width(period_str)
+                    if current_weather_len < 110 and weather_width + period_width <= 130:
                         weather += period_str
+                        weather_width += period_width
             
             # Always try to add Tomorrow if available (especially if current is Tonight)
             # Prioritize adding Tomorrow when current is Tonight to use more of the 130 char limit
@@ -780,20 +1037,20 @@ class WxCommand(BaseCommand):
                     # Be more aggressive about adding wind when current is a night period
                     wind_threshold = 115 if (is_current_tonight or is_current_night) else 120
                     if period_wind_speed and period_wind_direction:
-                        test_str = weather + period_str
-                        if self._count_display_width(test_str) < wind_threshold:
-                            wind_match = re.search(r'(\d+)', period_wind_speed)
+                        test_width = weather_width + self._count_display_width(period_str)
+                        if test_width < wind_threshold:
+                            wind_match = _WIND_SPEED_RE.search(period_wind_speed)
                             if wind_match:
                                 wind_num = wind_match.group(1)
                                 wind_dir = self.abbreviate_wind_direction(period_wind_direction)
                                 if wind_dir:
                                     wind_info = f" {wind_dir}{wind_num}"
-                                    if self._count_display_width(test_str + wind_info) <= 130:
+                                    if test_width + self._count_display_width(wind_info) <= 130:
                                         period_str += wind_info
                     
                     # Add additional details (humidity, dew point, visibility, etc.)
                     # But only if current period isn't too long - prioritize current period details
-                    current_weather_len = self._count_display_width(weather)
+                    current_weather_len = weather_width
                     # Only add details to additional periods if current period is under 110 chars
                     # This ensures we prioritize current period details first
                     if current_weather_len < 110:
@@ -803,14 +1060,15 @@ class WxCommand(BaseCommand):
                     # Only add if we have space (using display width, prioritize current period)
                     # Be more aggressive about adding tomorrow_period when current is Tonight and we have space
                     max_chars = 128 if (is_current_tonight or is_current_night) else 130
+                    period_width = self._count_display_width(period_str)
                     # If current is Tonight and we have plenty of space, be more lenient with the length check
                     if is_current_tonight or is_current_night:
                         # Allow adding tomorrow_period if we're under 120 chars (more lenient than 110)
-                        if current_weather_len < 120 and self._count_display_width(weather + period_str) <= max_chars:
+                        if current_weather_len < 120 and weather_width + period_width <= max_chars:
                             weather += period_str
                     else:
                         # For non-night periods, use the stricter check
-                        if current_weather_len < 110 and self._count_display_width(weather + period_str) <= max_chars:
+                        if current_weather_len < 110 and weather_width + period_width <= max_chars:
                             weather += period_str
             
             return weather, weather_json
@@ -830,24 +1088,10 @@ class WxCommand(BaseCommand):
             Tuple of (hourly_periods_list, points_data)
         """
         try:
-            # Round coordinates to 4 decimal places to avoid API redirects
-            lat_rounded = round(lat, 4)
-            lon_rounded = round(lon, 4)
-            
-            # Get weather data from NOAA
-            weather_api = f"https://api.weather.gov/points/{lat_rounded},{lon_rounded}"
-            
-            # Get the forecast URL (with retry logic)
-            try:
-                weather_data = self.noaa_session.get(weather_api, timeout=self.url_timeout)
-                if not weather_data.ok:
-                    self.logger.warning(f"Error fetching weather data from NOAA: HTTP {weather_data.status_code}")
-                    return self.ERROR_FETCHING_DATA, None
-            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
-                self.logger.warning(f"Timeout/connection error fetching weather data from NOAA: {e}")
+            # Get the forecast URLs for this point (cached, with retry logic)
+            weather_json = self.get_noaa_points(lat, lon)
+            if weather_json is None:
                 return self.ERROR_FETCHING_DATA, None
-            
-            weather_json = weather_data.json()
             hourly_forecast_url = weather_json['properties'].get('forecastHourly')
             
             if not hourly_forecast_url:
@@ -864,8 +1108,9 @@ class WxCommand(BaseCommand):
                 self.logger.warning(f"Timeout/connection error fetching hourly forecast from NOAA: {e}")
                 return self.ERROR_FETCHING_DATA, None
             
+            # Keep only the leading periods so the formatter and result cache don't hold the whole week
             hourly_json = hourly_data.json()
-            hourly_periods = hourly_json['properties']['periods']
+            hourly_periods = hourly_json['properties']['periods'][:self.MAX_HOURLY_PERIODS]
             
             if not hourly_periods:
                 self.logger.warning("No hourly periods returned from NOAA")
@@ -997,7 +1242,7 @@ class WxCommand(BaseCommand):
                 
                 # Add wind if available (use compact format)
                 if wind_speed and wind_direction:
-                    wind_match = re.search(r'(\d+)', wind_speed)
+                    wind_match = _WIND_SPEED_RE.search(wind_speed)
                     if wind_match:
                         wind_num = wind_match.group(1)
                         # Get direction abbreviation (first 1-2 chars)
@@ -1096,7 +1341,7 @@ class WxCommand(BaseCommand):
                 
                 # Add wind info
                 if wind_speed and wind_direction:
-                    wind_match = re.search(r'(\d+)', wind_speed)
+                    wind_match = _WIND_SPEED_RE.search(wind_speed)
                     if wind_match:
                         wind_num = wind_match.group(1)
                         wind_dir = self.abbreviate_wind_direction(wind_direction)
@@ -1300,68 +1545,35 @@ class WxCommand(BaseCommand):
         # Always try to get precip_prob from detailed forecast (not in observation data)
         precip_prob = self.extract_precip_probability(detailed_forecast)
         
-        # Add humidity if available and space allows
-        # Try to add all available details, only skip if they would exceed max_length
-        if humidity:
-            humidity_str = f" {humidity}%RH"
-            if self._count_display_width(result + humidity_str) + current_weather_length <= max_length:
-                result += humidity_str
-                current_length = current_weather_length + self._count_display_width(result)
-        
-        # Add dew point if available and space allows
-        if dew_point:
-            dew_str = f" 💧{dew_point}°"
-            if self._count_display_width(result + dew_str) + current_weather_length <= max_length:
-                result += dew_str
-                current_length = current_weather_length + self._count_display_width(result)
-        
-        # Add visibility if available and space allows
-        if visibility:
-            vis_str = f" 👁️{visibility}mi"
-            if self._count_display_width(result + vis_str) + current_weather_length <= max_length:
-                result += vis_str
-                current_length = current_weather_length + self._count_display_width(result)
-        
-        # Add precipitation probability if available and space allows
-        if precip_prob:
-            precip_str = f" 🌦️{precip_prob}%"
-            if self._count_display_width(result + precip_str) + current_weather_length <= max_length:
-                result += precip_str
-                current_length = current_weather_length + self._count_display_width(result)
-        
-        # Add wind gusts if available and space allows
-        if wind_gusts:
-            gust_str = f" 💨{wind_gusts}"
-            if self._count_display_width(result + gust_str) + current_weather_length <= max_length:
-                result += gust_str
-                current_length = current_weather_length + self._count_display_width(result)
-        
-        # Add pressure if available and space allows
-        if pressure:
-            pressure_str = f" 📊{pressure}hPa"
-            if self._count_display_width(result + pressure_str) + current_weather_length <= max_length:
-                result += pressure_str
+        # Add each available detail, skipping any that would exceed max_length.
+        # Every piece starts with a space, so its width adds to the running total.
+        details = (
+            (humidity, " {}%RH"),
+            (dew_point, " 💧{}°"),
+            (visibility, " 👁️{}mi"),
+            (precip_prob, " 🌦️{}%"),
+            (wind_gusts, " 💨{}"),
+            (pressure, " 📊{}hPa"),
+        )
+        for value, template in details:
+            if value:
+                detail_str = template.format(value)
+                detail_width = self._count_display_width(detail_str)
+                if current_length + detail_width <= max_length:
+                    result += detail_str
+                    current_length += detail_width
         
         return result
     
     def _count_display_width(self, text: str) -> int:
         """Count display width of text, accounting for emojis which may take 2 display units"""
+        # Emoji are never ASCII, so plain-ASCII text needs no regex scan
+        if text.isascii():
+            return len(text)
         # Count regular characters
         width = len(text)
-        # Emojis typically take 2 display units in terminals/clients
-        # Count emoji characters (basic emoji pattern)
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F1E0-\U0001F1FF"  # flags
-            "\U00002702-\U000027B0"  # dingbats
-            "\U000024C2-\U0001F251"  # enclosed characters
-            "]+",
-            flags=re.UNICODE
-        )
-        emoji_matches = emoji_pattern.findall(text)
+        # Count emoji sequences
+        emoji_matches = _EMOJI_RE.findall(text)
         # Each emoji sequence adds 1 extra width unit (since len() already counts it as 1)
         # So we add 1 for each emoji sequence to account for display width
         width += len(emoji_matches)
@@ -1369,8 +1581,6 @@ class WxCommand(BaseCommand):
     
     async def _send_multiday_forecast(self, message: MeshMessage, forecast_text: str):
         """Send multi-day forecast response, splitting into multiple messages if needed"""
-        import asyncio
-        
         lines = forecast_text.split('\n')
         
         # Remove empty lines
@@ -1457,41 +1667,39 @@ class WxCommand(BaseCommand):
                 return self.ERROR_FETCHING_DATA
             
             alerts = []  # Store structured alert data
-            alertxml = xml.dom.minidom.parseString(alert_data.text)
             
-            for entry in alertxml.getElementsByTagName("entry"):
+            # Stream the Atom feed, handling and clearing each <entry> as soon as it closes
+            for _, entry in ET.iterparse(BytesIO(alert_data.content), events=('end',)):
+                if _xml_local_name(entry.tag) != "entry":
+                    continue
+                title = ""
                 try:
                     # Extract title
-                    title_elem = entry.getElementsByTagName("title")
-                    title = title_elem[0].childNodes[0].nodeValue if title_elem and title_elem[0].childNodes else ""
+                    title_elem = _xml_find(entry, "title")
+                    title = (title_elem.text or "") if title_elem is not None else ""
                     
                     # Extract summary/content for additional context (especially useful for Special Statements)
                     summary = ""
-                    summary_elem = entry.getElementsByTagName("summary")
-                    if summary_elem and summary_elem[0].childNodes:
-                        summary = summary_elem[0].childNodes[0].nodeValue if summary_elem[0].childNodes[0].nodeValue else ""
+                    summary_elem = _xml_find(entry, "summary")
+                    if summary_elem is not None:
+                        summary = summary_elem.text or ""
                     # Also check for content element
                     if not summary:
-                        content_elem = entry.getElementsByTagName("content")
-                        if content_elem and content_elem[0].childNodes:
-                            summary = content_elem[0].childNodes[0].nodeValue if content_elem[0].childNodes[0].nodeValue else ""
+                        content_elem = _xml_find(entry, "content")
+                        if content_elem is not None:
+                            summary = content_elem.text or ""
                     
                     # Extract NWS headline parameter (very useful for Special Statements)
-                    # Try both with and without namespace prefix
+                    # Local names match both "cap:parameter" and unprefixed "parameter"
                     nws_headline = ""
-                    # Try cap:parameter first
-                    params = entry.getElementsByTagName("cap:parameter")
-                    if not params:
-                        # Try without namespace prefix
-                        params = entry.getElementsByTagName("parameter")
-                    
-                    for param in params:
-                        value_name_elem = param.getElementsByTagName("valueName")
-                        value_elem = param.getElementsByTagName("value")
-                        if value_name_elem and value_elem and value_name_elem[0].childNodes and value_elem[0].childNodes:
-                            value_name = value_name_elem[0].childNodes[0].nodeValue if value_name_elem[0].childNodes[0].nodeValue else ""
-                            if value_name == "NWSheadline":
-                                nws_headline = value_elem[0].childNodes[0].nodeValue if value_elem[0].childNodes[0].nodeValue else ""
+                    for param in entry.iter():
+                        if param is entry or _xml_local_name(param.tag) != "parameter":
+                            continue
+                        value_name_elem = _xml_find(param, "valueName")
+                        value_elem = _xml_find(param, "value")
+                        if value_name_elem is not None and value_elem is not None and value_name_elem.text and value_elem.text:
+                            if value_name_elem.text == "NWSheadline":
+                                nws_headline = value_elem.text
                                 break
                     
                     # Extract CAP (Common Alerting Protocol) metadata
@@ -1650,84 +1858,67 @@ class WxCommand(BaseCommand):
                     if office_match:
                         office = office_match.group(1).strip()
                     
-                    # Try to extract CAP elements if available (they may be in different namespaces)
-                    # Look for cap:event, cap:severity, etc. in the XML
-                    # CAP elements might be in namespace like "cap:event" or just "event" in a cap namespace
+                    # Try to extract CAP elements if available (cap:event, cap:severity, etc.)
+                    # ElementTree resolves namespaces, so match on the local tag name
                     def get_node_value(node):
-                        """Extract text value from XML node"""
-                        if not node or not node.childNodes:
-                            return ""
-                        # Get all text nodes
-                        text_parts = []
-                        for child in node.childNodes:
-                            if child.nodeType == child.TEXT_NODE:
-                                text_parts.append(child.nodeValue)
-                            elif hasattr(child, 'nodeValue') and child.nodeValue:
-                                text_parts.append(child.nodeValue)
+                        """Extract the text directly inside an XML element"""
+                        text_parts = [part for part in [node.text] + [child.tail for child in node] if part]
                         return " ".join(text_parts).strip()
                     
-                    # Search for CAP elements by tag name (handles namespaces)
-                    for child in entry.childNodes:
-                        if hasattr(child, 'tagName'):
-                            tag_name = child.tagName
-                            tag_lower = tag_name.lower()
-                            
-                            # Handle both "cap:event" and "event" formats
-                            if ('event' in tag_lower or tag_name.endswith(':event')) and not event:
-                                event_val = get_node_value(child)
-                                if event_val:
-                                    event = event_val
-                            elif 'severity' in tag_lower or tag_name.endswith(':severity'):
-                                severity_val = get_node_value(child)
-                                if severity_val:
-                                    severity = severity_val
-                            elif 'urgency' in tag_lower or tag_name.endswith(':urgency'):
-                                urgency_val = get_node_value(child)
-                                if urgency_val:
-                                    urgency = urgency_val
-                            elif 'certainty' in tag_lower or tag_name.endswith(':certainty'):
-                                certainty_val = get_node_value(child)
-                                if certainty_val:
-                                    certainty = certainty_val
-                            elif 'effective' in tag_lower or tag_name.endswith(':effective'):
-                                effective_val = get_node_value(child)
-                                if effective_val:
-                                    effective = effective_val
-                            elif 'expires' in tag_lower or tag_name.endswith(':expires'):
-                                expires_val = get_node_value(child)
-                                if expires_val:
-                                    expires = expires_val
-                            elif ('areadesc' in tag_lower or 'area' in tag_lower or 
-                                  tag_name.endswith(':areadesc') or tag_name.endswith(':area')):
-                                area_val = get_node_value(child)
-                                if area_val:
-                                    area_desc = area_val
+                    # Search direct children for CAP elements by tag name
+                    for child in entry:
+                        tag_lower = _xml_local_name(child.tag).lower()
+                        
+                        if 'event' in tag_lower and not event:
+                            event_val = get_node_value(child)
+                            if event_val:
+                                event = event_val
+                        elif 'severity' in tag_lower:
+                            severity_val = get_node_value(child)
+                            if severity_val:
+                                severity = severity_val
+                        elif 'urgency' in tag_lower:
+                            urgency_val = get_node_value(child)
+                            if urgency_val:
+                                urgency = urgency_val
+                        elif 'certainty' in tag_lower:
+                            certainty_val = get_node_value(child)
+                            if certainty_val:
+                                certainty = certainty_val
+                        elif 'effective' in tag_lower:
+                            effective_val = get_node_value(child)
+                            if effective_val:
+                                effective = effective_val
+                        elif 'expires' in tag_lower:
+                            expires_val = get_node_value(child)
+                            if expires_val:
+                                expires = expires_val
+                        elif 'areadesc' in tag_lower or 'area' in tag_lower:
+                            area_val = get_node_value(child)
+                            if area_val:
+                                area_desc = area_val
                     
-                    # Also try searching by namespace-aware methods
-                    # Some XML parsers handle namespaces differently
-                    try:
-                        # Try to get elements by local name (ignoring namespace prefix)
-                        for node in entry.getElementsByTagName("*"):
-                            if hasattr(node, 'localName'):
-                                local_name = node.localName.lower()
-                                node_val = get_node_value(node)
-                                if node_val:
-                                    if local_name == 'event' and not event:
-                                        event = node_val
-                                    elif local_name == 'severity' and severity == "Unknown":
-                                        severity = node_val
-                                    elif local_name == 'urgency' and urgency == "Unknown":
-                                        urgency = node_val
-                                    elif local_name == 'certainty' and certainty == "Unknown":
-                                        certainty = node_val
-                                    elif local_name == 'effective' and not effective:
-                                        effective = node_val
-                                    elif local_name == 'expires' and not expires:
-                                        expires = node_val
-                                    elif local_name in ['areadesc', 'area'] and not area_desc:
-                                        area_desc = node_val
-                    except:
-                        pass  # Namespace-aware methods may not be available
+                    # Also check nested elements by local name for anything still missing
+                    for node in entry.iter():
+                        if node is entry:
+                            continue
+                        local_name = _xml_local_name(node.tag).lower()
+                        node_val = get_node_value(node)
+                        if node_val:
+                            if local_name == 'event' and not event:
+                                event = node_val
+                            elif local_name == 'severity' and severity == "Unknown":
+                                severity = node_val
+                            elif local_name == 'urgency' and urgency == "Unknown":
+                                urgency = node_val
+                            elif local_name == 'certainty' and certainty == "Unknown":
+                                certainty = node_val
+                            elif local_name == 'effective' and not effective:
+                                effective = node_val
+                            elif local_name == 'expires' and not expires:
+                                expires = node_val
+                            elif local_name in ['areadesc', 'area'] and not area_desc:
+                                area_desc = node_val
                     
                     # Infer severity from event type if not found
                     if severity == "Unknown":
@@ -1803,6 +1994,9 @@ class WxCommand(BaseCommand):
                             'area_desc': '',
                             'office': ''
                         })
+                
+                # Entry is fully processed; release its subtree
+                entry.clear()
             
             if not alerts:
                 return self.NO_ALERTS
@@ -2344,10 +2538,8 @@ class WxCommand(BaseCommand):
     
     async def _send_full_alert_list(self, message: MeshMessage, lat: float, lon: float):
         """Send full list of alerts with details, splitting across multiple messages if needed"""
-        import asyncio
-        
         # Get full alert data
-        alerts_result = self.get_weather_alerts_noaa(lat, lon, return_full_data=True)
+        alerts_result = await asyncio.to_thread(self.get_weather_alerts_noaa, lat, lon, True)
         if alerts_result == self.ERROR_FETCHING_DATA:
             await self.send_response(message, self.translate('commands.wx.error_fetching'))
             return
@@ -2621,18 +2813,7 @@ class WxCommand(BaseCommand):
             return ""
         
         direction = direction.upper()
-        replacements = {
-            "NORTHWEST": "↖️NW",
-            "NORTHEAST": "↗️NE",
-            "SOUTHWEST": "↙️SW", 
-            "SOUTHEAST": "↘️SE",
-            "NORTH": "⬆️N",
-            "EAST": "➡️E",
-            "SOUTH": "⬇️S",
-            "WEST": "⬅️W"
-        }
-        
-        for full, abbrev in replacements.items():
+        for full, abbrev in _WIND_DIRECTION_ABBREVIATIONS:
             if full in direction:
                 return abbrev
         
@@ -2643,60 +2824,22 @@ class WxCommand(BaseCommand):
         """Extract humidity percentage from forecast text"""
         if not text:
             return ""
-        
-        # Look for patterns like "humidity 45%" or "45% humidity"
-        humidity_patterns = [
-            r'humidity\s+(\d+)%',
-            r'(\d+)%\s+humidity',
-            r'relative humidity\s+(\d+)%',
-            r'(\d+)%\s+relative humidity'
-        ]
-        
-        for pattern in humidity_patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                return match.group(1)
-        
-        return ""
+        return _parse_detailed(text)['humidity']
 
     def extract_precip_chance(self, text: str) -> str:
         """Extract precipitation chance from forecast text"""
         if not text:
             return ""
-        
-        # Look for patterns like "20% chance" or "chance of rain 30%"
-        precip_patterns = [
-            r'(\d+)%\s+chance',
-            r'chance\s+of\s+\w+\s+(\d+)%',
-            r'(\d+)%\s+probability',
-            r'probability\s+of\s+\w+\s+(\d+)%'
-        ]
-        
-        for pattern in precip_patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                return match.group(1)
-        
-        return ""
+        return _parse_detailed(text)['precip_chance']
 
     def extract_high_low(self, text: str) -> str:
         """Extract high/low temperatures from forecast text"""
         if not text:
             return ""
         
-        # Look for more specific patterns to avoid false matches
-        high_low_patterns = [
-            r'high\s+near\s+(\d+).*?low\s+around\s+(\d+)',
-            r'high\s+(\d+).*?low\s+(\d+)',
-            r'(\d+)\s+to\s+(\d+)\s+degrees',  # More specific
-            r'temperature\s+(\d+)\s+to\s+(\d+)',
-            r'high\s+near\s+(\d+).*?temperatures\s+falling\s+to\s+around\s+(\d+)',  # "High near 82, with temperatures falling to around 80"
-            r'low\s+around\s+(\d+)',  # Just low temp
-            r'high\s+near\s+(\d+)'   # Just high temp
-        ]
-        
-        for pattern in high_low_patterns:
-            match = re.search(pattern, text.lower())
+        text = text.lower()
+        for pattern in _HIGH_LOW_PATTERNS:
+            match = pattern.search(text)
             if match:
                 if len(match.groups()) == 2:
                     high, low = match.groups()
@@ -2724,163 +2867,37 @@ class WxCommand(BaseCommand):
         """Extract UV index from forecast text"""
         if not text:
             return ""
-        
-        # Look for UV index patterns
-        uv_patterns = [
-            r'uv\s+index\s+(\d+)',
-            r'uv\s+(\d+)',
-            r'ultraviolet\s+index\s+(\d+)'
-        ]
-        
-        for pattern in uv_patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                uv_val = match.group(1)
-                # Validate UV index (0-11+ is reasonable)
-                try:
-                    if 0 <= int(uv_val) <= 15:
-                        return uv_val
-                except ValueError:
-                    continue
-        
-        return ""
+        return _parse_detailed(text)['uv_index']
 
     def extract_dew_point(self, text: str) -> str:
         """Extract dew point temperature from forecast text"""
         if not text:
             return ""
-        
-        # Look for dew point patterns
-        dew_point_patterns = [
-            r'dew point\s+(\d+)',
-            r'dewpoint\s+(\d+)',
-            r'dew\s+point\s+(\d+)°'
-        ]
-        
-        for pattern in dew_point_patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                dp_val = match.group(1)
-                # Validate dew point (reasonable range -20 to 80°F)
-                try:
-                    if -20 <= int(dp_val) <= 80:
-                        return dp_val
-                except ValueError:
-                    continue
-        
-        return ""
+        return _parse_detailed(text)['dew_point']
 
     def extract_visibility(self, text: str) -> str:
         """Extract visibility from forecast text"""
         if not text:
             return ""
-        
-        # Look for visibility patterns
-        visibility_patterns = [
-            r'visibility\s+(\d+)\s+miles',
-            r'visibility\s+(\d+)\s+mi',
-            r'(\d+)\s+mile\s+visibility',
-            r'(\d+)\s+mi\s+visibility'
-        ]
-        
-        for pattern in visibility_patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                vis_val = match.group(1)
-                # Validate visibility (reasonable range 0-20 miles)
-                try:
-                    if 0 <= int(vis_val) <= 20:
-                        return vis_val
-                except ValueError:
-                    continue
-        
-        return ""
+        return _parse_detailed(text)['visibility']
 
     def extract_precip_probability(self, text: str) -> str:
         """Extract precipitation probability from forecast text"""
         if not text:
             return ""
-        
-        # Look for precipitation probability patterns
-        precip_prob_patterns = [
-            r'(\d+)%\s+chance\s+of\s+(?:rain|precipitation|showers)',
-            r'chance\s+of\s+(?:rain|precipitation|showers)\s+(\d+)%',
-            r'(\d+)%\s+probability\s+of\s+(?:rain|precipitation|showers)',
-            r'probability\s+of\s+(?:rain|precipitation|showers)\s+(\d+)%',
-            r'(\d+)%\s+chance',
-            r'chance\s+(\d+)%'
-        ]
-        
-        for pattern in precip_prob_patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                prob_val = match.group(1)
-                # Validate probability (0-100%)
-                try:
-                    if 0 <= int(prob_val) <= 100:
-                        return prob_val
-                except ValueError:
-                    continue
-        
-        return ""
+        return _parse_detailed(text)['precip_probability']
 
     def extract_wind_gusts(self, text: str) -> str:
         """Extract wind gusts from forecast text"""
         if not text:
             return ""
-        
-        # Look for wind gust patterns
-        gust_patterns = [
-            r'gusts\s+to\s+(\d+)\s+mph',
-            r'gusts\s+up\s+to\s+(\d+)\s+mph',
-            r'wind\s+gusts\s+to\s+(\d+)\s+mph',
-            r'wind\s+gusts\s+up\s+to\s+(\d+)\s+mph',
-            r'gusts\s+(\d+)\s+mph',
-            r'wind\s+gusts\s+(\d+)\s+mph'
-        ]
-        
-        for pattern in gust_patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                gust_val = match.group(1)
-                # Validate wind gust (reasonable range 10-100 mph)
-                try:
-                    if 10 <= int(gust_val) <= 100:
-                        return gust_val
-                except ValueError:
-                    continue
-        
-        return ""
-    
+        return _parse_detailed(text)['wind_gusts']
+
     def extract_pressure(self, text: str) -> str:
         """Extract barometric pressure from forecast text"""
         if not text:
             return ""
-        
-        # Look for pressure patterns (hPa, mb, inches of mercury)
-        pressure_patterns = [
-            r'pressure\s+(\d+)\s*hpa',
-            r'pressure\s+(\d+)\s*mb',
-            r'barometric\s+pressure\s+(\d+)\s*hpa',
-            r'barometric\s+pressure\s+(\d+)\s*mb',
-            r'(\d+)\s*hpa',
-            r'(\d+)\s*mb\s+pressure'
-        ]
-        
-        for pattern in pressure_patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                pressure_val = match.group(1)
-                # Validate pressure (reasonable range 600-1100 hPa/mb)
-                # Normal sea level is ~1013 hPa, but high elevation locations can be lower
-                try:
-                    pressure_int = int(pressure_val)
-                    if 600 <= pressure_int <= 1100:
-                        return pressure_val
-                except ValueError:
-                    continue
-        
-        return ""
+        return _parse_detailed(text)['pressure']
 
     def get_observation_data(self, points_data: dict) -> dict:
         """Get observation station data from NOAA and return as a dict
@@ -2997,30 +3014,10 @@ class WxCommand(BaseCommand):
             return ""
         
         condition_lower = condition.lower()
-        
-        # Weather condition emojis
-        if any(word in condition_lower for word in ['sunny', 'clear']):
-            return "☀️"
-        elif any(word in condition_lower for word in ['heavy rain', 'heavy showers', 'excessive rain']):
-            return "🌧️"  # Cloud with rain - more rain, less sun
-        elif any(word in condition_lower for word in ['cloudy', 'overcast']):
-            return "☁️"
-        elif any(word in condition_lower for word in ['partly cloudy', 'mostly cloudy']):
-            return "⛅"
-        elif any(word in condition_lower for word in ['rain', 'showers']):
-            return "🌦️"
-        elif any(word in condition_lower for word in ['thunderstorm', 'thunderstorms']):
-            return "⛈️"
-        elif any(word in condition_lower for word in ['snow', 'snow showers']):
-            return "❄️"
-        elif any(word in condition_lower for word in ['fog', 'mist', 'haze']):
-            return "🌫️"
-        elif any(word in condition_lower for word in ['smoke']):
-            return "💨"
-        elif any(word in condition_lower for word in ['windy', 'breezy']):
-            return "💨"
-        else:
-            return "🌤️"  # Default weather emoji
+        for word, emoji in _WEATHER_EMOJI_KEYWORDS:
+            if word in condition_lower:
+                return emoji
+        return "🌤️"  # Default weather emoji
 
     def abbreviate_noaa(self, text: str) -> str:
         """Replace long strings with shorter ones for display"""
@@ -991,6 +991,11 @@ use_zulu_time = false
             except (AttributeError, TypeError):
                 print("Web viewer stopped")
         
+        # Close the stats command's long-lived database connections
+        stats_command = self.command_manager.commands.get('stats') if self.command_manager else None
+        if stats_command:
+            stats_command.close()
+        
         if self.meshcore:
             await self.meshcore.disconnect()
         
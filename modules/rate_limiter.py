@@ -6,6 +6,7 @@ Controls how often messages can be sent to prevent spam
 
 import time
 import asyncio
+import threading
 from typing import Optional
 
 
@@ -101,6 +102,9 @@ class NominatimRateLimiter:
         self.seconds = seconds
         self.last_request = 0
         self._lock: Optional[asyncio.Lock] = None
+        # Guards claiming a request slot; sync callers run in worker threads
+        # alongside async callers on the event loop
+        self._slot_lock = threading.Lock()
         self._total_requests = 0
         self._total_throttled = 0
     
@@ -122,34 +126,50 @@ class NominatimRateLimiter:
         elapsed = time.time() - self.last_request
         return max(0, self.seconds - elapsed)
     
+    def _try_claim_slot(self) -> float:
+        """Atomically claim the request slot if it is free
+        
+        Returns 0 if the slot was claimed (last_request is set to now), otherwise
+        the seconds left until it frees up.
+        """
+        with self._slot_lock:
+            wait_time = self.seconds - (time.time() - self.last_request)
+            if wait_time <= 0:
+                self.last_request = time.time()
+                return 0.0
+            self._total_throttled += 1
+            return wait_time
+    
     def record_request(self):
         """Record that we made a Nominatim request"""
         self.last_request = time.time()
         self._total_requests += 1
     
     async def wait_for_request(self):
-        """Wait until we can make a Nominatim request (async)"""
-        while not self.can_request():
-            wait_time = self.time_until_next()
-            if wait_time > 0:
-                await asyncio.sleep(wait_time + 0.05)  # Small buffer
+        """Wait until we can make a Nominatim request and claim it (async)"""
+        while True:
+            wait_time = self._try_claim_slot()
+            if wait_time <= 0:
+                return
+            await asyncio.sleep(wait_time + 0.05)  # Small buffer
     
     async def wait_and_request(self) -> None:
         """Wait until a request can be made, then mark request time (thread-safe)"""
         async with self._get_lock():
-            current_time = time.time()
-            time_since_last = current_time - self.last_request
-            if time_since_last < self.seconds:
-                await asyncio.sleep(self.seconds - time_since_last)
-            self.last_request = time.time()
+            await self.wait_for_request()
             self._total_requests += 1
     
     def wait_for_request_sync(self):
-        """Wait until we can make a Nominatim request (synchronous)"""
-        while not self.can_request():
-            wait_time = self.time_until_next()
-            if wait_time > 0:
-                time.sleep(wait_time + 0.05)  # Small buffer
+        """Wait until we can make a Nominatim request and claim it (synchronous)
+        
+        Safe to call from several worker threads at once: only one caller can
+        claim each slot.
+        """
+        while True:
+            wait_time = self._try_claim_slot()
+            if wait_time <= 0:
+                return
+            time.sleep(wait_time + 0.05)  # Small buffer
     
     def get_stats(self) -> dict:
         """Get rate limiter statistics"""
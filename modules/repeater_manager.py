@@ -132,6 +132,8 @@ class RepeaterManager:
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_complete_currently_tracked ON complete_contact_tracking(is_currently_tracked)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_complete_location ON complete_contact_tracking(latitude, longitude)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_complete_role_tracked ON complete_contact_tracking(role, is_currently_tracked)')
+                # Path hop lookups match contacts by the upper-cased 2-character key prefix
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_complete_key_prefix ON complete_contact_tracking(UPPER(SUBSTR(public_key, 1, 2)))')
                 conn.commit()
             
             self.logger.info("Repeater contacts database initialized successfully")
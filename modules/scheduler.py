@@ -398,6 +398,17 @@ class MessageScheduler:
                         asyncio.run_coroutine_threadsafe(self._process_channel_operations(), self.bot.main_event_loop)
                     self.last_channel_ops_check_time = time.time()
 
+            # Write buffered stats rows every couple of seconds and refresh the
+            # stats DB planner statistics every 15 minutes
+            stats_command = getattr(getattr(self.bot, 'command_manager', None), 'commands', {}).get('stats')
+            if stats_command:
+                if time.time() - getattr(self, 'last_stats_flush_time', 0) >= 2:
+                    stats_command.flush_stats()
+                    self.last_stats_flush_time = time.time()
+                if time.time() - getattr(self, 'last_db_optimize_time', 0) >= 900:
+                    stats_command.optimize_database()
+                    self.last_db_optimize_time = time.time()
+
             schedule.run_pending()
             time.sleep(1)
 
@@ -5,6 +5,7 @@ Shared helper functions used across multiple modules
 """
 
 import re
+import math
 import hashlib
 import socket
 import asyncio
@@ -352,18 +353,15 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         float: Distance in kilometers.
     """
-    import math
-    
-    # Convert latitude and longitude from degrees to radians
+    # Convert latitudes and the longitude difference from degrees to radians
     lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
     lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
+    dlon = math.radians(lon2 - lon1)
     
     # Haversine formula
-    dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
-    a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
+    sin_half_dlat = math.sin((lat2_rad - lat1_rad) / 2)
+    sin_half_dlon = math.sin(dlon / 2)
+    a = sin_half_dlat * sin_half_dlat + math.cos(lat1_rad) * math.cos(lat2_rad) * sin_half_dlon * sin_half_dlon
     c = 2 * math.asin(math.sqrt(a))
     
     # Earth's radius in kilometers
@@ -715,11 +713,19 @@ async def geocode_city(bot: Any, city: str, default_state: str = None,
             return lat, lon, address_info
         
         # Try without state
-        location = await rate_limited_nominatim_geocode(bot, f"{city_clean}, {default_country}", timeout=timeout)
-        if location:
-            bot.db_manager.cache_geocoding(f"{city_clean}, {default_country}", location.latitude, location.longitude)
-            lat, lon = location.latitude, location.longitude
-            
+        country_query = f"{city_clean}, {default_country}"
+        cached_lat, cached_lon = bot.db_manager.get_cached_geocoding(country_query)
+        if cached_lat and cached_lon:
+            lat, lon = cached_lat, cached_lon
+        else:
+            location = await rate_limited_nominatim_geocode(bot, country_query, timeout=timeout)
+            if location:
+                bot.db_manager.cache_geocoding(country_query, location.latitude, location.longitude)
+                lat, lon = location.latitude, location.longitude
+            else:
+                lat, lon = None, None
+        
+        if lat and lon:
             address_info = None
             if include_address_info:
                 # Check cache for reverse geocoding result
@@ -739,11 +745,18 @@ async def geocode_city(bot: Any, city: str, default_state: str = None,
             return lat, lon, address_info
         
         # Try international (no country suffix)
-        location = await rate_limited_nominatim_geocode(bot, city_clean, timeout=timeout)
-        if location:
-            bot.db_manager.cache_geocoding(city_clean, location.latitude, location.longitude)
-            lat, lon = location.latitude, location.longitude
-            
+        cached_lat, cached_lon = bot.db_manager.get_cached_geocoding(city_clean)
+        if cached_lat and cached_lon:
+            lat, lon = cached_lat, cached_lon
+        else:
+            location = await rate_limited_nominatim_geocode(bot, city_clean, timeout=timeout)
+            if location:
+                bot.db_manager.cache_geocoding(city_clean, location.latitude, location.longitude)
+                lat, lon = location.latitude, location.longitude
+            else:
+                lat, lon = None, None
+        
+        if lat and lon:
             address_info = None
             if include_address_info:
                 # Check cache for reverse geocoding result
@@ -907,11 +920,19 @@ def geocode_city_sync(bot: Any, city: str, default_state: str = None,
             return lat, lon, address_info
         
         # Try without state
-        location = rate_limited_nominatim_geocode_sync(bot, f"{city_clean}, {default_country}", timeout=timeout)
-        if location:
-            bot.db_manager.cache_geocoding(f"{city_clean}, {default_country}", location.latitude, location.longitude)
-            lat, lon = location.latitude, location.longitude
-            
+        country_query = f"{city_clean}, {default_country}"
+        cached_lat, cached_lon = bot.db_manager.get_cached_geocoding(country_query)
+        if cached_lat and cached_lon:
+            lat, lon = cached_lat, cached_lon
+        else:
+            location = rate_limited_nominatim_geocode_sync(bot, country_query, timeout=timeout)
+            if location:
+                bot.db_manager.cache_geocoding(country_query, location.latitude, location.longitude)
+                lat, lon = location.latitude, location.longitude
+            else:
+                lat, lon = None, None
+        
+        if lat and lon:
             address_info = None
             if include_address_info:
                 # Check cache for reverse geocoding result
@@ -931,11 +952,18 @@ def geocode_city_sync(bot: Any, city: str, default_state: str = None,
             return lat, lon, address_info
         
         # Try international (no country suffix)
-        location = rate_limited_nominatim_geocode_sync(bot, city_clean, timeout=timeout)
-        if location:
-            bot.db_manager.cache_geocoding(city_clean, location.latitude, location.longitude)
-            lat, lon = location.latitude, location.longitude
-            
+        cached_lat, cached_lon = bot.db_manager.get_cached_geocoding(city_clean)
+        if cached_lat and cached_lon:
+            lat, lon = cached_lat, cached_lon
+        else:
+            location = rate_limited_nominatim_geocode_sync(bot, city_clean, timeout=timeout)
+            if location:
+                bot.db_manager.cache_geocoding(city_clean, location.latitude, location.longitude)
+                lat, lon = location.latitude, location.longitude
+            else:
+                lat, lon = None, None
+        
+        if lat and lon:
             address_info = None
             if include_address_info:
                 # Check cache for reverse geocoding result
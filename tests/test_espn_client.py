@@ -0,0 +1,99 @@
+"""Tests for ESPNClient.fetch_team_schedule using canned ESPN responses"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from modules.clients.espn_client import ESPNClient
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    """Serves a canned payload per URL suffix and records requested URLs"""
+
+    def __init__(self, payloads):
+        self.payloads = payloads
+        self.requested = []
+
+    def get(self, url):
+        self.requested.append(url)
+        for suffix, payload in self.payloads.items():
+            if url.endswith(suffix):
+                return _FakeResponse(payload)
+        raise AssertionError(f"unexpected URL {url}")
+
+
+def _event(event_id, start, home_id='1', away_id='2'):
+    return {
+        'id': event_id,
+        'date': start.strftime('%Y-%m-%dT%H:%MZ'),
+        'competitions': [{
+            'status': {'type': {'name': 'STATUS_SCHEDULED'}},
+            'competitors': [
+                {'homeAway': 'home', 'team': {'id': home_id, 'abbreviation': 'HOM'}},
+                {'homeAway': 'away', 'team': {'id': away_id, 'abbreviation': 'AWY'}},
+            ],
+        }],
+    }
+
+
+def _fetch(session, sport, league, team_id):
+    client = ESPNClient()
+
+    async def get_session():
+        return session
+
+    client._get_session = get_session
+    return asyncio.run(client.fetch_team_schedule(sport, league, team_id))
+
+
+def test_fetch_team_schedule_parses_events():
+    start = datetime.now(timezone.utc) + timedelta(days=2)
+    session = _FakeSession({'/teams/1/schedule': {'events': [_event('401', start)]}})
+
+    games = _fetch(session, 'football', 'nfl', '1')
+
+    assert [game.id for game in games] == ['401']
+    assert games[0].event_timestamp == pytest.approx(start.replace(second=0, microsecond=0).timestamp())
+
+
+def test_fetch_team_schedule_soccer_with_upcoming_game_skips_scoreboard():
+    start = datetime.now(timezone.utc) + timedelta(days=2)
+    session = _FakeSession({'/teams/1/schedule': {'events': [_event('501', start)]}})
+
+    games = _fetch(session, 'soccer', 'eng.1', '1')
+
+    assert [game.id for game in games] == ['501']
+    assert len(session.requested) == 1
+
+
+def test_fetch_team_schedule_soccer_falls_back_to_scoreboard():
+    past = datetime.now(timezone.utc) - timedelta(days=3)
+    upcoming = datetime.now(timezone.utc) + timedelta(days=1)
+    session = _FakeSession({
+        '/teams/1/schedule': {'events': [_event('601', past)]},
+        '/scoreboard': {'events': [_event('602', upcoming), _event('603', upcoming, '8', '9')]},
+    })
+
+    games = _fetch(session, 'soccer', 'eng.1', '1')
+
+    assert [game.id for game in games] == ['601', '602']